@@ -0,0 +1,186 @@
+import hashlib
+import os
+import zlib
+from collections import Counter
+from typing import List, Tuple
+
+from CityDataImport.CityDataImporter import CityDataImporter
+
+
+class CityDataFingerprint:
+    """
+    Class with the responsibility to describe one imported version of a TSV file.
+
+    Param:
+    ------
+    size: int: size of the file in bytes
+
+    mtimeNs: int: time of the last modification of the file in nanoseconds
+
+    blockHashes: List[bytes]: hash of every block of lines, in the order of the file
+
+    blockKeys: List[List[Tuple[str, str]]]: (name, country) of every record of every block, needed to find the removed
+    records once the file has been overwritten
+    """
+
+    def __init__(self, size: int, mtime_ns: int, block_hashes: List[bytes], block_keys: List[List[Tuple[str, str]]]):
+        self.size = size
+        self.mtimeNs = mtime_ns
+        self.blockHashes = block_hashes
+        self.blockKeys = block_keys
+
+
+class CityDataChange:
+    """
+    Class with the responsibility to hold the difference between two versions of a TSV file.
+
+    Param:
+    ------
+    addedRecords: records whose (name, country) is new, layout [Name, Country, Population]
+
+    removedKeys: (name, country) of the records which are no longer in the file
+
+    changedRecords: records of changed blocks whose (name, country) already existed, their population may have changed
+
+    fingerprint: CityDataFingerprint: fingerprint of the new version
+    """
+
+    def __init__(self, added_records: List[List[str]], removed_keys: List[Tuple[str, str]],
+                 changed_records: List[List[str]], fingerprint: CityDataFingerprint):
+        self.addedRecords = added_records
+        self.removedKeys = removed_keys
+        self.changedRecords = changed_records
+        self.fingerprint = fingerprint
+
+    def is_empty(self) -> bool:
+        return not (self.addedRecords or self.removedKeys or self.changedRecords)
+
+
+class CityDataChangeDetector:
+    """
+    Class with the responsibility to detect the changed records of a TSV file since its last import, so only these
+    records have to be applied to the heap instead of importing the whole file again.
+
+    -Size and modification time: if both are unchanged the file is not read at all
+
+    -Block hashes: the lines are grouped into blocks and every block is hashed. The block boundaries depend on the
+     content (a line ends a block if its CRC32 is divisible by blockLines), so an inserted or removed line only changes
+     its own block, the boundaries of all following blocks stay the same
+
+    -Only the records of the blocks which are not in the old version are decoded, the records of the blocks which are
+     no longer in the new version are known by their keys
+    """
+
+    blockLines = 64  # average amount of lines per block, every change decodes about this amount of records
+
+    def __init__(self, importer: CityDataImporter = None, block_lines: int = None):
+        self.importer = importer if importer is not None else CityDataImporter()
+        if block_lines is not None:
+            self.blockLines = block_lines
+
+    def fingerprint(self, path_to_file=None) -> CityDataFingerprint:
+        """
+        Read the whole file once and create its fingerprint.
+        """
+        fingerprint, _ = self._scan(path_to_file, None)
+        return fingerprint
+
+    def fingerprint_with_records(self, path_to_file=None):
+        """
+        Read the whole file once, create its fingerprint and return it together with all records of the file, so the
+        heap can be built from exactly the version the fingerprint describes.
+        """
+        return self._scan(path_to_file, None)
+
+    def is_unchanged(self, fingerprint: CityDataFingerprint, path_to_file=None) -> bool:
+        """
+        Cheap check via size and modification time, the file is not read.
+        """
+        file_status = os.stat(self._path(path_to_file))
+        return file_status.st_size == fingerprint.size and file_status.st_mtime_ns == fingerprint.mtimeNs
+
+    def diff(self, fingerprint: CityDataFingerprint, path_to_file=None) -> CityDataChange:
+        """
+        Compare the file with the version described by the fingerprint.
+        """
+        if self.is_unchanged(fingerprint, path_to_file):
+            return CityDataChange([], [], [], fingerprint)
+
+        known_block_keys = dict(zip(fingerprint.blockHashes, fingerprint.blockKeys))
+        new_fingerprint, new_block_records = self._scan(path_to_file, known_block_keys)
+
+        # the keys of the old blocks which are not in the new version are the candidates for removal
+        unmatched_block_hashes = Counter(fingerprint.blockHashes) - Counter(new_fingerprint.blockHashes)
+        candidate_removed_keys = set()
+        for block_hash, block_keys in zip(fingerprint.blockHashes, fingerprint.blockKeys):
+            if unmatched_block_hashes[block_hash] > 0:
+                unmatched_block_hashes[block_hash] -= 1
+                candidate_removed_keys.update(block_keys)
+
+        added_records = []
+        changed_records = []
+        for record in new_block_records:
+            if len(record) < 3:
+                # malformed record, it is reported when it is converted into a City
+                added_records.append(record)
+                continue
+            key = (record[0], record[1])
+            if key in candidate_removed_keys:
+                candidate_removed_keys.discard(key)
+                changed_records.append(record)
+            else:
+                added_records.append(record)
+        return CityDataChange(added_records, list(candidate_removed_keys), changed_records, new_fingerprint)
+
+    # ------Private Methods
+
+    def _path(self, path_to_file):
+        return path_to_file if path_to_file is not None else self.importer.get_path_to_file()
+
+    def _scan(self, path_to_file, known_block_keys):
+        """
+        Hash the blocks of the file. The records of every block whose hash is not in known_block_keys (Key = block hash,
+        Value = keys of the block) are decoded and returned, None = no block is known.
+
+        The file is read with one call and split with bytes.split, the CRC32 of the lines is computed via map and every
+        block is joined and hashed with one call. Only the check of the checksums for the block boundaries runs once
+        per line in Python.
+        """
+        path_to_file = self._path(path_to_file)
+        file_status = os.stat(path_to_file)
+        with open(path_to_file, "rb") as f:
+            data = f.read()
+        if b'\r' in data:
+            data = data.replace(b'\r\n', b'\n')
+        lines = list(filter(None, data.split(b'\n')))  # the non-empty lines, like CityDataImporter.iter_lines
+        del data
+
+        lines_per_block = self.blockLines
+        block_ends = [index + 1 for index, checksum in enumerate(map(zlib.crc32, lines))
+                      if checksum % lines_per_block == 0]
+        if not block_ends or block_ends[-1] != len(lines):
+            block_ends.append(len(lines))
+
+        block_hashes = []
+        block_keys = []
+        new_block_records = []
+        block_start = 0
+        for block_end in block_ends:
+            if block_end > block_start:
+                self._close_block(lines[block_start:block_end], known_block_keys, block_hashes, block_keys,
+                                  new_block_records)
+            block_start = block_end
+
+        return CityDataFingerprint(file_status.st_size, file_status.st_mtime_ns, block_hashes,
+                                   block_keys), new_block_records
+
+    def _close_block(self, block_lines, known_block_keys, block_hashes, block_keys, new_block_records):
+        block_hash = hashlib.blake2b(b'\n'.join(block_lines), digest_size=16).digest()
+        block_hashes.append(block_hash)
+        if known_block_keys is not None and block_hash in known_block_keys:
+            # unchanged block: same content, same keys, nothing is decoded
+            block_keys.append(known_block_keys[block_hash])
+            return
+        records = [[field.decode("utf-8") for field in line.split(b'\t')] for line in block_lines]
+        block_keys.append([(record[0], record[1]) for record in records if len(record) > 1])
+        new_block_records.extend(records)
@@ -1,4 +1,6 @@
+import mmap
 import os as os
+from array import array
 
 
 class CityDataImporter:
@@ -7,30 +9,45 @@ class CityDataImporter:
 
     Simple Way to Read TSV Files in Python using split even more easy would be to use panda
     but for the purpose of this lecture we try to minimize the amount of external imports.
+
+    Besides the simple import of the whole file there are streaming imports for big files: the file is memory-mapped
+    and the records are yielded one by one (or in batches of a fixed size), so only the current line is held in memory.
     """
 
+    batchSize = 10000  # default amount of records per batch for the streaming import
+
+    def __init__(self, path_to_file=None):
+        """
+        Param:
+        ------
+        path_to_file: path of the TSV file to be read, None = the cities.tsv file inside this module
+        """
+        self.pathToFile = path_to_file
+
     def get_path_to_file(self):
         """
-        Path to the file to be read based on the local location of this project.
+        Path to the file to be read: the path given to the importer, by default the cities.tsv file of this module.
         """
-        # Project Location
-        project_dir = os.path.dirname(os.path.realpath('__file__'))
+        if self.pathToFile is not None:
+            return self.pathToFile
         # Modul Location
-        module_name = "CityDataImport"
+        module_dir = os.path.dirname(os.path.realpath(__file__))
         # Name of File
         file_name = "cities.tsv"
-        path_to_file = os.path.join(project_dir, module_name, file_name)
+        path_to_file = os.path.join(module_dir, file_name)
 
         return path_to_file
 
-    def import_from_file(self):
+    def import_from_file(self, path_to_file=None):
         """
         Importing the data from the TSV file based on the passed location in the file system
         """
+        if path_to_file is None:
+            path_to_file = self.get_path_to_file()
         data_list = []
 
         # open .tsv file
-        with open(self.get_path_to_file(), encoding="utf-8") as f:
+        with open(path_to_file, encoding="utf-8") as f:
             # Read data line by line
             for line in f:
                 # split data by tab and store it in list
@@ -42,3 +59,55 @@ class CityDataImporter:
                 data_list.append(cleaned_line)
 
         return data_list
+
+    def iter_records(self, path_to_file=None):
+        """
+        Streaming import: yield the records of the TSV file one by one, straight from a memory-map of the file.
+
+        Every record has the same layout as a row of import_from_file: [Name, Country, Population]
+        """
+        for line in self.iter_lines(path_to_file):
+            yield [field.decode("utf-8") for field in line.split(b'\t')]
+
+    def iter_batches(self, batch_size=None, path_to_file=None):
+        """
+        Streaming import: yield the records of the TSV file in Lists of at most batch_size records.
+        """
+        if batch_size is None:
+            batch_size = self.batchSize
+
+        batch = []
+        for record in self.iter_records(path_to_file):
+            batch.append(record)
+            if len(batch) == batch_size:
+                yield batch
+                batch = []
+        if batch:
+            yield batch
+
+    def import_population_column(self, path_to_file=None) -> array:
+        """
+        Bulk import: parse only the population column (the last column) into an integer array.
+
+        No strings for name and country are created, the population bytes are converted directly.
+        """
+        populations = array('q')
+        for line in self.iter_lines(path_to_file):
+            populations.append(int(line[line.rfind(b'\t') + 1:]))
+        return populations
+
+    def iter_lines(self, path_to_file=None):
+        """
+        Yield the non-empty lines of the TSV file as bytes without the line break, read from a memory-map.
+        """
+        if path_to_file is None:
+            path_to_file = self.get_path_to_file()
+
+        with open(path_to_file, "rb") as f:
+            if os.fstat(f.fileno()).st_size == 0:  # an empty file can not be memory-mapped
+                return
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped_file:
+                for line in iter(mapped_file.readline, b""):
+                    line = line.rstrip(b'\r\n')
+                    if line:
+                        yield line
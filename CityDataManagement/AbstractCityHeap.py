@@ -1,3 +1,4 @@
+import heapq
 from abc import ABC, abstractmethod
 from typing import List
 from CityDataManagement.City import City
@@ -28,7 +29,7 @@ class AbstractCityHeap(ABC):
     The root is located at index 0, so it`s children must be on Index 1 and 2 and so on...
     """
 
-    heapStorage: List[City] = [0]  # empty List of City Objects
+    heapStorage: List[City]  # List of City Objects, every heap gets its own List in __init__
     maximumHeapCapacity = 0
     currentHeapLastIndex = 0  # current last Index of the Heap based on the inserted City Objects, this is also the current Size of the Heap
     rawCityData: List[City]
@@ -39,7 +40,8 @@ class AbstractCityHeap(ABC):
     def __init__(self, raw_city_data: List[City], recursive: bool, floyd: bool):
         self.rawCityData = raw_city_data
         self.maximumHeapCapacity = len(self.rawCityData)  # set Maximum Heap Capacity to the amount of City Objects
-        self.heapStorage = self.heapStorage * self.maximumHeapCapacity
+        self.heapStorage = []  # every heap gets its own storage, the class level list would be shared
+        self.currentHeapLastIndex = 0
 
         self.recursive = recursive
         self.floyd = floyd
@@ -99,12 +101,9 @@ class AbstractCityHeap(ABC):
     # ------Shared Methods Block (Methods identical for both a min and a max heap)------
 
     def insert_raw_city_data_into_heap(self):
-        # Add the new city to the end of the heap's list of cities
-        self.insert(City)
-        # Heapify the heap starting at the newly inserted city
-        self.heapify_up_recursive(self.currentHeapLastIndex - 1)
-
         if self.floyd:
+            # the heap is built in place: the rawCityData List itself becomes the heap storage
+            self.heapStorage = self.rawCityData
             self.build_heap_via_floyd()
         else:
             for i in self.rawCityData:
@@ -113,21 +112,54 @@ class AbstractCityHeap(ABC):
     def insert(self, city):
         # Add the new city to the end of the heap
         self.heapStorage.append(city)
+        self.currentHeapLastIndex += 1
 
-        # Call the heapify_up method to restore the heap property
-        self.heapify_up_iterative()
-
+        # Restore the heap property upwards
         if self.recursive:
             self.heapify_up_recursive(self.currentHeapLastIndex - 1)
         else:
             self.heapify_up_iterative()
 
+    def insert_many(self, cities):
+        """
+        Insert several City Objects at once.
+
+        A small batch is inserted City by City (sift-up, O(k log n)). If the batch is big compared with the heap, the
+        cities are appended unsorted and the whole heap is rebuilt via Floyds Algorithm (O(n + k)).
+        """
+        new_cities = list(cities)
+        if self.should_rebuild_via_floyd(len(new_cities)):
+            self.heapStorage.extend(new_cities)
+            self.build_heap_via_floyd()
+        else:
+            for city in new_cities:
+                self.insert(city)
+
+    def merge(self, other_heap: "AbstractCityHeap"):
+        """
+        Merge all cities of another heap into this heap. The other heap is not changed.
+        """
+        self.insert_many(other_heap.get_heap_data()[:other_heap.currentHeapLastIndex])
+
+    def should_rebuild_via_floyd(self, amount_of_new_cities) -> bool:
+        """
+        Decide whether a batch of new cities is cheaper to add via a full rebuild than via repeated sift-up.
+
+        Repeated sift-up costs about k * log2(n + k) comparisons in the worst case, a Floyd rebuild about 2 * (n + k).
+        """
+        new_heap_size = self.currentHeapLastIndex + amount_of_new_cities
+        return amount_of_new_cities * new_heap_size.bit_length() > 2 * new_heap_size
+
     def build_heap_via_floyd(self):
         """
-        Build a Heap via Floyds Heap Construction Algorithm from an unsorted List Of Cities.
+        Build a Heap via Floyds Heap Construction Algorithm from the unsorted heap storage.
+
+        The heap is built in place, no City is inserted one by one. Starting at the last parent, every subtree is
+        sifted down, which costs O(n) in total.
         """
-        amount_of_cities = len(self.rawCityData)
-        for i in range(amount_of_cities // 2, -1, -1):
+        amount_of_cities = len(self.heapStorage)
+        self.currentHeapLastIndex = amount_of_cities
+        for i in range(amount_of_cities // 2 - 1, -1, -1):
             self.heapify_floyd(i, amount_of_cities)
 
     def get_root_city(self):
@@ -135,6 +167,49 @@ class AbstractCityHeap(ABC):
             return None
         return self.heapStorage[0]
 
+    def iter_descending(self):
+        """
+        Lazy drain of the heap: yield the City Objects in descending order of population, one removal per City.
+
+        Only the cities that are actually requested are removed, the rest stays in the heap.
+        """
+        while self.currentHeapLastIndex > 0:
+            yield self.remove()
+
+    def sorted_cities(self) -> List[City]:
+        """
+        Drain the heap and return all City Objects in descending order of population. The heap is empty afterwards.
+        """
+        return list(self.iter_descending())
+
+    def get_city(self, index) -> City:
+        """
+        Return the City Object at the given heap position.
+        """
+        return self.heapStorage[index]
+
+    def top_k(self, k) -> List[City]:
+        """
+        Return the k City Objects with the greatest keys (for a Max-Heap: the highest populations) in descending order,
+        the heap is not changed.
+
+        A frontier (an auxiliary heap of candidate positions) starts with the root. The best candidate is taken and
+        its children become new candidates, so only about 2k nodes are visited: O(k log k) instead of O(n log n).
+        """
+        top_cities: List[City] = []
+        heap_size = self.currentHeapLastIndex
+        if k <= 0 or heap_size == 0:
+            return top_cities
+
+        frontier = [(DescendingKey(self.get_city_key(0)), 0)]  # heapq is a min heap, the keys are reversed
+        while frontier and len(top_cities) < k:
+            _, index = heapq.heappop(frontier)
+            top_cities.append(self.get_city(index))
+            for child_index in self.get_child_indices(index):
+                if child_index < heap_size:
+                    heapq.heappush(frontier, (DescendingKey(self.get_city_key(child_index)), child_index))
+        return top_cities
+
     def get_left_child_index(self, index):
         """
         Return the index of the left child.
@@ -147,13 +222,19 @@ class AbstractCityHeap(ABC):
         """
         return 2 * index + 2
 
-    def get_parent_index(self):
+    def get_child_indices(self, index):
+        """
+        Return the indices of all possible children.
+        """
+        return 2 * index + 1, 2 * index + 2
+
+    def get_parent_index(self, index):
         """
         Return the index of the parent node.
         """
-        if self == 0:  # root node has no parent, return None
+        if index == 0:  # root node has no parent, return None
             return None
-        return (self - 1) // 2
+        return (index - 1) // 2
 
     def has_parent(self, index) -> bool:
         # If the index is 0, the element is the root and has no parent
@@ -177,6 +258,12 @@ class AbstractCityHeap(ABC):
         # If the right child index is within the bounds of the heap, the element has a right child
         return right_child_index < len(self.heapStorage)
 
+    def get_city_key(self, index):
+        """
+        Return the key the heap is ordered by at the given index, by default the population.
+        """
+        return self.get_city_population(index)
+
     def get_city_population(self, index):
         # Get the city object at the given index
         city = self.heapStorage[index]
@@ -232,3 +319,17 @@ class AbstractCityHeap(ABC):
         List[City]:
         """
         return self.heapStorage
+
+
+class DescendingKey:
+    """
+    Wrapper of a key with reversed order, so a min heap (heapq) returns the greatest key first. Works for any
+    comparable key, e.g. tuples, where a negation is not possible.
+    """
+    __slots__ = ("key",)
+
+    def __init__(self, key):
+        self.key = key
+
+    def __lt__(self, other):
+        return other.key < self.key
@@ -0,0 +1,157 @@
+import asyncio
+from typing import List
+
+from CityDataManagement.City import City
+from CityDataManagement.CityDataManager import CityDataManager
+
+
+class AsyncCityHeapService:
+    """
+    Class with the responsibility to offer the Max-City-Heap of a CityDataManager to asyncio request handlers.
+
+    -Mutations (insert, pop_max) are queued. All mutations queued within one event loop tick are applied together:
+     consecutive inserts become one bulk insert (insert_many), consecutive removals are applied in one pass.
+     The order of the mutations is kept.
+
+    -A bulk insert big enough for a rebuild via Floyds Algorithm (see AbstractCityHeap.should_rebuild_via_floyd) runs
+     in a worker thread, so the event loop is not blocked. Readers (peek, top_k) wait until the rebuild is finished.
+
+    -Readers never see a half-applied batch: all other mutations are applied synchronously between two ticks.
+
+    Hint:
+    -----
+    The CityDataManager must already hold a Max-City-Heap and must only be used via this service afterwards.
+    Its messages are switched off (verbose = False).
+    """
+
+    def __init__(self, city_data_manager: CityDataManager):
+        self.cityDataManager = city_data_manager
+        self.cityDataManager.verbose = False
+        self.pendingMutations = []  # List of (kind, argument, future), kind = "insert" or "pop"
+        self.flushTask = None
+        self.heapReady = None  # cleared while a bulk rebuild runs in a worker thread, see _get_heap_ready
+        self.heapReadyLoop = None
+        self.appliedBatches = 0
+
+    # ------Mutations
+
+    async def insert(self, name, country, population):
+        """
+        Insert a new City, returns when the City is in the heap.
+        """
+        await self._queue_mutation("insert", [name, country, population])
+
+    async def pop_max(self) -> City:
+        """
+        Remove the City with the highest population and return it (None if the heap is empty).
+        """
+        return await self._queue_mutation("pop", None)
+
+    # ------Readers
+
+    async def peek(self) -> City:
+        """
+        Return the City with the highest population without removing it.
+        """
+        await self._get_heap_ready().wait()
+        return self.cityDataManager.get_highest_population_city()
+
+    async def top_k(self, k) -> List[City]:
+        """
+        Return the k Cities with the highest population in descending order.
+        """
+        await self._get_heap_ready().wait()
+        return self.cityDataManager.top_k(k)
+
+    async def flush(self):
+        """
+        Wait until all queued mutations have been applied.
+        """
+        while self.flushTask is not None:
+            await self.flushTask
+
+    # ------Batching
+
+    def _get_heap_ready(self) -> asyncio.Event:
+        """
+        Return the Event of the running event loop, it is created on first use inside the loop: on Python < 3.10 an
+        Event created outside a coroutine is bound to the default loop instead of the loop of asyncio.run.
+        """
+        loop = asyncio.get_running_loop()
+        if self.heapReadyLoop is not loop:
+            self.heapReady = asyncio.Event()
+            self.heapReady.set()
+            self.heapReadyLoop = loop
+        return self.heapReady
+
+    def _queue_mutation(self, kind, argument) -> asyncio.Future:
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self.pendingMutations.append((kind, argument, future))
+        if self.flushTask is None:
+            # the task starts in the next tick, every mutation queued until then is part of the same batch
+            self.flushTask = loop.create_task(self._apply_pending_mutations())
+        return future
+
+    async def _apply_pending_mutations(self):
+        try:
+            while self.pendingMutations:
+                mutations, self.pendingMutations = self.pendingMutations, []
+                self.appliedBatches += 1
+                for kind, run in self._group_consecutive_mutations(mutations):
+                    if kind == "insert":
+                        await self._apply_inserts(run)
+                    else:
+                        self._apply_pops(run)
+        finally:
+            self.flushTask = None
+
+    def _group_consecutive_mutations(self, mutations):
+        """
+        Group the mutations into runs of the same kind, the order of the runs is kept.
+        """
+        runs = []
+        for kind, argument, future in mutations:
+            if runs and runs[-1][0] == kind:
+                runs[-1][1].append((argument, future))
+            else:
+                runs.append((kind, [(argument, future)]))
+        return runs
+
+    async def _apply_inserts(self, run):
+        city_data = [argument for argument, _ in run]
+        try:
+            if self.cityDataManager.cityMaxHeap.should_rebuild_via_floyd(len(city_data)):
+                heap_ready = self._get_heap_ready()
+                heap_ready.clear()
+                try:
+                    await asyncio.get_running_loop().run_in_executor(
+                        None, self.cityDataManager.insert_new_cities_into_max_city_heap, city_data)
+                finally:
+                    heap_ready.set()
+            else:
+                self.cityDataManager.insert_new_cities_into_max_city_heap(city_data)
+        except Exception as error:
+            for _, future in run:
+                if not future.done():
+                    future.set_exception(error)
+            return
+
+        for _, future in run:
+            if not future.done():
+                future.set_result(None)
+
+    def _apply_pops(self, run):
+        remove_city = self.cityDataManager.remove_city_with_highest_population
+        for position, (_, future) in enumerate(run):
+            if future.cancelled():
+                # the caller does not wait any more, the City would be lost
+                continue
+            try:
+                removed_city = remove_city()
+            except Exception as error:
+                for _, pending_future in run[position:]:
+                    if not pending_future.done():
+                        pending_future.set_exception(error)
+                return
+            future.set_result(removed_city)
@@ -1,19 +1,23 @@
+import sys
+
+
 class City:
     """
     Class with the responsibility to represent a city.
 
+    The attributes are stored in slots instead of a per-instance dictionary and the country is interned, so all
+    cities of a country share one string. The population is converted to int once, it is the key of all comparisons.
+
     Param:
     name: Name of the City
     country: Country of the City
     population: Population of the City
     """
-    name = "No data available"
-    country = "No data available"
-    population = "No data available"
+    __slots__ = ("name", "country", "population")
 
     def __init__(self, name, country, population):
         self.name = name
-        self.country = country
+        self.country = sys.intern(country)
         self.population = int(population)
 
     def __str__(self):
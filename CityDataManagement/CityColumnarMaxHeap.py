@@ -0,0 +1,346 @@
+from array import array
+from typing import List
+from CityDataManagement.City import City
+from CityDataManagement.AbstractCityHeap import AbstractCityHeap
+
+
+class CityColumnarMaxHeap(AbstractCityHeap):
+    """
+    Class with the responsibility to create a Max-Heap-structure based on unstructured data, stored column by column.
+    (Every Parents Key must be greater than its children Key)
+
+    Instead of a List of City Objects the heap is kept in two parallel typed arrays:
+
+    -heapPopulations: array('q'): the population (the Key) of every node in heap order
+
+    -heapCityIndices: array('q'): for every node the index of its City Object inside the cityTable
+
+    All sift operations only compare and move integers, the City Objects are only touched again when a City is
+    returned to the caller.
+
+    The slot of a removed City in the cityTable is released (no reference to the City is kept) and reused by the next
+    insertion. If more than half of a List table is free, it is compacted.
+    """
+
+    cityTable: List[City]
+    heapPopulations: array
+    heapCityIndices: array
+    freeCityIndices: List[int]  # released slots of the cityTable
+    minimumCompactionSize = 64  # smaller tables are never compacted
+
+    def __init__(self, raw_city_data: List[City], recursive: bool, floyd: bool):
+        """
+        Creation of a columnar Max-City-Heap.
+
+        :param raw_city_data:    A unsorted List of Cities
+        :param recursive:    Should the heapify be recursiv? False = use the iterative approach; True = Recursiv approach
+        :param floyd:       Should Floyds algorithm be used for insertion? True = instead of the iterative or recursiv approach Floyds algorithm will be used instead.
+                            For removal the approach specified in :param recursiv will be used.
+        """
+        super().__init__(raw_city_data, recursive, floyd)
+
+    @classmethod
+    def from_columns(cls, city_table, populations: array, recursive: bool):
+        """
+        Create a heap from a city table and its population column (City i of the table has population i) via Floyds
+        Algorithm. Only the integer columns are touched, no City Object is created.
+
+        :param city_table:    List-like table of the cities, supports len, [], item assignment and append
+        :param populations:    array('q') of the populations, it becomes the population column of the heap
+        :param recursive:    Should the heapify of later insertions and removals be recursiv?
+        """
+        heap = cls.__new__(cls)
+        heap.rawCityData = []
+        heap.heapStorage = []
+        heap.cityTable = city_table
+        heap.freeCityIndices = []
+        heap.heapPopulations = populations
+        heap.heapCityIndices = array('q', range(len(populations)))
+        heap.maximumHeapCapacity = len(populations)
+        heap.currentHeapLastIndex = len(populations)
+        heap.recursive = recursive
+        heap.floyd = True
+        heap.build_heap_via_floyd()
+        return heap
+
+    def insert_raw_city_data_into_heap(self):
+        """
+        Fill the columns with the raw City Data and establish the heap conditions.
+        """
+        self.cityTable = list(self.rawCityData)
+        self.freeCityIndices = []
+
+        if self.floyd:
+            # every City keeps its position in the city table, only the columns get reordered
+            self.heapPopulations = array('q', [city.population for city in self.cityTable])
+            self.heapCityIndices = array('q', range(len(self.cityTable)))
+            self.currentHeapLastIndex = len(self.cityTable)
+            self.build_heap_via_floyd()
+        else:
+            self.heapPopulations = array('q')
+            self.heapCityIndices = array('q')
+            self.currentHeapLastIndex = 0
+            for city_index in range(len(self.cityTable)):
+                self._append_node(self.cityTable[city_index].population, city_index)
+
+    def insert(self, city):
+        """
+        Insert a new City into the heap. The City is added to the city table, only its population and index enter
+        the columns.
+        """
+        self._append_node(city.population, self._store_city(city))
+
+    def insert_many(self, cities):
+        """
+        Insert several cities at once, either City by City or by appending them to the columns and rebuilding the
+        heap via Floyds Algorithm (see should_rebuild_via_floyd).
+        """
+        new_cities = list(cities)
+        if not self.should_rebuild_via_floyd(len(new_cities)):
+            for city in new_cities:
+                self.insert(city)
+            return
+
+        for city in new_cities:
+            self.heapPopulations.append(city.population)
+            self.heapCityIndices.append(self._store_city(city))
+        self.currentHeapLastIndex += len(new_cities)
+        self.build_heap_via_floyd()
+
+    def _store_city(self, city) -> int:
+        """
+        Put a City into a released slot of the city table (or append it) and return the index of the slot.
+        """
+        if self.freeCityIndices:
+            city_index = self.freeCityIndices.pop()
+            self.cityTable[city_index] = city
+            return city_index
+        self.cityTable.append(city)
+        return len(self.cityTable) - 1
+
+    def _release_city(self, city_index):
+        """
+        Drop the reference of the city table to a removed City, the slot is reused by the next insertion.
+        """
+        self.cityTable[city_index] = None
+        self.freeCityIndices.append(city_index)
+        if isinstance(self.cityTable, list) and len(self.cityTable) >= self.minimumCompactionSize \
+                and 2 * len(self.freeCityIndices) > len(self.cityTable):
+            self._compact_city_table()
+
+    def _compact_city_table(self):
+        """
+        Rebuild the city table with only the cities of the heap, in heap order. Lazy tables (snapshot, TSV file) are
+        not compacted, their released slots hold no City Object.
+        """
+        city_table = self.cityTable
+        self.cityTable = [city_table[city_index] for city_index in self.heapCityIndices]
+        self.heapCityIndices = array('q', range(self.currentHeapLastIndex))
+        self.freeCityIndices = []
+
+    def _append_node(self, population, city_index):
+        """
+        Add a node to the end of the columns and restore the heap property upwards.
+        """
+        self.heapPopulations.append(population)
+        self.heapCityIndices.append(city_index)
+        self.currentHeapLastIndex += 1
+
+        if self.recursive:
+            self.heapify_up_recursive(self.currentHeapLastIndex - 1)
+        else:
+            self.heapify_up_iterative()
+
+    def build_heap_via_floyd(self):
+        """
+        Build a Heap via Floyds Heap Construction Algorithm over the population column.
+        """
+        amount_of_cities = self.currentHeapLastIndex
+        for i in range(amount_of_cities // 2 - 1, -1, -1):
+            self.heapify_floyd(i, amount_of_cities)
+
+    def heapify_up_iterative(self):
+        """
+        Establish heap conditions for a Max-Heap iterative upwards, starting at the last node.
+
+        Instead of swapping at every level, the parents are moved down into the hole and the new node is written once.
+        """
+        populations = self.heapPopulations
+        city_indices = self.heapCityIndices
+
+        index = self.currentHeapLastIndex - 1
+        population = populations[index]
+        city_index = city_indices[index]
+
+        while index > 0:
+            parent_index = (index - 1) >> 1
+            parent_population = populations[parent_index]
+            if parent_population >= population:
+                break
+            populations[index] = parent_population
+            city_indices[index] = city_indices[parent_index]
+            index = parent_index
+
+        populations[index] = population
+        city_indices[index] = city_index
+
+    def heapify_up_recursive(self, index):
+        """
+        Establish heap conditions for a Max-Heap recursive upwards.
+        """
+        if index <= 0:  # base case: node has no parent, stop recursion
+            return
+
+        parent_index = (index - 1) >> 1
+
+        if self.heapPopulations[index] > self.heapPopulations[parent_index]:
+            self.swap_nodes(index, parent_index)
+            self.heapify_up_recursive(parent_index)
+
+    def heapify_floyd(self, index, amount_of_cities):
+        """
+        Establish heap conditions via Floyds Heap Construction Algorithmus for the subtree below index.
+
+        The node is lifted out of the column, the larger child is moved up into the hole until the node fits.
+        """
+        populations = self.heapPopulations
+        city_indices = self.heapCityIndices
+
+        population = populations[index]
+        city_index = city_indices[index]
+        child_index = 2 * index + 1
+
+        while child_index < amount_of_cities:
+            right_child_index = child_index + 1
+            if right_child_index < amount_of_cities and populations[right_child_index] > populations[child_index]:
+                child_index = right_child_index
+            child_population = populations[child_index]
+            if population >= child_population:
+                break
+            populations[index] = child_population
+            city_indices[index] = city_indices[child_index]
+            index = child_index
+            child_index = 2 * index + 1
+
+        populations[index] = population
+        city_indices[index] = city_index
+
+    def heapify_down_iterative(self):
+        """
+        Establish heap conditions for a Max-Heap iterative downwards, starting at the root.
+        """
+        self.heapify_floyd(0, self.currentHeapLastIndex)
+
+    def heapify_down_recursive(self, index):
+        """
+        Establish heap conditions for a Max-Heap recursive downwards.
+        """
+        populations = self.heapPopulations
+        left_child_index = 2 * index + 1
+        right_child_index = 2 * index + 2
+
+        largest_index = index
+        if left_child_index < self.currentHeapLastIndex and populations[left_child_index] > populations[largest_index]:
+            largest_index = left_child_index
+        if right_child_index < self.currentHeapLastIndex and populations[right_child_index] > populations[
+            largest_index]:
+            largest_index = right_child_index
+
+        if largest_index != index:
+            self.swap_nodes(index, largest_index)
+            self.heapify_down_recursive(largest_index)
+
+    def remove(self):
+        """
+        Remove the City with the highest population from the Heap and return it.
+        """
+        if self.currentHeapLastIndex == 0:
+            return None
+
+        root_city_index = self.heapCityIndices[0]
+        root = self.cityTable[root_city_index]
+
+        # Replace the root node with the last node in the columns
+        last_population = self.heapPopulations.pop()
+        last_city_index = self.heapCityIndices.pop()
+        self.currentHeapLastIndex -= 1
+
+        if self.currentHeapLastIndex > 0:
+            self.heapPopulations[0] = last_population
+            self.heapCityIndices[0] = last_city_index
+            if self.recursive:
+                self.heapify_down_recursive(0)
+            else:
+                self.heapify_down_iterative()
+
+        self._release_city(root_city_index)
+        return root
+
+    def sorted_cities(self) -> List[City]:
+        """
+        In-place heapsort over the columns: drain the heap and return all City Objects in descending order of
+        population. The heap is empty afterwards.
+        """
+        populations = self.heapPopulations
+        city_indices = self.heapCityIndices
+
+        for last_index in range(self.currentHeapLastIndex - 1, 0, -1):
+            populations[0], populations[last_index] = populations[last_index], populations[0]
+            city_indices[0], city_indices[last_index] = city_indices[last_index], city_indices[0]
+            self.heapify_floyd(0, last_index)
+
+        city_table = self.cityTable
+        descending_cities = [city_table[city_index] for city_index in reversed(city_indices)]
+
+        self.cityTable = []
+        self.freeCityIndices = []
+        self.heapPopulations = array('q')
+        self.heapCityIndices = array('q')
+        self.currentHeapLastIndex = 0
+        return descending_cities
+
+    def get_root_city(self):
+        if self.currentHeapLastIndex == 0:  # heap is empty, return None
+            return None
+        return self.cityTable[self.heapCityIndices[0]]
+
+    def get_city(self, index) -> City:
+        return self.cityTable[self.heapCityIndices[index]]
+
+    def get_city_population(self, index):
+        return self.heapPopulations[index]
+
+    def get_parent_population(self, index):
+        return self.heapPopulations[(index - 1) // 2]
+
+    def get_left_child_population(self, index):
+        return self.heapPopulations[2 * index + 1]
+
+    def get_right_child_population(self, index):
+        return self.heapPopulations[2 * index + 2]
+
+    def has_left_child(self, index):
+        return 2 * index + 1 < self.currentHeapLastIndex
+
+    def has_right_child(self, index):
+        return 2 * index + 2 < self.currentHeapLastIndex
+
+    def swap_nodes(self, fst_node_index, sec_node_index):
+        # Swap both columns at the given indices
+        populations = self.heapPopulations
+        city_indices = self.heapCityIndices
+        populations[fst_node_index], populations[sec_node_index] = populations[sec_node_index], \
+            populations[fst_node_index]
+        city_indices[fst_node_index], city_indices[sec_node_index] = city_indices[sec_node_index], \
+            city_indices[fst_node_index]
+
+    def get_heap_data(self) -> List[City]:
+        """
+        Return the List of City Objects in heap order.
+
+        return
+        ------
+        List[City]:
+        """
+        city_table = self.cityTable
+        return [city_table[city_index] for city_index in self.heapCityIndices]
@@ -0,0 +1,173 @@
+from typing import List
+from CityDataManagement.City import City
+from CityDataManagement.CityMaxHeap import CityMaxHeap
+
+
+class CityDaryMaxHeap(CityMaxHeap):
+    """
+    Class with the responsibility to create a d-ary Max-Heap-structure based on unstructured data.
+    (Every Parents Key must be greater than its children Key, every node has up to d children)
+
+    The children of the node at index i are located at d * i + 1 ... d * i + d, its parent at (i - 1) // d.
+    A higher arity makes the tree flatter (log_d(n) levels): sift-up (insert) gets cheaper, sift-down (remove) has to
+    compare more siblings per level, but the siblings are neighbours in the heap storage.
+    """
+
+    arity: int = 4
+
+    def __init__(self, raw_city_data: List[City], recursive: bool, floyd: bool, arity: int = 4):
+        """
+        Creation of a d-ary Max-City-Heap.
+
+        :param raw_city_data:    A unsorted List of Cities
+        :param recursive:    Should the heapify be recursiv? False = use the iterative approach; True = Recursiv approach
+        :param floyd:       Should Floyds algorithm be used for insertion? True = instead of the iterative or recursiv approach Floyds algorithm will be used instead.
+        :param arity:       Maximum amount of children per node, e.g. 2, 4 or 8.
+        """
+        if arity < 2:
+            raise ValueError("The arity of a heap must be at least 2, got " + str(arity))
+        self.arity = arity
+        super().__init__(raw_city_data, recursive, floyd)
+
+    # ------Index calculation for d children per node
+
+    def get_left_child_index(self, index):
+        """
+        Return the index of the first (leftmost) child.
+        """
+        return self.arity * index + 1
+
+    def get_right_child_index(self, index):
+        """
+        Return the index of the last (rightmost) child.
+        """
+        return self.arity * index + self.arity
+
+    def get_child_indices(self, index):
+        """
+        Return the indices of all possible children.
+        """
+        first_child_index = self.arity * index + 1
+        return range(first_child_index, first_child_index + self.arity)
+
+    def get_parent_index(self, index):
+        """
+        Return the index of the parent node.
+        """
+        if index == 0:  # root node has no parent, return None
+            return None
+        return (index - 1) // self.arity
+
+    def get_parent_population(self, index):
+        return self.heapStorage[(index - 1) // self.arity].population
+
+    def get_parent_key(self, index):
+        return self.heapKeys[(index - 1) // self.arity]
+
+    def has_left_child(self, index):
+        return self.arity * index + 1 < self.currentHeapLastIndex
+
+    def has_right_child(self, index):
+        return self.arity * index + self.arity < self.currentHeapLastIndex
+
+    # ------Heapify
+
+    def heapify_up_iterative(self):
+        """
+        Establish heap conditions for a d-ary Max-Heap iterative upwards, starting at the last node.
+        """
+        heap_storage = self.heapStorage
+        heap_keys = self.heapKeys
+        arity = self.arity
+        index = self.currentHeapLastIndex - 1
+        city = heap_storage[index]
+        key = heap_keys[index]
+
+        while index > 0:
+            parent_index = (index - 1) // arity
+            parent_key = heap_keys[parent_index]
+            if parent_key >= key:
+                break
+            # move the parent down into the hole
+            heap_storage[index] = heap_storage[parent_index]
+            heap_keys[index] = parent_key
+            index = parent_index
+
+        heap_storage[index] = city
+        heap_keys[index] = key
+
+    def heapify_up_recursive(self, index):
+        """
+        Establish heap conditions for a d-ary Max-Heap recursive upwards.
+        """
+        if index <= 0:  # base case: node has no parent, stop recursion
+            return
+
+        parent_index = (index - 1) // self.arity
+        if self.heapKeys[index] > self.heapKeys[parent_index]:
+            self.swap_nodes(index, parent_index)
+            self.heapify_up_recursive(parent_index)
+
+    def heapify_floyd(self, index, amount_of_cities):
+        """
+        Establish heap conditions via Floyds Heap Construction Algorithmus for the subtree below index.
+
+        The City is lifted out of the heap, the child with the greatest key moves up into the hole until the City fits.
+        """
+        heap_storage = self.heapStorage
+        heap_keys = self.heapKeys
+        arity = self.arity
+        city = heap_storage[index]
+        key = heap_keys[index]
+        first_child_index = arity * index + 1
+
+        while first_child_index < amount_of_cities:
+            # find the greatest of up to d children
+            largest_child_index = first_child_index
+            largest_key = heap_keys[first_child_index]
+            for child_index in range(first_child_index + 1, min(first_child_index + arity, amount_of_cities)):
+                child_key = heap_keys[child_index]
+                if child_key > largest_key:
+                    largest_child_index = child_index
+                    largest_key = child_key
+
+            if key >= largest_key:
+                break
+            heap_storage[index] = heap_storage[largest_child_index]
+            heap_keys[index] = largest_key
+            index = largest_child_index
+            first_child_index = arity * index + 1
+
+        heap_storage[index] = city
+        heap_keys[index] = key
+
+    def build_heap_via_floyd(self):
+        """
+        Build a d-ary Heap via Floyds Heap Construction Algorithm, starting at the last node with children.
+        """
+        amount_of_cities = len(self.heapStorage)
+        self.currentHeapLastIndex = amount_of_cities
+        for i in range((amount_of_cities - 2) // self.arity, -1, -1):
+            self.heapify_floyd(i, amount_of_cities)
+
+    def heapify_down_iterative(self):
+        """
+        Establish heap conditions for a d-ary Max-Heap iterative downwards, starting at the root.
+        """
+        self.heapify_floyd(0, self.currentHeapLastIndex)
+
+    def heapify_down_recursive(self, index):
+        """
+        Establish heap conditions for a d-ary Max-Heap recursive downwards.
+        """
+        heap_keys = self.heapKeys
+        largest_index = index
+        for child_index in self.get_child_indices(index):
+            if child_index >= self.currentHeapLastIndex:
+                break
+            if heap_keys[child_index] > heap_keys[largest_index]:
+                largest_index = child_index
+
+        if largest_index != index:
+            self.swap_nodes(index, largest_index)
+            self.heapify_down_recursive(largest_index)
@@ -1,6 +1,12 @@
-from typing import List
+import heapq
+from typing import List, Dict, Sequence
+from CityDataImport.CityDataImporter import CityDataImporter
 from CityDataManagement.City import City
 from CityDataManagement.CityMaxHeap import CityMaxHeap
+from CityDataManagement.CityIdentityIndexedMaxHeap import CityIdentityIndexedMaxHeap
+from CityDataManagement.CityIndexedMaxHeap import CityIndexedMaxHeap
+from CityDataManagement.CityQueryCache import CityQueryCache
+from CityDataManagement.CityHeapSnapshot import CityHeapSnapshot
 from CityDataManagement.ICityDataManagerAccess import ICityDataManagerAccess
 
 
@@ -8,54 +14,273 @@ class CityDataManager(ICityDataManagerAccess):
     """
     Class with the responsibility to manage the unsorted and sorted data of the cities.
 
+    The results of the queries (get_highest_population_city, get_max_heap_as_list, top_k, largest_in, top_k_in) are
+    cached until the next mutation: every mutating method increases heapVersion, which invalidates all cached results.
+    The Lists are cached as tuples, so a caller can not change a cached result: top_k and top_k_in return a new List
+    of the k cities on every call, get_max_heap_as_list returns the cached tuple itself (immutable, no O(n) copy per
+    call), which is not the storage of the heap either.
 
+    Hint:
+    -----
+    Only the methods of the manager increase heapVersion. Mutations made directly on cityMaxHeap (or on the heaps of
+    the countries) are not noticed, the cache keeps returning the results of the older version afterwards.
+
+    Param:
+    ------
+    verbose: bool: print a message for every created, merged or removed City? Error messages are always printed.
+
+    query_cache_size: int: amount of cached query results (LRU), 0 = no caching
     """
 
-    cityMaxHeap: CityMaxHeap = None
+    cityMaxHeap: CityMaxHeap = None  # change it only via the methods of the manager, see the query cache
+    countryHeaps: Dict[str, CityIdentityIndexedMaxHeap] = None  # Key = country, Value = Max-City-Heap of the country
     cityData: List[City]
+    cityDataFingerprint = None  # fingerprint of the file of the last refresh_max_city_heap_from_file
+    verbose: bool = True
+    heapVersion: int = 0  # increased by every mutation of the Max-City-Heap
+
+    def __init__(self, verbose: bool = True, query_cache_size: int = None):
+        self.verbose = verbose
+        self.queryCache = CityQueryCache(query_cache_size)
 
-    def create_new_max_city_heap(self, city_data: List[City], recursive: bool, floyd: bool):
+    def create_new_max_city_heap(self, city_data: List[City], recursive: bool, floyd: bool, heap_class=None,
+                                 per_country: bool = False, **heap_options):
         self.cityData: List[City] = city_data
+        self.cityDataFingerprint = None
         unsorted_cities_list = self._convert_raw_city_data_to_city_list(city_data)
-        self.cityMaxHeap = self._create_city_max_heap(unsorted_cities_list, recursive, floyd)
+        self.countryHeaps = self._create_country_heaps(unsorted_cities_list, recursive) if per_country else None
+        self.cityMaxHeap = self._create_city_max_heap(unsorted_cities_list, recursive, floyd, heap_class,
+                                                      **heap_options)
+        self._invalidate_query_cache()
+
+    def create_new_max_city_heap_from_batches(self, city_data_batches, recursive: bool, heap_class=None,
+                                              per_country: bool = False, **heap_options):
+        self.cityData = []
+        self.cityDataFingerprint = None
+        self.cityMaxHeap = self._create_city_max_heap([], recursive, False, heap_class, **heap_options)
+        self.countryHeaps = {} if per_country else None
+        for city_data_batch in city_data_batches:
+            # every batch enters the heap as soon as it has been read
+            for new_city in self._convert_raw_city_data_to_city_list(city_data_batch):
+                self.cityMaxHeap.insert(new_city)
+                self._insert_into_country_heap(new_city)
+        self._invalidate_query_cache()
+
+    def create_new_max_city_heap_in_parallel(self, path_to_file=None, recursive: bool = False, max_workers=None):
+        # imported on first use: multiprocessing and concurrent.futures dominate the import time of this module
+        from CityDataManagement.ParallelCityHeapBuilder import ParallelCityHeapBuilder
+        self.cityData = []
+        self.cityDataFingerprint = None
+        self.countryHeaps = None
+        parallel_city_heap_builder = ParallelCityHeapBuilder(max_workers)
+        self.cityMaxHeap = parallel_city_heap_builder.build(path_to_file, recursive)
+        self._invalidate_query_cache()
+        if parallel_city_heap_builder.amountOfSkippedRows > 0:
+            print(str(parallel_city_heap_builder.amountOfSkippedRows)
+                  + " entries have been skipped. Structure should be: Name / Country / Population")
+        return parallel_city_heap_builder.amountOfSkippedRows
+
+    def refresh_max_city_heap_from_file(self, path_to_file=None, recursive: bool = False, per_country: bool = False):
+        # imported on first use: only the refresh needs the hashing of the change detection
+        from CityDataImport.CityDataChangeDetector import CityDataChangeDetector
+        change_detector = CityDataChangeDetector(CityDataImporter(path_to_file))
+        if self.cityDataFingerprint is None or not isinstance(self.cityMaxHeap, CityIndexedMaxHeap):
+            # one read of the file for the records and the fingerprint, so both describe the same version
+            city_data_fingerprint, city_data = change_detector.fingerprint_with_records()
+            self.create_new_max_city_heap(city_data, recursive, True, CityIndexedMaxHeap, per_country)
+            self.cityDataFingerprint = city_data_fingerprint
+            return None
+
+        if per_country != (self.countryHeaps is not None):
+            self.countryHeaps = self._create_country_heaps(
+                self.cityMaxHeap.get_heap_data()[:self.cityMaxHeap.currentHeapLastIndex],
+                self.cityMaxHeap.recursive) if per_country else None
+            self._invalidate_query_cache()
+
+        city_data_change = change_detector.diff(self.cityDataFingerprint)
+        if not city_data_change.is_empty():
+            self._apply_city_data_change(city_data_change)
+            self._invalidate_query_cache()
+        self.cityDataFingerprint = city_data_change.fingerprint
+        return city_data_change
 
     def insert_new_city_into_max_city_heap(self, name, country, population):
         if self.cityMaxHeap is not None:
             new_city = City(name, country, population)
             self.cityMaxHeap.insert(new_city)
-            print("City of " + name + " with a population of " + str(
+            self._insert_into_country_heap(new_city)
+            self._invalidate_query_cache()
+            self._print_info("City of " + name + " with a population of " + str(
                 population) + " in the country of " + country + " has been created.")
         else:
             print("No Data Available")
 
+    def insert_new_cities_into_max_city_heap(self, city_data):
+        if self.cityMaxHeap is not None:
+            new_cities = self._convert_raw_city_data_to_city_list(city_data)
+            self.cityMaxHeap.insert_many(new_cities)
+            self._insert_many_into_country_heaps(new_cities)
+            self._invalidate_query_cache()
+            self._print_info(str(len(new_cities)) + " cities have been created.")
+        else:
+            print("No Data Available")
+
+    def merge_into_max_city_heap(self, other_city_heap):
+        if self.cityMaxHeap is not None:
+            self.cityMaxHeap.merge(other_city_heap)
+            self._insert_many_into_country_heaps(
+                other_city_heap.get_heap_data()[:other_city_heap.currentHeapLastIndex])
+            self._invalidate_query_cache()
+            self._print_info(str(other_city_heap.currentHeapLastIndex) + " cities have been merged.")
+        else:
+            print("No Data Available")
+
     def delete_max_city_heap(self):
         self.cityMaxHeap = None
+        self.countryHeaps = None
+        self.cityDataFingerprint = None
+        self._invalidate_query_cache()
+
+    def save_max_city_heap(self, path_to_file):
+        if self.cityMaxHeap is not None:
+            CityHeapSnapshot().save(self.cityMaxHeap, path_to_file)
+        else:
+            print("No Data Available")
+
+    def load_max_city_heap(self, path_to_file, recursive: bool = False):
+        self.cityData = []
+        self.cityDataFingerprint = None
+        self.countryHeaps = None
+        self.cityMaxHeap = CityHeapSnapshot().load(path_to_file, recursive)
+        self._invalidate_query_cache()
 
     def get_highest_population_city(self):
         if self.cityMaxHeap is not None:
-            return self.cityMaxHeap.get_root_city()
+            return self._cached_query(("highest_population_city",), self.cityMaxHeap.get_root_city)
+        else:
+            print("No Data Available")
+
+    def top_k(self, k) -> List[City]:
+        if self.cityMaxHeap is not None:
+            return self._cached_query(("top_k", k), lambda: self.cityMaxHeap.top_k(k))
         else:
             print("No Data Available")
 
+    def largest_in(self, country) -> City:
+        if self._check_country_heaps():
+            largest_city = self._cached_query(("largest_in", country), lambda: self._get_largest_in(country))
+            if largest_city is None:
+                print("No cities in the country of " + country + ".")
+            return largest_city
+
+    def top_k_in(self, country, k) -> List[City]:
+        if self._check_country_heaps():
+            return self._cached_query(("top_k_in", country, k), lambda: self._get_top_k_in(country, k))
+
+    def top_k_from_iterable(self, records, k) -> List[City]:
+        if k <= 0:
+            return []
+        top_records = []  # min heap of (population, position, record): the smallest of the best k is at index 0
+        for position, record in enumerate(records):
+            try:
+                population = int(record[2])
+            except IndexError:
+                # Index Out Of Bound
+                print("Entry does not exist in City Data. Structure should be: Name / Country / Population")
+                continue
+            if len(top_records) < k:
+                heapq.heappush(top_records, (population, position, record))
+            elif population > top_records[0][0]:
+                heapq.heapreplace(top_records, (population, position, record))
+
+        top_records.sort(reverse=True)
+        return [City(record[0], record[1], population) for population, _, record in top_records]
+
+    def get_cities_in_descending_order(self) -> List[City]:
+        if self.cityMaxHeap is not None:
+            if self.countryHeaps is not None:
+                # the Max-City-Heap is drained, so are the heaps of the countries
+                self.countryHeaps = {}
+            descending_cities = self.cityMaxHeap.sorted_cities()
+            self._invalidate_query_cache()
+            return descending_cities
+        else:
+            print("No Data Available")
+
+    def iter_cities_in_descending_order(self):
+        if self.cityMaxHeap is not None:
+            return self._iter_descending()
+        else:
+            print("No Data Available")
+            return iter(())
+
     def remove_city_with_highest_population(self):
         if self.cityMaxHeap is not None:
             removed_city = self.cityMaxHeap.remove()
             if removed_city is not None:
-                print("City of "
-                      + removed_city.name
-                      + " with the highest population of "
-                      + str(removed_city.population)
-                      + "has been removed.")
+                self._remove_from_country_heap(removed_city)
+                self._invalidate_query_cache()
+                self._print_info("City of "
+                                 + removed_city.name
+                                 + " with the highest population of "
+                                 + str(removed_city.population)
+                                 + "has been removed.")
+            return removed_city
         else:
             print("No Data Available")
 
+    def increase_city_population(self, name, country, population):
+        if self._check_indexed_max_city_heap():
+            try:
+                self.cityMaxHeap.increase_population(name, country, int(population))
+                self._reposition_in_country_heap(name, country)
+                self._invalidate_query_cache()
+            except KeyError:
+                print("City of " + name + " in the country of " + country + " does not exist.")
+
+    def decrease_city_population(self, name, country, population):
+        if self._check_indexed_max_city_heap():
+            try:
+                self.cityMaxHeap.decrease_population(name, country, int(population))
+                self._reposition_in_country_heap(name, country)
+                self._invalidate_query_cache()
+            except KeyError:
+                print("City of " + name + " in the country of " + country + " does not exist.")
+
+    def update_city_population(self, name, country, population):
+        if self._check_indexed_max_city_heap():
+            try:
+                self.cityMaxHeap.update_population(name, country, int(population))
+                self._reposition_in_country_heap(name, country)
+                self._invalidate_query_cache()
+            except KeyError:
+                print("City of " + name + " in the country of " + country + " does not exist.")
+
+    def remove_city(self, name, country):
+        if self._check_indexed_max_city_heap():
+            try:
+                removed_city = self.cityMaxHeap.remove_city(name, country)
+                self._remove_from_country_heap(removed_city)
+                self._invalidate_query_cache()
+                self._print_info("City of " + removed_city.name + " in the country of " + removed_city.country
+                                 + " has been removed.")
+                return removed_city
+            except KeyError:
+                print("City of " + name + " in the country of " + country + " does not exist.")
+
     def transform_raw_city_data_to_unsorted_list_of_cities(self, city_data):
         return self._convert_raw_city_data_to_city_list(city_data)
 
-    def get_max_heap_as_list(self) -> List[City]:
+    def get_max_heap_as_list(self) -> Sequence[City]:
+        """
+        The heap is returned as immutable tuple, it is shared by all calls until the next mutation. Use list() on it if
+        a List is needed.
+        """
+        if self.cityMaxHeap is not None:
+            return self._cached_query(("max_heap_as_list",), self._get_heap_data_if_filled, copy=False)
 
-        if self.cityMaxHeap is not None and len(self.cityMaxHeap.get_heap_data()) > 1:
-            return self.cityMaxHeap.get_heap_data()
+    def get_query_cache_statistics(self) -> dict:
+        return dict(self.queryCache.get_statistics(), heap_version=self.heapVersion)
 
     # ------Private Methods
 
@@ -73,6 +298,153 @@ class CityDataManager(ICityDataManagerAccess):
                 print("Entry does not exist in City Data. Structure should be: Name / Country / Population")
         return unsorted_cities_list
 
+    def _apply_city_data_change(self, city_data_change):
+        """
+        Apply the removed, changed and added records of a CityDataChange to the indexed Max-City-Heap.
+        """
+        for name, country in city_data_change.removedKeys:
+            if self.cityMaxHeap.has_city(name, country):
+                self._remove_from_country_heap(self.cityMaxHeap.remove_city(name, country))
+
+        new_records = list(city_data_change.addedRecords)
+        for record in city_data_change.changedRecords:
+            name, country, population = record[0], record[1], int(record[2])
+            if not self.cityMaxHeap.has_city(name, country):
+                new_records.append(record)
+            elif self.cityMaxHeap.get_city_by_name(name, country).population != population:
+                self.cityMaxHeap.update_population(name, country, population)
+                self._reposition_in_country_heap(name, country)
+
+        new_cities = self._convert_raw_city_data_to_city_list(new_records)
+        self.cityMaxHeap.insert_many(new_cities)
+        self._insert_many_into_country_heaps(new_cities)
+        self._print_info(str(len(city_data_change.removedKeys)) + " cities have been removed, "
+                         + str(len(city_data_change.changedRecords)) + " checked for changes and "
+                         + str(len(new_cities)) + " created.")
+
+    def _print_info(self, message):
+        if self.verbose:
+            print(message)
+
+    def _create_country_heaps(self, unsorted_cities_list: List[City],
+                              recursive: bool) -> Dict[str, CityIdentityIndexedMaxHeap]:
+        """
+        Group the City Objects by country in a single pass and build one heap per country via Floyds Algorithm.
+
+        The heaps of the countries hold references to the same City Objects as the Max-City-Heap, no City is copied.
+        They are indexed by the City Objects, so two cities with the same name in the same country stay separate.
+        """
+        return {country: CityIdentityIndexedMaxHeap(cities, recursive, True)
+                for country, cities in self._group_cities_by_country(unsorted_cities_list).items()}
+
+    def _group_cities_by_country(self, cities: List[City]) -> Dict[str, List[City]]:
+        cities_by_country: Dict[str, List[City]] = {}
+        for city in cities:
+            cities_by_country.setdefault(city.country, []).append(city)
+        return cities_by_country
+
+    def _insert_into_country_heap(self, city: City):
+        if self.countryHeaps is None:
+            return
+        country_heap = self.countryHeaps.get(city.country)
+        if country_heap is None:
+            self.countryHeaps[city.country] = CityIdentityIndexedMaxHeap([city], self.cityMaxHeap.recursive, True)
+        else:
+            country_heap.insert(city)
+
+    def _insert_many_into_country_heaps(self, cities: List[City]):
+        if self.countryHeaps is None:
+            return
+        for country, new_cities in self._group_cities_by_country(cities).items():
+            country_heap = self.countryHeaps.get(country)
+            if country_heap is None:
+                self.countryHeaps[country] = CityIdentityIndexedMaxHeap(new_cities, self.cityMaxHeap.recursive, True)
+            else:
+                country_heap.insert_many(new_cities)
+
+    def _remove_from_country_heap(self, city: City):
+        if self.countryHeaps is None:
+            return
+        country_heap = self.countryHeaps[city.country]
+        country_heap.remove_city_object(city)
+        if country_heap.currentHeapLastIndex == 0:
+            del self.countryHeaps[city.country]
+
+    def _reposition_in_country_heap(self, name, country):
+        """
+        The population of the shared City Object has already been changed by the Max-City-Heap, the City is sifted to
+        its new position in the heap of its country.
+        """
+        if self.countryHeaps is None:
+            return
+        self.countryHeaps[country].reposition_city(self.cityMaxHeap.get_city_by_name(name, country))
+
+    def _iter_descending(self):
+        for city in self.cityMaxHeap.iter_descending():
+            self._remove_from_country_heap(city)
+            self._invalidate_query_cache()
+            yield city
+
+    def _cached_query(self, key, compute, copy: bool = True):
+        """
+        Lists are cached as immutable tuples. copy = True: the tuple is returned as new List on every call, False: the
+        cached tuple itself is returned.
+        """
+        result = self.queryCache.get_or_compute(key, self.heapVersion, lambda: self._freeze_query_result(compute()))
+        return list(result) if copy and isinstance(result, tuple) else result
+
+    def _freeze_query_result(self, result):
+        if result is None or isinstance(result, City):
+            return result
+        return tuple(result)
+
+    def _invalidate_query_cache(self):
+        """
+        Called after every mutation: the cached results of the older versions are not used any more, so they are
+        dropped instead of being kept until the LRU evicts them.
+        """
+        self.heapVersion += 1
+        self.queryCache.clear()
+
+    def _get_heap_data_if_filled(self):
+        if len(self.cityMaxHeap.get_heap_data()) > 1:
+            return self.cityMaxHeap.get_heap_data()
+
+    def _get_largest_in(self, country):
+        country_heap = self.countryHeaps.get(country)
+        if country_heap is not None and country_heap.currentHeapLastIndex > 0:
+            return country_heap.get_root_city()
+
+    def _get_top_k_in(self, country, k):
+        country_heap = self.countryHeaps.get(country)
+        if country_heap is not None:
+            return country_heap.top_k(k)
+        return []
+
+    def _check_country_heaps(self) -> bool:
+        """
+        Check whether the heaps of the countries have been created (per_country=True).
+        """
+        if self.cityMaxHeap is None:
+            print("No Data Available")
+            return False
+        if self.countryHeaps is None:
+            print("There are no heaps of the countries, create the Max-City-Heap with per_country=True.")
+            return False
+        return True
+
+    def _check_indexed_max_city_heap(self) -> bool:
+        """
+        Check whether the Max-City-Heap supports the operations on single cities (CityIndexedMaxHeap).
+        """
+        if self.cityMaxHeap is None:
+            print("No Data Available")
+            return False
+        if not isinstance(self.cityMaxHeap, CityIndexedMaxHeap):
+            print("The Max-City-Heap has no index of its cities, create it with heap_class=CityIndexedMaxHeap.")
+            return False
+        return True
+
     def _add_city_to_unsorted_cities(self, new_city, unsorted_cities_list):
         """
         Add a city to the Dictonary of unsorted cities.
@@ -82,8 +454,13 @@ class CityDataManager(ICityDataManagerAccess):
         """
         unsorted_cities_list.append(new_city)
 
-    def _create_city_max_heap(self, unsorted_cities_list: List[City], recursive: bool, floyd: bool):
+    def _create_city_max_heap(self, unsorted_cities_list: List[City], recursive: bool, floyd: bool, heap_class=None,
+                              **heap_options):
         """
-        Create a new City Max Heap based on the given List of City Objects
+        Create a new City Max Heap based on the given List of City Objects.
+
+        If no heap_class is given the CityMaxHeap is used. Further heap_options (e.g. arity) are passed to the heap.
         """
-        return CityMaxHeap(unsorted_cities_list, recursive, floyd)
+        if heap_class is None:
+            heap_class = CityMaxHeap
+        return heap_class(unsorted_cities_list, recursive, floyd, **heap_options)
@@ -0,0 +1,181 @@
+import mmap
+import struct
+import sys
+from array import array
+from typing import List
+
+from CityDataManagement.City import City
+from CityDataManagement.CityColumnarMaxHeap import CityColumnarMaxHeap
+from CityDataManagement.LazyCityTable import LazyCityTable
+
+
+class CityHeapSnapshot:
+    """
+    Class with the responsibility to save a built City Heap into a compact binary file and to load it back.
+
+    File layout (little endian):
+
+    -Header: magic b"CITYHEAP", format version, amount of cities, size of the string pool
+
+    -Population column: one int64 per city in heap order
+
+    -String offsets: int64 offsets into the string pool, name and country of every city and one closing offset
+
+    -String pool: the UTF-8 encoded names and countries one after another
+
+    Loading memory-maps the file and returns a ready-to-query heap, nothing is parsed or heapified.
+    """
+
+    magic = b"CITYHEAP"
+    formatVersion = 1
+    header = struct.Struct("<8sH6xQQ")
+
+    def save(self, city_heap, path_to_file):
+        """
+        Save the given heap (any heap offering get_heap_data) into a binary snapshot file.
+
+        The snapshot always holds a binary Max-Heap on the population, that is what load returns. The array of a
+        binary Max-City-Heap is written as it is, the cities of any other heap (d-ary heaps, Min-Heaps, other keys) are
+        written in descending order of population, so they are reloaded as binary Max-City-Heap.
+        """
+        cities: List[City] = city_heap.get_heap_data()[:city_heap.currentHeapLastIndex]
+
+        populations = array('q', [city.population for city in cities])
+        if not self._is_binary_max_heap(populations):
+            # e.g. a d-ary heap or a Min-Heap: a List in descending order is a valid binary Max-Heap
+            cities = sorted(cities, key=lambda city: city.population, reverse=True)
+            populations = array('q', [city.population for city in cities])
+        string_offsets = array('q')
+        string_pool = bytearray()
+        for city in cities:
+            string_offsets.append(len(string_pool))
+            string_pool += city.name.encode("utf-8")
+            string_offsets.append(len(string_pool))
+            string_pool += city.country.encode("utf-8")
+        string_offsets.append(len(string_pool))
+
+        if sys.byteorder == "big":
+            populations.byteswap()
+            string_offsets.byteswap()
+
+        with open(path_to_file, "wb") as f:
+            f.write(self.header.pack(self.magic, self.formatVersion, len(cities), len(string_pool)))
+            f.write(populations.tobytes())
+            f.write(string_offsets.tobytes())
+            f.write(string_pool)
+
+    def load(self, path_to_file, recursive: bool = False):
+        """
+        Load a snapshot file and return a CitySnapshotMaxHeap working directly on the memory-mapped file.
+
+        :param recursive:    Should the heapify of later insertions and removals be recursiv?
+        """
+        with open(path_to_file, "rb") as f:
+            mapped_file = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+        magic, format_version, amount_of_cities, string_pool_size = self.header.unpack_from(mapped_file, 0)
+        if magic != self.magic or format_version != self.formatVersion:
+            mapped_file.close()
+            raise ValueError("File " + str(path_to_file) + " is not a City Heap snapshot of version "
+                             + str(self.formatVersion))
+
+        populations_start = self.header.size
+        string_offsets_start = populations_start + 8 * amount_of_cities
+        string_pool_start = string_offsets_start + 8 * (2 * amount_of_cities + 1)
+
+        file_view = memoryview(mapped_file)
+        populations = self._int64_column(file_view[populations_start:string_offsets_start])
+        string_offsets = self._int64_column(file_view[string_offsets_start:string_pool_start])
+        string_pool = file_view[string_pool_start:string_pool_start + string_pool_size]
+
+        city_table = SnapshotCityTable(populations, string_offsets, string_pool)
+        return CitySnapshotMaxHeap(city_table, populations, recursive)
+
+    def _is_binary_max_heap(self, populations) -> bool:
+        """
+        Check in O(n) whether the populations in array order fulfill the condition of a binary Max-Heap.
+        """
+        return all(populations[(index - 1) // 2] >= populations[index] for index in range(1, len(populations)))
+
+    def _int64_column(self, column_view):
+        """
+        Interpret a part of the file as int64 column. Only big endian machines have to copy and swap the bytes.
+        """
+        if sys.byteorder == "big":
+            column = array('q', column_view.tobytes())
+            column.byteswap()
+            return column
+        return column_view.cast('q')
+
+
+class SnapshotCityTable(LazyCityTable):
+    """
+    Class with the responsibility to offer the cities of a snapshot as a List, the City Objects are only created
+    when a city is requested (see LazyCityTable).
+    """
+
+    def __init__(self, populations, string_offsets, string_pool):
+        super().__init__(len(populations))
+        self.populations = populations
+        self.stringOffsets = string_offsets
+        self.stringPool = string_pool
+
+    def _decode_city(self, city_index) -> City:
+        string_offsets = self.stringOffsets
+        name_start = string_offsets[2 * city_index]
+        country_start = string_offsets[2 * city_index + 1]
+        country_end = string_offsets[2 * city_index + 2]
+        name = str(self.stringPool[name_start:country_start], "utf-8")
+        country = str(self.stringPool[country_start:country_end], "utf-8")
+        return City(name, country, self.populations[city_index])
+
+
+class CitySnapshotMaxHeap(CityColumnarMaxHeap):
+    """
+    Class with the responsibility to offer a columnar Max-Heap loaded from a snapshot file.
+
+    The snapshot already is in heap order, so the heap works directly on the read-only columns of the file.
+    Only the first insertion or removal copies the two integer columns into writable arrays.
+    """
+
+    def __init__(self, city_table: SnapshotCityTable, populations, recursive: bool):
+        # the heap conditions already hold, so the construction of the super class is skipped
+        self.rawCityData = []
+        self.heapStorage = []
+        self.cityTable = city_table
+        self.freeCityIndices = []
+        self.heapPopulations = populations
+        self.heapCityIndices = range(len(populations))  # city index == heap position in a fresh snapshot
+        self.maximumHeapCapacity = len(populations)
+        self.currentHeapLastIndex = len(populations)
+        self.recursive = recursive
+        self.floyd = False
+        self.writable = False
+
+    def insert(self, city):
+        self._make_writable()
+        super().insert(city)
+
+    def insert_many(self, cities):
+        self._make_writable()
+        super().insert_many(cities)
+
+    def remove(self):
+        self._make_writable()
+        return super().remove()
+
+    def sorted_cities(self):
+        self._make_writable()
+        return super().sorted_cities()
+
+    def _make_writable(self):
+        """
+        Copy the memory-mapped columns into writable arrays before the heap is changed for the first time.
+        """
+        if self.writable:
+            return
+        writable_populations = array('q')
+        writable_populations.frombytes(memoryview(self.heapPopulations).cast('B'))
+        self.heapPopulations = writable_populations
+        self.heapCityIndices = array('q', self.heapCityIndices)
+        self.writable = True
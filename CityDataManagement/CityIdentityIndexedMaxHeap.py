@@ -0,0 +1,25 @@
+from CityDataManagement.CityIndexedMaxHeap import CityIndexedMaxHeap
+
+
+class CityIdentityIndexedMaxHeap(CityIndexedMaxHeap):
+    """
+    Class with the responsibility to offer an indexed Max-Heap whose position map is keyed by the City Object itself
+    (id of the City) instead of its name and country.
+
+    It is used for heaps which hold references to the City Objects of another heap, e.g. the heaps of the countries:
+    two cities with the same name and country are two different entries, so removing or repositioning one of them
+    never touches the other one. The cities are found via remove_city_object and reposition_city, the lookups by
+    name and country are not supported.
+    """
+
+    def has_city(self, name, country) -> bool:
+        raise NotImplementedError("The cities of a CityIdentityIndexedMaxHeap are found by their City Object.")
+
+    def get_city_by_name(self, name, country):
+        raise NotImplementedError("The cities of a CityIdentityIndexedMaxHeap are found by their City Object.")
+
+    def remove_city(self, name, country):
+        raise NotImplementedError("The cities of a CityIdentityIndexedMaxHeap are found by their City Object.")
+
+    def _position_key(self, city):
+        return id(city)
@@ -0,0 +1,214 @@
+from typing import List, Dict, Tuple
+from CityDataManagement.City import City
+from CityDataManagement.CityMaxHeap import CityMaxHeap
+
+
+class CityIndexedMaxHeap(CityMaxHeap):
+    """
+    Class with the responsibility to offer a Max-Heap which also knows the position of every City in the heap.
+
+    The position map (Key = (name, country), Value = index in the heap) is kept up to date by swap_nodes, so a single
+    City can be found in O(1) and its population can be changed or the City can be removed with a single sift in
+    O(log n) instead of rebuilding the whole heap.
+
+    Hint:
+    -----
+    Name and country identify a City, every combination is expected to be in the heap only once. If a combination is
+    inserted twice, only one of the cities can be found by name and country.
+    """
+
+    cityPositions: Dict[Tuple[str, str], int]
+
+    def __init__(self, raw_city_data: List[City], recursive: bool, floyd: bool):
+        """
+        Creation of an indexed Max-City-Heap.
+
+        :param raw_city_data:    A unsorted List of Cities
+        :param recursive:    Should the heapify be recursiv? False = use the iterative approach; True = Recursiv approach
+        :param floyd:       Should Floyds algorithm be used for insertion? True = instead of the iterative or recursiv approach Floyds algorithm will be used instead.
+        """
+        self.cityPositions = {}
+        super().__init__(raw_city_data, recursive, floyd)
+
+    # ------Maintenance of the position map
+
+    def insert(self, city):
+        self.cityPositions[self._position_key(city)] = len(self.heapStorage)
+        super().insert(city)
+
+    def build_heap_via_floyd(self):
+        """
+        Build the heap via Floyds Algorithm, the position map is rebuilt afterwards in one pass (O(n)).
+        """
+        super().build_heap_via_floyd()
+        position_key = self._position_key
+        self.cityPositions = {position_key(city): index for index, city in enumerate(self.heapStorage)}
+
+    def swap_nodes(self, fst_node_index, sec_node_index):
+        super().swap_nodes(fst_node_index, sec_node_index)
+        fst_city = self.heapStorage[fst_node_index]
+        sec_city = self.heapStorage[sec_node_index]
+        self.cityPositions[self._position_key(fst_city)] = fst_node_index
+        self.cityPositions[self._position_key(sec_city)] = sec_node_index
+
+    # ------Indexed operations
+
+    def has_city(self, name, country) -> bool:
+        return (name, country) in self.cityPositions
+
+    def get_city_by_name(self, name, country) -> City:
+        """
+        Return the City with the given name and country. Raises a KeyError if the City is not in the heap.
+        """
+        return self.heapStorage[self.cityPositions[(name, country)]]
+
+    def increase_population(self, name, country, population):
+        """
+        Increase the population of a City, the City can only move upwards.
+        """
+        index = self.cityPositions[(name, country)]
+        city = self.heapStorage[index]
+        if population < city.population:
+            raise ValueError("The new population of " + name + " is lower than the current one.")
+        city.population = population
+        self.heapKeys[index] = self.keyFunction(city)
+        self._sift_up(index)
+
+    def decrease_population(self, name, country, population):
+        """
+        Decrease the population of a City, the City can only move downwards.
+        """
+        index = self.cityPositions[(name, country)]
+        city = self.heapStorage[index]
+        if population > city.population:
+            raise ValueError("The new population of " + name + " is higher than the current one.")
+        city.population = population
+        self.heapKeys[index] = self.keyFunction(city)
+        self._sift_down(index)
+
+    def update_population(self, name, country, population):
+        """
+        Set the population of a City, depending on the change it is either increased or decreased.
+        """
+        if population >= self.get_city_by_name(name, country).population:
+            self.increase_population(name, country, population)
+        else:
+            self.decrease_population(name, country, population)
+
+    def remove_city(self, name, country):
+        """
+        Remove the City with the given name and country from the heap and return it.
+        """
+        return self._remove_at(self.cityPositions[(name, country)])
+
+    def remove_city_object(self, city):
+        """
+        Remove the given City Object from the heap and return it. Raises a KeyError if the City is not in the heap.
+        """
+        return self._remove_at(self.cityPositions[self._position_key(city)])
+
+    def reposition_city(self, city):
+        """
+        The population of the given City Object has been changed outside of the heap, e.g. by another heap holding the
+        same City Object: its key is updated and the City is sifted up or down.
+        """
+        index = self.cityPositions[self._position_key(city)]
+        old_key = self.heapKeys[index]
+        self.heapKeys[index] = self.keyFunction(city)
+        if self.heapKeys[index] > old_key:
+            self._sift_up(index)
+        else:
+            self._sift_down(index)
+
+    def remove(self):
+        """
+        Remove the City with the highest population from the heap and return it.
+        """
+        if self.currentHeapLastIndex == 0:
+            return None
+        return self._remove_at(0)
+
+    def sorted_cities(self) -> List[City]:
+        """
+        In-place heapsort, the heap (and so the position map) is empty afterwards.
+        """
+        descending_cities = super().sorted_cities()
+        self.cityPositions = {}
+        return descending_cities
+
+    # ------Sifting via swap_nodes, so the position map stays valid
+
+    def heapify_up_iterative(self):
+        self._sift_up(self.currentHeapLastIndex - 1)
+
+    def heapify_down_iterative(self):
+        self._sift_down(0)
+
+    def heapify_down_recursive(self, index):
+        # Find the index of the greatest key of the node and its children
+        heap_keys = self.heapKeys
+        largest_index = index
+        for child_index in (2 * index + 1, 2 * index + 2):
+            if child_index < self.currentHeapLastIndex and heap_keys[child_index] > heap_keys[largest_index]:
+                largest_index = child_index
+
+        # If the largest element is not the current element, swap them and heapify down recursively
+        if largest_index != index:
+            self.swap_nodes(index, largest_index)
+            self.heapify_down_recursive(largest_index)
+
+    def _position_key(self, city):
+        """
+        Key of a City in the position map.
+        """
+        return city.name, city.country
+
+    def _sift_up(self, index):
+        heap_keys = self.heapKeys
+        while index > 0:
+            parent_index = (index - 1) // 2
+            if heap_keys[parent_index] >= heap_keys[index]:
+                break
+            self.swap_nodes(index, parent_index)
+            index = parent_index
+
+    def _sift_down(self, index):
+        heap_keys = self.heapKeys
+        heap_size = self.currentHeapLastIndex
+        while True:
+            largest_index = index
+            for child_index in (2 * index + 1, 2 * index + 2):
+                if child_index < heap_size and heap_keys[child_index] > heap_keys[largest_index]:
+                    largest_index = child_index
+            if largest_index == index:
+                break
+            self.swap_nodes(index, largest_index)
+            index = largest_index
+
+    def _remove_at(self, index):
+        """
+        Remove the City at the given heap position: the last City takes its place and is sifted up or down.
+        """
+        removed_city = self.heapStorage[index]
+        removed_key = self.heapKeys[index]
+        removed_position_key = self._position_key(removed_city)
+        if self.cityPositions.get(removed_position_key) == index:
+            # a second City with the same key keeps its entry
+            del self.cityPositions[removed_position_key]
+
+        last_city = self.heapStorage.pop()
+        last_key = self.heapKeys.pop()
+        self.currentHeapLastIndex -= 1
+
+        if index < self.currentHeapLastIndex:
+            self.heapStorage[index] = last_city
+            self.heapKeys[index] = last_key
+            self.cityPositions[self._position_key(last_city)] = index
+            if last_key > removed_key:
+                self._sift_up(index)
+            elif self.recursive:
+                self.heapify_down_recursive(index)
+            else:
+                self._sift_down(index)
+
+        return removed_city
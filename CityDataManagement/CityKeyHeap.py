@@ -0,0 +1,258 @@
+from typing import List, Callable
+from CityDataManagement.City import City
+from CityDataManagement.AbstractCityHeap import AbstractCityHeap
+
+
+def get_parent_index(index):
+    """
+    Return the index of the parent node.
+    """
+    if index == 0:  # root node has no parent, return None
+        return None
+    return (index - 1) // 2
+
+
+def population_key(city: City):
+    """
+    Key of a Max-Heap on the population: the City with the highest population is the root.
+    """
+    return city.population
+
+
+class CityKeyHeap(AbstractCityHeap):
+    """
+    Class with the responsibility to offer one heap engine for Min- and Max-Heaps on any attribute of a City.
+    (Every Parents Key must be greater than its children Key)
+
+    Next to the heapStorage (the City Objects) the engine keeps the parallel List heapKeys. The key of a City is
+    extracted once by the key function when the City enters the heap, all comparisons only use heapKeys.
+
+    -Max-Heap on the population: key = population (CityMaxHeap)
+
+    -Min-Heap on the population: key = -population (CityMinHeap)
+
+    -Composite keys, e.g. (country, population): tuples are compared element by element
+    """
+
+    heapKeys: list
+    keyFunction: Callable[[City], object] = staticmethod(population_key)
+
+    def __init__(self, raw_city_data: List[City], recursive: bool, floyd: bool,
+                 key_function: Callable[[City], object] = None):
+        """
+        Creation of a City-Heap ordered by the given key.
+
+        :param raw_city_data:    A unsorted List of Cities
+        :param recursive:    Should the heapify be recursiv? False = use the iterative approach; True = Recursiv approach
+        :param floyd:       Should Floyds algorithm be used for insertion? True = instead of the iterative or recursiv approach Floyds algorithm will be used instead.
+                            For removal the approach specified in :param recursiv will be used.
+        :param key_function:    Function City -> key, the City with the greatest key is the root. None = population
+        """
+        if key_function is not None:
+            self.keyFunction = key_function
+        self.heapKeys = []
+        super().__init__(raw_city_data, recursive, floyd)
+
+    # ------Keys
+
+    def insert_raw_city_data_into_heap(self):
+        if self.floyd:
+            # the heap is built in place: the rawCityData List itself becomes the heap storage
+            self.heapStorage = self.rawCityData
+            key_function = self.keyFunction
+            self.heapKeys = [key_function(city) for city in self.heapStorage]
+            self.build_heap_via_floyd()
+        else:
+            for city in self.rawCityData:
+                self.insert(city)
+
+    def insert(self, city):
+        # Add the new city and its key to the end of the heap
+        self.heapStorage.append(city)
+        self.heapKeys.append(self.keyFunction(city))
+        self.currentHeapLastIndex += 1
+
+        # Restore the heap property upwards
+        if self.recursive:
+            self.heapify_up_recursive(self.currentHeapLastIndex - 1)
+        else:
+            self.heapify_up_iterative()
+
+    def insert_many(self, cities):
+        """
+        Insert several cities at once, either City by City or by appending them unsorted and rebuilding the heap
+        via Floyds Algorithm (see should_rebuild_via_floyd).
+        """
+        new_cities = list(cities)
+        if not self.should_rebuild_via_floyd(len(new_cities)):
+            for city in new_cities:
+                self.insert(city)
+            return
+
+        key_function = self.keyFunction
+        self.heapStorage.extend(new_cities)
+        self.heapKeys.extend([key_function(city) for city in new_cities])
+        self.build_heap_via_floyd()
+
+    def get_city_key(self, index):
+        return self.heapKeys[index]
+
+    def get_parent_key(self, index):
+        return self.heapKeys[(index - 1) // 2]
+
+    def swap_nodes(self, fst_node_index, sec_node_index):
+        # Swap the elements and their keys at the given indices
+        heap_storage = self.heapStorage
+        heap_keys = self.heapKeys
+        heap_storage[fst_node_index], heap_storage[sec_node_index] = heap_storage[sec_node_index], \
+            heap_storage[fst_node_index]
+        heap_keys[fst_node_index], heap_keys[sec_node_index] = heap_keys[sec_node_index], heap_keys[fst_node_index]
+
+    # ------Heapify
+    #
+    # The iterative sifts are the fast kernel: the Lists are bound to locals, no accessor method is called and the
+    # sifted City leaves a hole which moves through the heap instead of pairwise swaps (one write per level instead of
+    # two). The recursive sifts use the accessor methods and swap_nodes, they are kept for comparison.
+
+    def heapify_up_iterative(self):
+        """
+        Establish heap conditions iterative upwards.
+
+        The last City is lifted out of the heap. Every parent with a smaller key moves down into the hole, then the
+        City is written into the hole once.
+        """
+        heap_storage = self.heapStorage
+        heap_keys = self.heapKeys
+        index = self.currentHeapLastIndex - 1  # start at the last node in the heap
+        city = heap_storage[index]
+        key = heap_keys[index]
+
+        while index > 0:
+            parent_index = (index - 1) >> 1
+            parent_key = heap_keys[parent_index]
+            if not key > parent_key:
+                break
+
+            # move the parent down into the hole, the hole moves up
+            heap_storage[index] = heap_storage[parent_index]
+            heap_keys[index] = parent_key
+            index = parent_index
+
+        heap_storage[index] = city
+        heap_keys[index] = key
+
+    def heapify_up_recursive(self, index):
+        """
+        Establish heap conditions recursive upwards.
+        """
+        if not self.has_parent(index):  # base case: node has no parent, stop recursion
+            return
+
+        parent_index = get_parent_index(index)
+
+        if self.get_city_key(index) > self.get_parent_key(index):
+            # if the key of the current node is greater than the key of the parent
+            self.swap_nodes(index, parent_index)
+            self.heapify_up_recursive(parent_index)  # recursive call with the parent index
+
+    def heapify_floyd(self, index, amount_of_cities):
+        """
+        Establish heap conditions via Floyds Heap Construction Algorithmus for the subtree below index.
+
+        The City at index is lifted out of the heap and leaves a hole. The child with the greater key moves up into the
+        hole until the lifted City is not smaller than its children, then the City is written into the hole once.
+        """
+        heap_storage = self.heapStorage
+        heap_keys = self.heapKeys
+        city = heap_storage[index]
+        key = heap_keys[index]
+        child_index = 2 * index + 1  # start with the left child
+
+        while child_index < amount_of_cities:
+            # pick the greater of the two children
+            right_child_index = child_index + 1
+            if right_child_index < amount_of_cities and heap_keys[right_child_index] > heap_keys[child_index]:
+                child_index = right_child_index
+
+            child_key = heap_keys[child_index]
+            if key >= child_key:
+                break
+
+            # move the child up into the hole, the hole moves down
+            heap_storage[index] = heap_storage[child_index]
+            heap_keys[index] = child_key
+            index = child_index
+            child_index = 2 * index + 1
+
+        heap_storage[index] = city
+        heap_keys[index] = key
+
+    def heapify_down_iterative(self):
+        """
+        Establish heap conditions iterative downwards, starting at the root (e.g. after a removal).
+
+        The sift-down is the same hole-based kernel as the one of Floyds Heap Construction.
+        """
+        self.heapify_floyd(0, self.currentHeapLastIndex)
+
+    def heapify_down_recursive(self, index):
+        heap_keys = self.heapKeys
+        # Find the indices of the left and right children
+        left_child_index = 2 * index + 1
+        right_child_index = 2 * index + 2
+
+        # Find the index of the greatest element
+        largest_index = index
+        if left_child_index < self.currentHeapLastIndex and heap_keys[left_child_index] > heap_keys[largest_index]:
+            largest_index = left_child_index
+        if right_child_index < self.currentHeapLastIndex and heap_keys[right_child_index] > heap_keys[largest_index]:
+            largest_index = right_child_index
+
+        # If the greatest element is not the current element, swap them and heapify down recursively
+        if largest_index != index:
+            self.swap_nodes(index, largest_index)
+            self.heapify_down_recursive(largest_index)
+
+    def remove(self):
+        """
+        Remove the City with the greatest key (the root) from the Heap and return it.
+        """
+        if self.currentHeapLastIndex == 0:
+            return None
+
+        root = self.heapStorage[0]
+        # Replace the root element with the last element in the heap
+        last_city = self.heapStorage.pop()
+        last_key = self.heapKeys.pop()
+        self.currentHeapLastIndex -= 1
+
+        # Fix the heap by moving the new root downwards until the heap property is restored
+        if self.currentHeapLastIndex > 0:
+            self.heapStorage[0] = last_city
+            self.heapKeys[0] = last_key
+            if self.recursive:
+                self.heapify_down_recursive(0)
+            else:
+                self.heapify_down_iterative()
+
+        return root
+
+    def sorted_cities(self) -> List[City]:
+        """
+        In-place heapsort: drain the heap and return all City Objects in descending order of their keys.
+
+        The root is swapped with the last City of the shrinking heap and sifted down, so the heap storage ends up in
+        ascending order and is reversed once. No second List is created, the heap is empty afterwards.
+        """
+        heap_storage = self.heapStorage
+        del heap_storage[self.currentHeapLastIndex:]
+
+        for last_index in range(self.currentHeapLastIndex - 1, 0, -1):
+            self.swap_nodes(0, last_index)
+            self.heapify_floyd(0, last_index)
+        heap_storage.reverse()
+
+        self.heapStorage = []
+        self.heapKeys = []
+        self.currentHeapLastIndex = 0
+        return heap_storage
@@ -0,0 +1,32 @@
+from typing import List
+from CityDataManagement.City import City
+from CityDataManagement.CityKeyHeap import CityKeyHeap
+
+
+def negated_population_key(city: City):
+    """
+    Key of a Min-Heap on the population: the City with the lowest population has the greatest key and is the root.
+    """
+    return -city.population
+
+
+class CityMinHeap(CityKeyHeap):
+    """
+    Class with the responsibility to create a Min-Heap-structure based on unstructured data.
+    (Every Parents population must be lower than its children population)
+
+    Configuration of the CityKeyHeap engine with the negated population as key.
+    """
+
+    keyFunction = staticmethod(negated_population_key)
+
+    def __init__(self, raw_city_data: List[City], recursive: bool, floyd: bool):
+        """
+        Creation of a Min-City-Heap.
+
+        :param raw_city_data:    A unsorted List of Cities
+        :param recursive:    Should the heapify be recursiv? False = use the iterative approach; True = Recursiv approach
+        :param floyd:       Should Floyds algorithm be used for insertion? True = instead of the iterative or recursiv approach Floyds algorithm will be used instead.
+                            For removal the approach specified in :param recursiv will be used.
+        """
+        super().__init__(raw_city_data, recursive, floyd)
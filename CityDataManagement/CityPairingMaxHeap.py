@@ -0,0 +1,196 @@
+from typing import List
+from CityDataManagement.City import City
+
+
+class PairingNode:
+    """
+    Node of the CityPairingMaxHeap: a City, its key and the List of its child nodes (every child has a smaller or
+    equal key).
+    """
+    __slots__ = ("city", "key", "children")
+
+    def __init__(self, city: City, key):
+        self.city = city
+        self.key = key
+        self.children = []
+
+
+class CityPairingMaxHeap:
+    """
+    Class with the responsibility to offer a Max-City-Heap for insert-heavy workloads: a pairing heap.
+
+    The heap is a tree of PairingNodes instead of an array, two trees are linked by making the root with the smaller
+    population a child of the other root.
+
+    -insert: the new City is linked with the root, O(1), there is no sift-up
+
+    -meld: the root of another pairing heap is linked with the root, O(1), nothing is rebuilt
+
+    -remove: the children of the root are linked in pairs from left to right and the pairs from right to left
+     (two-pass pairing), amortized O(log n). The work skipped by the inserts is done by the first removal after them
+
+    The heap offers the same methods as the array heaps (AbstractCityHeap), so it can be used by the CityDataManager
+    via heap_class=CityPairingMaxHeap. There is no array, get_heap_data creates one on request (see there).
+
+    Param:
+    ------
+    rawCityData: List[City]: raw unsorted List of City Objects
+
+    recursive, floyd: bool: accepted for the interface of the array heaps. Insert and remove are always iterative and
+    a pairing heap is built by n inserts in O(n), Floyds Algorithm is not needed.
+    """
+
+    root: PairingNode = None
+    currentHeapLastIndex = 0  # current Size of the Heap, named like the index of the array heaps
+    recursive: bool = False
+    floyd: bool = False
+
+    def __init__(self, raw_city_data: List[City], recursive: bool, floyd: bool):
+        self.rawCityData = raw_city_data
+        self.recursive = recursive
+        self.floyd = floyd
+        self.root = None
+        self.currentHeapLastIndex = 0
+        self.insert_many(raw_city_data)
+
+    def insert(self, city):
+        self.root = self._link(self.root, PairingNode(city, city.population))
+        self.currentHeapLastIndex += 1
+
+    def insert_many(self, cities):
+        """
+        Insert several City Objects at once, every City is linked with the root in O(1).
+        """
+        root = self.root
+        amount_of_cities = 0
+        for city in cities:
+            node = PairingNode(city, city.population)
+            if root is None:
+                root = node
+            elif root.key >= node.key:
+                root.children.append(node)
+            else:
+                node.children.append(root)
+                root = node
+            amount_of_cities += 1
+        self.root = root
+        self.currentHeapLastIndex += amount_of_cities
+
+    def meld(self, other_heap: "CityPairingMaxHeap"):
+        """
+        Move all cities of another pairing heap into this heap in O(1). The other heap is empty afterwards.
+        """
+        self.root = self._link(self.root, other_heap.root)
+        self.currentHeapLastIndex += other_heap.currentHeapLastIndex
+        other_heap.root = None
+        other_heap.currentHeapLastIndex = 0
+
+    def merge(self, other_heap):
+        """
+        Merge all cities of another heap into this heap. The other heap is not changed, use meld to take over the
+        nodes of another pairing heap in O(1).
+        """
+        if isinstance(other_heap, CityPairingMaxHeap):
+            self.insert_many(node.city for node in other_heap._iter_nodes())
+        else:
+            self.insert_many(other_heap.get_heap_data()[:other_heap.currentHeapLastIndex])
+
+    def should_rebuild_via_floyd(self, amount_of_new_cities) -> bool:
+        """
+        Inserts cost O(1), a batch of new cities is never cheaper to add via a rebuild.
+        """
+        return False
+
+    def remove(self):
+        """
+        Remove the City with the highest population from the heap and return it.
+        """
+        root = self.root
+        if root is None:
+            return None
+        self.root = self._merge_pairs(root.children)
+        self.currentHeapLastIndex -= 1
+        return root.city
+
+    def get_root_city(self):
+        if self.root is None:  # heap is empty, return None
+            return None
+        return self.root.city
+
+    def top_k(self, k) -> List[City]:
+        """
+        Return the k City Objects with the highest populations in descending order, the cities of the heap are not
+        changed.
+
+        The k cities are removed and inserted again: amortized O(k log n), and the pairing done by the removals stays,
+        so a following remove is cheaper.
+        """
+        top_cities: List[City] = []
+        while len(top_cities) < k and self.root is not None:
+            top_cities.append(self.remove())
+        self.insert_many(top_cities)
+        return top_cities
+
+    def iter_descending(self):
+        """
+        Lazy drain of the heap: yield the City Objects in descending order of population, one removal per City.
+        """
+        while self.root is not None:
+            yield self.remove()
+
+    def sorted_cities(self) -> List[City]:
+        """
+        Drain the heap and return all City Objects in descending order of population. The heap is empty afterwards.
+        """
+        return list(self.iter_descending())
+
+    def get_heap_data(self) -> List[City]:
+        """
+        Return the City Objects as array Max-Heap (index 0 = root, children of i at 2i + 1 and 2i + 2), e.g. for the
+        snapshots and the visualisation.
+
+        A List in descending order of population fulfills the heap condition, it is sorted in O(n log n) without
+        changing the heap.
+        """
+        return sorted((node.city for node in self._iter_nodes()), key=lambda city: city.population, reverse=True)
+
+    # ------Private Methods
+
+    def _link(self, fst_node: PairingNode, sec_node: PairingNode):
+        """
+        Link two trees: the root with the smaller key becomes the last child of the other root.
+        """
+        if fst_node is None:
+            return sec_node
+        if sec_node is None:
+            return fst_node
+        if fst_node.key >= sec_node.key:
+            fst_node.children.append(sec_node)
+            return fst_node
+        sec_node.children.append(fst_node)
+        return sec_node
+
+    def _merge_pairs(self, nodes: List[PairingNode]):
+        """
+        Two-pass pairing: link the trees in pairs from left to right, then link the pairs from right to left.
+        """
+        if not nodes:
+            return None
+        link = self._link
+        pairs = [link(nodes[i], nodes[i + 1]) for i in range(0, len(nodes) - 1, 2)]
+        if len(nodes) % 2 == 1:
+            pairs.append(nodes[-1])
+        root = pairs.pop()
+        while pairs:
+            root = link(pairs.pop(), root)
+        return root
+
+    def _iter_nodes(self):
+        """
+        Yield all nodes of the heap (pre-order, iterative, so deep trees do not hit the recursion limit).
+        """
+        nodes = [self.root] if self.root is not None else []
+        while nodes:
+            node = nodes.pop()
+            yield node
+            nodes.extend(node.children)
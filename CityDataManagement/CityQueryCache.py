@@ -0,0 +1,61 @@
+from collections import OrderedDict
+
+
+class CityQueryCache:
+    """
+    Class with the responsibility to remember the results of queries on the Max-City-Heap between two mutations.
+
+    -Every entry is stored with the version of the heap it has been computed for. The owner of the heap increases its
+     version with every mutation and calls clear, an entry of an older version which is still found counts as miss
+     and is replaced
+
+    -At most maxEntries entries are kept, the least recently used entry is evicted first (LRU)
+
+    -Hits, misses and evictions are counted (see get_statistics)
+
+    Param:
+    ------
+    max_entries: int: size bound of the cache, 0 = nothing is cached
+    """
+
+    maxEntries = 128
+
+    def __init__(self, max_entries: int = None):
+        if max_entries is not None:
+            self.maxEntries = max_entries
+        self.entries = OrderedDict()  # Key = (query, parameters), Value = (version, result)
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get_or_compute(self, key, version, compute):
+        """
+        Return the cached result of the query if it has been computed for the given version, otherwise compute it with
+        compute (callable without arguments) and cache it.
+        """
+        entry = self.entries.get(key)
+        if entry is not None and entry[0] == version:
+            self.hits += 1
+            self.entries.move_to_end(key)
+            return entry[1]
+
+        self.misses += 1
+        result = compute()
+        if self.maxEntries > 0:
+            self.entries[key] = (version, result)
+            self.entries.move_to_end(key)
+            if len(self.entries) > self.maxEntries:
+                self.entries.popitem(last=False)
+                self.evictions += 1
+        return result
+
+    def clear(self):
+        """
+        Remove all entries, the statistics are kept.
+        """
+        self.entries.clear()
+
+    def get_statistics(self) -> dict:
+        lookups = self.hits + self.misses
+        return {"hits": self.hits, "misses": self.misses, "evictions": self.evictions, "entries": len(self.entries),
+                "max_entries": self.maxEntries, "hit_rate": self.hits / lookups if lookups else 0.0}
@@ -0,0 +1,127 @@
+import heapq
+import threading
+from contextlib import contextmanager
+from typing import List
+from CityDataManagement.City import City
+from CityDataManagement.AbstractCityHeap import DescendingKey
+from CityDataManagement.CityMaxHeap import CityMaxHeap
+
+
+class ConcurrentCityMaxHeap(CityMaxHeap):
+    """
+    Class with the responsibility to offer a Max-City-Heap which can be read by many threads while another thread
+    changes it.
+
+    -Writers (insert, insert_many, merge, remove, sorted_cities) hold a lock, so concurrent mutations do not corrupt
+     the heap.
+
+    -Copy-on-write: every mutation works on a copy of the heap storage and its keys and publishes the result as a new
+     state in a single assignment. A published state is never changed again.
+
+    -Readers (get_heap_data, get_root_city, top_k, size) use the latest published state without a lock, they never
+     wait for a writer and never see a half-applied mutation.
+
+    Hint:
+    -----
+    Every mutation copies the heap (O(n)). A thread applying many updates should group them with batch_mutations
+    (or pass them to insert_many), the whole batch costs only one copy and is published at once.
+    The List returned by get_heap_data is shared with other readers and must not be changed.
+    """
+
+    def __init__(self, raw_city_data: List[City], recursive: bool, floyd: bool):
+        """
+        Creation of a concurrent Max-City-Heap.
+
+        :param raw_city_data:    A unsorted List of Cities
+        :param recursive:    Should the heapify be recursiv? False = use the iterative approach; True = Recursiv approach
+        :param floyd:       Should Floyds algorithm be used for insertion? True = instead of the iterative or recursiv approach Floyds algorithm will be used instead.
+        """
+        self.mutationLock = threading.RLock()
+        self.mutationDepth = 0  # mutations called by other mutations (e.g. merge -> insert_many) copy only once
+        self.publishedState = ([], [], 0)  # (City Objects, keys, size) in heap order
+        with self.mutationLock:
+            super().__init__(raw_city_data, recursive, floyd)
+            self._publish_state()
+
+    # ------Writers
+
+    def insert(self, city):
+        self._mutate(super().insert, city)
+
+    def insert_many(self, cities):
+        self._mutate(super().insert_many, cities)
+
+    def merge(self, other_heap):
+        self._mutate(super().merge, other_heap)
+
+    def remove(self):
+        return self._mutate(super().remove)
+
+    def sorted_cities(self) -> List[City]:
+        return self._mutate(super().sorted_cities)
+
+    @contextmanager
+    def batch_mutations(self):
+        """
+        Group several mutations: the heap is copied once, the readers see either none or all of them.
+
+        with city_heap.batch_mutations():
+            city_heap.insert(new_city)
+            city_heap.remove()
+        """
+        with self.mutationLock:
+            if self.mutationDepth == 0:
+                # copy-on-write: the published Lists are never changed
+                self.heapStorage = self.heapStorage[:]
+                self.heapKeys = self.heapKeys[:]
+            self.mutationDepth += 1
+            try:
+                yield self
+            finally:
+                self.mutationDepth -= 1
+                if self.mutationDepth == 0:
+                    self._publish_state()
+
+    def _mutate(self, mutation, *arguments):
+        """
+        Apply the mutation to a private copy of the heap under the lock, then publish the copy.
+        """
+        with self.batch_mutations():
+            return mutation(*arguments)
+
+    def _publish_state(self):
+        self.publishedState = (self.heapStorage, self.heapKeys, self.currentHeapLastIndex)
+
+    # ------Readers
+
+    def size(self) -> int:
+        return self.publishedState[2]
+
+    def get_heap_data(self) -> List[City]:
+        """
+        Return the latest published List of City Objects in heap order.
+        """
+        return self.publishedState[0]
+
+    def get_root_city(self):
+        cities, _, size = self.publishedState
+        return cities[0] if size > 0 else None
+
+    def top_k(self, k) -> List[City]:
+        """
+        Return the k City Objects with the highest populations of the latest published state in descending order.
+        See AbstractCityHeap.top_k.
+        """
+        cities, keys, size = self.publishedState
+        top_cities: List[City] = []
+        if k <= 0 or size == 0:
+            return top_cities
+
+        frontier = [(DescendingKey(keys[0]), 0)]
+        while frontier and len(top_cities) < k:
+            _, index = heapq.heappop(frontier)
+            top_cities.append(cities[index])
+            for child_index in (2 * index + 1, 2 * index + 2):
+                if child_index < size:
+                    heapq.heappush(frontier, (DescendingKey(keys[child_index]), child_index))
+        return top_cities
@@ -1,5 +1,5 @@
 from abc import ABC, abstractmethod
-from typing import List
+from typing import List, Sequence
 from CityDataManagement.City import City
 
 
@@ -9,7 +9,8 @@ class ICityDataManagerAccess(ABC):
     """
 
     @abstractmethod
-    def create_new_max_city_heap(self, city_data: List[City], recursive: bool, floyd: bool):
+    def create_new_max_city_heap(self, city_data: List[City], recursive: bool, floyd: bool, heap_class=None,
+                                 per_country: bool = False, **heap_options):
         """
         Creation of a Max-City-Heap.
 
@@ -23,14 +24,85 @@ class ICityDataManagerAccess(ABC):
         
         floyd:       Should Floyds algorithm be used for insertion? True = instead of the iterative or recursiv approach Floyds algorithm will be used instead.
                             For removal the approach specified in :param recursiv will be used.
+
+        heap_class:  Heap implementation to be used, e.g. CityMaxHeap or CityColumnarMaxHeap.
+                            None = CityMaxHeap
+
+        per_country:    Should a Max-City-Heap per country be kept next to the global one (see largest_in)?
+                            The heaps share the City Objects of the global heap.
+
+        heap_options:    Further options of the heap implementation, e.g. arity=4 for the CityDaryMaxHeap.
+        """
+        pass
+
+    @abstractmethod
+    def create_new_max_city_heap_from_batches(self, city_data_batches, recursive: bool, heap_class=None,
+                                              per_country: bool = False, **heap_options):
+        """
+        Creation of a Max-City-Heap from a stream of raw City Data batches (e.g. CityDataImporter.iter_batches).
+
+        The heap construction starts with the first batch, the file does not have to be read completely.
+
+        Param:
+        ------
+        cityDataBatches:    Iterable of Lists of raw City Data
+
+        recursive:    Should the heapify be recursive? False = use the iterative approach; True = Recursiv approach
+
+        heap_class:  Heap implementation to be used. None = CityMaxHeap
+
+        per_country:    Should a Max-City-Heap per country be kept next to the global one?
+
+        heap_options:    Further options of the heap implementation, e.g. arity=4 for the CityDaryMaxHeap.
+        """
+        pass
+
+    @abstractmethod
+    def create_new_max_city_heap_in_parallel(self, path_to_file=None, recursive: bool = False, max_workers=None):
+        """
+        Creation of a columnar Max-City-Heap directly from a TSV file with several processes.
+
+        The workers parse the population column into shared memory, a final Floyd pass builds the heap. Malformed rows
+        are skipped, their amount is returned.
+
+        Param:
+        ------
+        pathToFile:    Location of the TSV file. None = file of the CityDataImporter
+
+        recursive:    Should the heapify of later insertions and removals be recursive?
+
+        maxWorkers:    Amount of worker processes. None = amount of CPU cores
         """
         pass
 
     @abstractmethod
-    def get_max_heap_as_list(self) -> List[City]:
+    def refresh_max_city_heap_from_file(self, path_to_file=None, recursive: bool = False, per_country: bool = False):
+        """
+        Bring the Max-City-Heap up to date with a TSV file which changes over time.
+
+        The first call imports the whole file into a CityIndexedMaxHeap. Every further call only applies the records
+        which have been added, removed or changed since the last call (see CityDataChangeDetector) as inserts, removals
+        and population updates. Returns the applied CityDataChange, None after a full import.
+
+        Param:
+        ------
+        pathToFile:    Location of the TSV file. None = file of the CityDataImporter
+
+        recursive:    Should the heapify be recursive?
+
+        per_country:    Should a Max-City-Heap per country be kept next to the global one? Applies to every call: the
+                            heaps of the countries are built or dropped when it differs from the last call.
+        """
+        pass
+
+    @abstractmethod
+    def get_max_heap_as_list(self) -> Sequence[City]:
         """
         Return the maxHeap as a List of Cities. If the heap is empty, return the unsorted Data.
 
+        The result may be shared between calls (see the query cache of the CityDataManager) and must not be changed, it
+        is returned as immutable tuple.
+
         Info: This is part of the exercise.
         """
         pass
@@ -42,6 +114,23 @@ class ICityDataManagerAccess(ABC):
         """
         pass
 
+    @abstractmethod
+    def insert_new_cities_into_max_city_heap(self, city_data):
+        """
+        Insertion of several new Cities (raw City Data: Name / Country / Population) into the Max-City-Heap at once.
+
+        Depending on the size of the batch compared with the heap, the cities are inserted one by one or the heap is
+        rebuilt via Floyds Algorithm.
+        """
+        pass
+
+    @abstractmethod
+    def merge_into_max_city_heap(self, other_city_heap):
+        """
+        Merge all Cities of another City Heap into the Max-City-Heap. The other heap is not changed.
+        """
+        pass
+
     @abstractmethod
     def delete_max_city_heap(self):
         """
@@ -49,6 +138,34 @@ class ICityDataManagerAccess(ABC):
         """
         pass
 
+    @abstractmethod
+    def save_max_city_heap(self, path_to_file):
+        """
+        Save the Max-City-Heap into a binary snapshot file.
+        """
+        pass
+
+    @abstractmethod
+    def load_max_city_heap(self, path_to_file, recursive: bool = False):
+        """
+        Load a Max-City-Heap from a binary snapshot file. The file is memory-mapped, the heap is not built again.
+
+        Param:
+        ------
+        pathToFile:    Location of the snapshot file
+
+        recursive:    Should the heapify of later insertions and removals be recursive?
+        """
+        pass
+
+    @abstractmethod
+    def get_query_cache_statistics(self) -> dict:
+        """
+        Statistics of the cache of the query results: hits, misses, evictions, entries, max_entries, hit_rate and the
+        current heap_version (increased by every mutation, which invalidates all cached results).
+        """
+        pass
+
     @abstractmethod
     def get_highest_population_city(self):
         """
@@ -58,15 +175,117 @@ class ICityDataManagerAccess(ABC):
         """
         pass
 
+    @abstractmethod
+    def top_k(self, k) -> List[City]:
+        """
+        Return the k Cities with the highest Population in descending order. The Max-City-Heap is not changed.
+        """
+        pass
+
+    @abstractmethod
+    def largest_in(self, country) -> City:
+        """
+        Return the City with the highest Population of the given country in O(1).
+
+        Hint:
+        ------
+        Only available if the Max-City-Heap has been created with per_country=True.
+        """
+        pass
+
+    @abstractmethod
+    def top_k_in(self, country, k) -> List[City]:
+        """
+        Return the k Cities with the highest Population of the given country in descending order. No heap is changed.
+
+        Hint:
+        ------
+        Only available if the Max-City-Heap has been created with per_country=True.
+        """
+        pass
+
+    @abstractmethod
+    def top_k_from_iterable(self, records, k) -> List[City]:
+        """
+        Return the k Cities with the highest Population from a stream of raw City Data (e.g.
+        CityDataImporter.iter_records) without building a heap or sorting all records.
+
+        Only a min heap of size k is kept in memory.
+        """
+        pass
+
+    @abstractmethod
+    def get_cities_in_descending_order(self) -> List[City]:
+        """
+        Return all Cities in descending order of Population via an in-place heapsort.
+
+        Hint:
+        ------
+        The Max-City-Heap is drained, it is empty afterwards.
+        """
+        pass
+
+    @abstractmethod
+    def iter_cities_in_descending_order(self):
+        """
+        Return a lazy iterator over the Cities in descending order of Population. Every step removes the City with the
+        highest Population from the Max-City-Heap, cities which are not requested stay in the heap.
+        """
+        pass
+
     @abstractmethod
     def remove_city_with_highest_population(self):
         """
-        Removal of the City with the highest Population.
+        Removal of the City with the highest Population. The removed City is returned.
 
         Info: This is part of the exercise.
         """
         pass
 
+    @abstractmethod
+    def increase_city_population(self, name, country, population):
+        """
+        Increase the Population of a single City in the Max-City-Heap in O(log n).
+
+        Hint:
+        ------
+        Requires a Max-City-Heap created with heap_class=CityIndexedMaxHeap.
+        """
+        pass
+
+    @abstractmethod
+    def decrease_city_population(self, name, country, population):
+        """
+        Decrease the Population of a single City in the Max-City-Heap in O(log n).
+
+        Hint:
+        ------
+        Requires a Max-City-Heap created with heap_class=CityIndexedMaxHeap.
+        """
+        pass
+
+    @abstractmethod
+    def update_city_population(self, name, country, population):
+        """
+        Set the Population of a single City in the Max-City-Heap in O(log n), e.g. for census corrections.
+
+        Hint:
+        ------
+        Requires a Max-City-Heap created with heap_class=CityIndexedMaxHeap.
+        """
+        pass
+
+    @abstractmethod
+    def remove_city(self, name, country):
+        """
+        Removal of a single City (identified by name and country) from the Max-City-Heap in O(log n).
+
+        Hint:
+        ------
+        Requires a Max-City-Heap created with heap_class=CityIndexedMaxHeap.
+        """
+        pass
+
     @abstractmethod
     def transform_raw_city_data_to_unsorted_list_of_cities(self, city_data):
         """
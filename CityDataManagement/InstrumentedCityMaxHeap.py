@@ -0,0 +1,247 @@
+from typing import List, Dict
+from CityDataManagement.City import City
+from CityDataManagement.CityMaxHeap import CityMaxHeap
+
+
+class HeapOperationCounts:
+    """
+    Class with the responsibility to hold the counted work of one kind of heap operation (e.g. all inserts).
+
+    Param:
+    ------
+    calls: how often the operation was called
+
+    comparisons: comparisons of two keys
+
+    swaps: calls of swap_nodes
+
+    storageWrites: writes into the heap storage (a swap writes twice, a hole-based sift writes once per level)
+
+    siftCalls: amount of sifts (heapify_* calls), a recursive sift counts once
+
+    siftLevels: sum of the levels all sifted cities moved, siftLevels / siftCalls = mean sift path length
+
+    maxSiftLength: longest sift path
+
+    maxRecursionDepth: deepest recursion of a recursive sift
+    """
+
+    def __init__(self):
+        self.calls = 0
+        self.comparisons = 0
+        self.swaps = 0
+        self.storageWrites = 0
+        self.siftCalls = 0
+        self.siftLevels = 0
+        self.maxSiftLength = 0
+        self.maxRecursionDepth = 0
+
+    def to_dict(self):
+        return {
+            "calls": self.calls,
+            "comparisons": self.comparisons,
+            "swaps": self.swaps,
+            "storage_writes": self.storageWrites,
+            "sift_calls": self.siftCalls,
+            "mean_sift_length": self.siftLevels / self.siftCalls if self.siftCalls else 0.0,
+            "max_sift_length": self.maxSiftLength,
+            "max_recursion_depth": self.maxRecursionDepth,
+        }
+
+
+class CountingKey:
+    """
+    Wrapper of a heap key which counts every comparison at the heap it belongs to.
+    """
+    __slots__ = ("key", "heap")
+
+    def __init__(self, key, heap: "InstrumentedCityMaxHeap"):
+        self.key = key
+        self.heap = heap
+
+    def __gt__(self, other):
+        self.heap.currentCounts.comparisons += 1
+        return self.key > other.key
+
+    def __ge__(self, other):
+        self.heap.currentCounts.comparisons += 1
+        return self.key >= other.key
+
+    def __lt__(self, other):
+        self.heap.currentCounts.comparisons += 1
+        return self.key < other.key
+
+    def __le__(self, other):
+        self.heap.currentCounts.comparisons += 1
+        return self.key <= other.key
+
+
+class CountingCityList(list):
+    """
+    List of City Objects which counts every write of a single element at the heap it belongs to.
+    """
+
+    def __init__(self, heap: "InstrumentedCityMaxHeap", cities=()):
+        super().__init__(cities)
+        self.heap = heap
+
+    def __setitem__(self, index, city):
+        self.heap.currentCounts.storageWrites += 1
+        super().__setitem__(index, city)
+
+
+class InstrumentedCityMaxHeap(CityMaxHeap):
+    """
+    Class with the responsibility to count the work of a CityMaxHeap per operation (build, insert, remove, ...).
+
+    The CityMaxHeap itself is not changed and has no cost of the counting: this subclass is used instead of it when the
+    work should be counted.
+
+    -Comparisons are counted by the keys: every key is wrapped into a CountingKey
+
+    -Swaps are counted by swap_nodes, the writes of the hole-based sifts by the CountingCityList heap storage
+
+    -Every heapify_* call is one sift, its path length is the amount of levels the sifted City moved
+
+    Hint:
+    -----
+    The counting makes the heap a lot slower, the times of this heap must not be compared with the CityMaxHeap.
+    The Floyd construction works on a counting copy of the raw City Data, not on the given List itself.
+    """
+
+    operationCounts: Dict[str, HeapOperationCounts]
+
+    def __init__(self, raw_city_data: List[City], recursive: bool, floyd: bool):
+        """
+        Creation of a Max-City-Heap with counting of its work.
+
+        :param raw_city_data:    A unsorted List of Cities
+        :param recursive:    Should the heapify be recursiv? False = use the iterative approach; True = Recursiv approach
+        :param floyd:       Should Floyds algorithm be used for insertion? True = instead of the iterative or recursiv approach Floyds algorithm will be used instead.
+        """
+        self.operationCounts = {}
+        self.currentCounts = None
+        self.recursionDepth = 0
+        self.siftActive = False
+        super().__init__(raw_city_data, recursive, floyd)
+
+    def get_operation_counts(self) -> Dict[str, dict]:
+        """
+        Return the counted work of every operation, Key = name of the operation, Value = counts as dictionary.
+        """
+        return {operation: counts.to_dict() for operation, counts in self.operationCounts.items()}
+
+    def reset_operation_counts(self):
+        self.operationCounts = {}
+
+    # ------Counted operations
+
+    def insert_raw_city_data_into_heap(self):
+        self.heapStorage = CountingCityList(self)
+        if self.floyd:
+            self.rawCityData = CountingCityList(self, self.rawCityData)
+        self._count_operation("build", super().insert_raw_city_data_into_heap)
+
+    def insert(self, city):
+        self._count_operation("insert", super().insert, city)
+
+    def insert_many(self, cities):
+        self._count_operation("insert_many", super().insert_many, cities)
+
+    def remove(self):
+        return self._count_operation("remove", super().remove)
+
+    def top_k(self, k) -> List[City]:
+        return self._count_operation("top_k", super().top_k, k)
+
+    def sorted_cities(self) -> List[City]:
+        descending_cities = self._count_operation("sorted_cities", super().sorted_cities)
+        self.heapStorage = CountingCityList(self)
+        return list(descending_cities)
+
+    def _count_operation(self, operation, method, *arguments):
+        """
+        Call the method and count its work as the given operation. Operations called by another operation (e.g. the
+        inserts of the build) are counted as part of the outer operation.
+        """
+        if self.currentCounts is not None:
+            return method(*arguments)
+
+        counts = self.operationCounts.get(operation)
+        if counts is None:
+            counts = self.operationCounts[operation] = HeapOperationCounts()
+        counts.calls += 1
+        self.currentCounts = counts
+        try:
+            return method(*arguments)
+        finally:
+            self.currentCounts = None
+
+    # ------Counted keys and swaps
+
+    def keyFunction(self, city):
+        return CountingKey(city.population, self)
+
+    def swap_nodes(self, fst_node_index, sec_node_index):
+        self.currentCounts.swaps += 1
+        super().swap_nodes(fst_node_index, sec_node_index)
+
+    # ------Counted sifts
+
+    def heapify_up_iterative(self):
+        self._count_sift(super().heapify_up_iterative)
+
+    def heapify_up_recursive(self, index):
+        self._count_recursive_sift(super().heapify_up_recursive, index)
+
+    def heapify_floyd(self, index, amount_of_cities):
+        self._count_sift(super().heapify_floyd, index, amount_of_cities)
+
+    def heapify_down_iterative(self):
+        self._count_sift(super().heapify_down_iterative)
+
+    def heapify_down_recursive(self, index):
+        self._count_recursive_sift(super().heapify_down_recursive, index)
+
+    def _count_sift(self, sift, *arguments):
+        """
+        Call the sift and add its path length: a swap-based sift moves one level per swap, a hole-based sift writes
+        once per level plus once for the sifted City. A sift called by another sift (e.g. heapify_down_iterative
+        delegating to heapify_floyd) is part of the outer one.
+        """
+        if self.siftActive:
+            sift(*arguments)
+            return
+
+        counts = self.currentCounts
+        swaps_before = counts.swaps
+        writes_before = counts.storageWrites
+        self.siftActive = True
+        try:
+            sift(*arguments)
+        finally:
+            self.siftActive = False
+        swaps = counts.swaps - swaps_before
+        hole_writes = counts.storageWrites - writes_before - 2 * swaps
+        sift_length = swaps + max(0, hole_writes - 1)
+
+        counts.siftCalls += 1
+        counts.siftLevels += sift_length
+        if sift_length > counts.maxSiftLength:
+            counts.maxSiftLength = sift_length
+
+    def _count_recursive_sift(self, sift, index):
+        """
+        Count a recursive sift: every recursion step calls the overridden method again, only the outermost call is
+        counted as a sift.
+        """
+        self.recursionDepth += 1
+        try:
+            if self.recursionDepth > self.currentCounts.maxRecursionDepth:
+                self.currentCounts.maxRecursionDepth = self.recursionDepth
+            if self.recursionDepth == 1:
+                self._count_sift(sift, index)
+            else:
+                sift(index)
+        finally:
+            self.recursionDepth -= 1
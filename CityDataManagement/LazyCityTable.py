@@ -0,0 +1,56 @@
+from abc import ABC, abstractmethod
+from typing import List, Dict
+from CityDataManagement.City import City
+
+
+class LazyCityTable(ABC):
+    """
+    Abstract Class with the responsibility to offer stored rows (e.g. of a snapshot or a TSV file) as a List of City
+    Objects for the CityColumnarMaxHeap. A City Object is only created when it is requested.
+
+    -Stored rows: index 0 to amountOfStoredCities - 1, decoded by _decode_city of the subclass
+
+    -Appended cities: cities inserted later are kept in an additional List behind the stored rows
+
+    -Replaced cities: a City put into the released slot of a stored row is kept in replacedCities
+    """
+
+    def __init__(self, amount_of_stored_cities: int):
+        self.amountOfStoredCities = amount_of_stored_cities
+        self.appendedCities: List[City] = []
+        self.replacedCities: Dict[int, City] = {}  # Key = index of a reused stored row, Value = City
+
+    @abstractmethod
+    def _decode_city(self, city_index) -> City:
+        """
+        Create the City Object of a stored row.
+        """
+        pass
+
+    def __len__(self):
+        return self.amountOfStoredCities + len(self.appendedCities)
+
+    def __getitem__(self, city_index) -> City:
+        if city_index >= self.amountOfStoredCities:
+            return self.appendedCities[city_index - self.amountOfStoredCities]
+        if city_index in self.replacedCities:
+            return self.replacedCities[city_index]
+        return self._decode_city(city_index)
+
+    def __iter__(self):
+        for city_index in range(len(self)):
+            yield self[city_index]
+
+    def append(self, city: City):
+        self.appendedCities.append(city)
+
+    def __setitem__(self, city_index, city):
+        """
+        Put a City into a slot, None releases the slot.
+        """
+        if city_index >= self.amountOfStoredCities:
+            self.appendedCities[city_index - self.amountOfStoredCities] = city
+        elif city is None:
+            self.replacedCities.pop(city_index, None)
+        else:
+            self.replacedCities[city_index] = city
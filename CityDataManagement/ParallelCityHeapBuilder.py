@@ -0,0 +1,204 @@
+import mmap
+import os
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import resource_tracker
+from multiprocessing.shared_memory import SharedMemory
+
+from CityDataImport.CityDataImporter import CityDataImporter
+from CityDataManagement.City import City
+from CityDataManagement.CityColumnarMaxHeap import CityColumnarMaxHeap
+from CityDataManagement.LazyCityTable import LazyCityTable
+
+
+class ParallelCityHeapBuilder:
+    """
+    Class with the responsibility to build a columnar Max-City-Heap from a TSV file with several processes.
+
+    1. The file is split into byte ranges at line breaks, one range per worker process.
+
+    2. Every worker counts the lines of its range, so every worker knows where its rows start in the columns.
+
+    3. Every worker parses the population column and the start of every line of its range straight into two
+       shared memory buffers (multiprocessing.shared_memory). Only the buffer names and byte ranges are pickled.
+
+    4. A final Floyd pass over the integer population column builds the heap. The City Objects are created from the
+       memory-mapped file when they are requested.
+
+    Malformed rows (less than three fields or no integer population) are skipped like in the serial import, their
+    amount is kept in amountOfSkippedRows.
+    """
+
+    countingChunkSize = 64 * 1024 * 1024  # bytes per step while counting line breaks
+    amountOfSkippedRows = 0  # malformed rows of the last build
+
+    def __init__(self, max_workers: int = None):
+        self.maxWorkers = max_workers if max_workers is not None else os.cpu_count()
+
+    def build(self, path_to_file=None, recursive: bool = False) -> CityColumnarMaxHeap:
+        """
+        Build the heap from the given TSV file (default: the file of the CityDataImporter).
+
+        :param recursive:    Should the heapify of later insertions and removals be recursiv?
+
+        The amount of skipped malformed rows is stored in amountOfSkippedRows.
+        """
+        if path_to_file is None:
+            path_to_file = CityDataImporter().get_path_to_file()
+
+        byte_ranges = self._split_file(path_to_file)
+        populations = array('q')
+        line_offsets = array('q')
+        self.amountOfSkippedRows = 0
+
+        if byte_ranges:
+            if os.name == "posix":
+                # the workers have to share the resource tracker of this process, otherwise every worker starts its
+                # own tracker which tries to clean up the shared memory buffers a second time
+                resource_tracker.ensure_running()
+
+            with ProcessPoolExecutor(max_workers=len(byte_ranges)) as executor:
+                line_counts = list(executor.map(_count_lines, *self._arguments(path_to_file, byte_ranges)))
+
+                row_offsets = [0]
+                for line_count in line_counts:
+                    row_offsets.append(row_offsets[-1] + line_count)
+                amount_of_rows = row_offsets[-1]
+
+                population_memory = SharedMemory(create=True, size=max(8, 8 * amount_of_rows))
+                line_offset_memory = SharedMemory(create=True, size=max(8, 8 * amount_of_rows))
+                try:
+                    parsed_rows = list(executor.map(_parse_byte_range,
+                                                     *self._arguments(path_to_file, byte_ranges),
+                                                     [population_memory.name] * len(byte_ranges),
+                                                     [line_offset_memory.name] * len(byte_ranges),
+                                                     row_offsets[:-1]))
+
+                    # blank and malformed lines are counted but not written, the columns are copied without these gaps
+                    for row_offset, (amount_of_written_rows, amount_of_skipped_rows) in zip(row_offsets, parsed_rows):
+                        self.amountOfSkippedRows += amount_of_skipped_rows
+                        start, end = 8 * row_offset, 8 * (row_offset + amount_of_written_rows)
+                        populations.frombytes(population_memory.buf[start:end])
+                        line_offsets.frombytes(line_offset_memory.buf[start:end])
+                finally:
+                    population_memory.close()
+                    population_memory.unlink()
+                    line_offset_memory.close()
+                    line_offset_memory.unlink()
+
+        city_table = TsvCityTable(path_to_file, line_offsets, populations)
+        return CityColumnarMaxHeap.from_columns(city_table, populations[:], recursive)
+
+    def _split_file(self, path_to_file):
+        """
+        Split the file into up to maxWorkers byte ranges, every range ends behind a line break.
+        """
+        file_size = os.path.getsize(path_to_file)
+        if file_size == 0:
+            return []
+
+        byte_ranges = []
+        with open(path_to_file, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped_file:
+            range_size = max(1, file_size // self.maxWorkers)
+            start = 0
+            while start < file_size:
+                line_break = mapped_file.find(b'\n', min(start + range_size, file_size) - 1)
+                end = file_size if line_break == -1 else line_break + 1
+                byte_ranges.append((start, end))
+                start = end
+        return byte_ranges
+
+    def _arguments(self, path_to_file, byte_ranges):
+        return [path_to_file] * len(byte_ranges), [start for start, _ in byte_ranges], [end for _, end in byte_ranges]
+
+
+def _count_lines(path_to_file, start, end):
+    """
+    Worker: return the amount of lines in the byte range (an upper bound of the amount of rows).
+    """
+    line_count = 0
+    with open(path_to_file, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped_file:
+        for chunk_start in range(start, end, ParallelCityHeapBuilder.countingChunkSize):
+            chunk_end = min(chunk_start + ParallelCityHeapBuilder.countingChunkSize, end)
+            line_count += mapped_file[chunk_start:chunk_end].count(b'\n')
+        if mapped_file[end - 1:end] != b'\n':  # last line of the file without line break
+            line_count += 1
+    return line_count
+
+
+def _parse_byte_range(path_to_file, start, end, population_memory_name, line_offset_memory_name, row_offset):
+    """
+    Worker: parse the population and the start of every line in the byte range into the shared memory buffers,
+    beginning at row_offset. Returns the amount of written rows and the amount of skipped malformed rows.
+    """
+    population_memory = SharedMemory(name=population_memory_name)
+    line_offset_memory = SharedMemory(name=line_offset_memory_name)
+    populations = population_memory.buf.cast('q')
+    line_offsets = line_offset_memory.buf.cast('q')
+    row_index = row_offset
+    amount_of_skipped_rows = 0
+    try:
+        with open(path_to_file, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped_file:
+            position = start
+            while position < end:
+                line_end = mapped_file.find(b'\n', position, end)
+                if line_end == -1:
+                    line_end = end
+                line = mapped_file[position:line_end].rstrip(b'\r')
+                if line:
+                    population = _parse_population(line)
+                    if population is None:
+                        amount_of_skipped_rows += 1
+                    else:
+                        populations[row_index] = population
+                        line_offsets[row_index] = position
+                        row_index += 1
+                position = line_end + 1
+    finally:
+        populations.release()
+        line_offsets.release()
+        population_memory.close()
+        line_offset_memory.close()
+    return row_index - row_offset, amount_of_skipped_rows
+
+
+def _parse_population(line):
+    """
+    Return the population (third field) of a line, None if the line has less than three fields or the population is
+    no integer.
+    """
+    name_end = line.find(b'\t')
+    country_end = line.find(b'\t', name_end + 1) if name_end != -1 else -1
+    if country_end == -1:
+        return None
+    population_end = line.find(b'\t', country_end + 1)
+    try:
+        return int(line[country_end + 1:population_end if population_end != -1 else len(line)])
+    except ValueError:
+        return None
+
+
+class TsvCityTable(LazyCityTable):
+    """
+    Class with the responsibility to offer the rows of a memory-mapped TSV file as a List of City Objects.
+
+    Only the start of every line and the populations are kept, name and country are read from the file when a City
+    is requested (see LazyCityTable).
+    """
+
+    def __init__(self, path_to_file, line_offsets, populations):
+        super().__init__(len(line_offsets))
+        self.lineOffsets = line_offsets
+        self.populations = populations
+        self.mappedFile = None
+        if self.amountOfStoredCities > 0:
+            with open(path_to_file, "rb") as f:
+                self.mappedFile = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+    def _decode_city(self, city_index) -> City:
+        line_start = self.lineOffsets[city_index]
+        line_end = self.mappedFile.find(b'\n', line_start)
+        if line_end == -1:
+            line_end = len(self.mappedFile)
+        fields = self.mappedFile[line_start:line_end].split(b'\t')
+        return City(fields[0].decode("utf-8"), fields[1].decode("utf-8"), self.populations[city_index])
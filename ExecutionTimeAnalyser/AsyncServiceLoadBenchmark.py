@@ -0,0 +1,101 @@
+import argparse
+import asyncio
+import math
+import random
+import statistics
+import time
+
+from CityDataImport.CityDataImporter import CityDataImporter
+from CityDataManagement.AsyncCityHeapService import AsyncCityHeapService
+from CityDataManagement.CityDataManager import CityDataManager
+
+
+class AsyncServiceLoadBenchmark:
+    """
+    Class with the responsibility to put local load on the AsyncCityHeapService and to report throughput and latency.
+
+    Several simulated clients send their requests concurrently, each client waits for the answer of its request
+    before it sends the next one. The kind of every request is chosen randomly with the given shares.
+    """
+
+    requestShares = {"peek": 0.4, "top_k": 0.2, "insert": 0.3, "pop_max": 0.1}
+    topK = 10
+
+    def __init__(self, amount_of_clients: int = 100, requests_per_client: int = 200, seed: int = 0):
+        self.amountOfClients = amount_of_clients
+        self.requestsPerClient = requests_per_client
+        self.random = random.Random(seed)
+        self.cityData = CityDataImporter().import_from_file()
+        self.latenciesNs = {kind: [] for kind in self.requestShares}
+
+    def run(self):
+        city_data_manager = CityDataManager(verbose=False)
+        city_data_manager.create_new_max_city_heap(self.cityData, False, True)
+        return asyncio.run(self._run_clients(AsyncCityHeapService(city_data_manager)))
+
+    async def _run_clients(self, service: AsyncCityHeapService):
+        start_time_ns = time.perf_counter_ns()
+        await asyncio.gather(*(self._run_client(service, client) for client in range(self.amountOfClients)))
+        await service.flush()
+        duration_s = (time.perf_counter_ns() - start_time_ns) / 1_000_000_000
+
+        amount_of_requests = self.amountOfClients * self.requestsPerClient
+        return {
+            "requests": amount_of_requests,
+            "duration_s": duration_s,
+            "throughput_per_s": amount_of_requests / duration_s,
+            "mutation_batches": service.appliedBatches,
+            "latencies": {kind: self._get_percentiles(latencies_ns)
+                          for kind, latencies_ns in self.latenciesNs.items() if latencies_ns},
+        }
+
+    async def _run_client(self, service: AsyncCityHeapService, client):
+        kinds = list(self.requestShares)
+        weights = list(self.requestShares.values())
+        for request in range(self.requestsPerClient):
+            kind = self.random.choices(kinds, weights)[0]
+            start_time_ns = time.perf_counter_ns()
+            if kind == "peek":
+                await service.peek()
+            elif kind == "top_k":
+                await service.top_k(self.topK)
+            elif kind == "insert":
+                await service.insert("Client " + str(client) + " City " + str(request), "Benchmark",
+                                     self.random.randint(0, 10_000_000))
+            else:
+                await service.pop_max()
+            self.latenciesNs[kind].append(time.perf_counter_ns() - start_time_ns)
+
+    def _get_percentiles(self, latencies_ns):
+        sorted_latencies_ns = sorted(latencies_ns)
+
+        def percentile_ms(percent):
+            rank = max(1, math.ceil(percent / 100 * len(sorted_latencies_ns)))
+            return sorted_latencies_ns[rank - 1] / 1_000_000
+
+        return {"count": len(sorted_latencies_ns), "mean_ms": statistics.mean(sorted_latencies_ns) / 1_000_000,
+                "p50_ms": percentile_ms(50), "p95_ms": percentile_ms(95), "p99_ms": percentile_ms(99),
+                "max_ms": sorted_latencies_ns[-1] / 1_000_000}
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Load generator for the AsyncCityHeapService.")
+    parser.add_argument("--clients", type=int, default=100, help="amount of concurrent clients")
+    parser.add_argument("--requests", type=int, default=200, help="amount of requests per client")
+    parser.add_argument("--seed", type=int, default=0, help="seed of the random request mix")
+    arguments = parser.parse_args(argv)
+
+    report = AsyncServiceLoadBenchmark(arguments.clients, arguments.requests, arguments.seed).run()
+    print(str(report["requests"]) + " requests in " + ("%.3f" % report["duration_s"]) + " s: "
+          + ("%.0f" % report["throughput_per_s"]) + " requests per second, "
+          + str(report["mutation_batches"]) + " batches of mutations")
+    print("request".ljust(10) + "count".rjust(8) + "mean ms".rjust(10) + "p50 ms".rjust(10) + "p95 ms".rjust(10)
+          + "p99 ms".rjust(10) + "max ms".rjust(10))
+    for kind, percentiles in report["latencies"].items():
+        print(kind.ljust(10) + str(percentiles["count"]).rjust(8)
+              + "".join(("%.3f" % percentiles[name]).rjust(10)
+                        for name in ("mean_ms", "p50_ms", "p95_ms", "p99_ms", "max_ms")))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,225 @@
+import csv
+import gc
+import json
+import math
+import platform
+import statistics
+import time
+from typing import List, Dict
+
+
+class BenchmarkResult:
+    """
+    Class with the responsibility to hold the measured times of one benchmark (one operation at one input size) and
+    to offer the statistics of these times.
+
+    Param:
+    ------
+    name: str: name of the measured operation
+
+    size: int: input size of the measurement (None if the operation has no size)
+
+    timingsNs: List[int]: measured time of every repetition in nanoseconds
+
+    operationCounts: Dict[str, dict]: counted work per heap operation (see InstrumentedCityMaxHeap), None if not counted
+    """
+
+    def __init__(self, name: str, size, timings_ns: List[int], operation_counts: Dict[str, dict] = None):
+        self.name = name
+        self.size = size
+        self.timingsNs = timings_ns
+        self.operationCounts = operation_counts
+
+    @property
+    def min_ms(self):
+        return min(self.timingsNs) / 1_000_000
+
+    @property
+    def mean_ms(self):
+        return statistics.mean(self.timingsNs) / 1_000_000
+
+    @property
+    def median_ms(self):
+        return statistics.median(self.timingsNs) / 1_000_000
+
+    @property
+    def p95_ms(self):
+        """
+        95th percentile (nearest rank) of the measured times.
+        """
+        sorted_timings_ns = sorted(self.timingsNs)
+        rank = math.ceil(0.95 * len(sorted_timings_ns))
+        return sorted_timings_ns[rank - 1] / 1_000_000
+
+    @property
+    def stddev_ms(self):
+        if len(self.timingsNs) < 2:
+            return 0.0
+        return statistics.stdev(self.timingsNs) / 1_000_000
+
+    def to_dict(self):
+        result = {
+            "name": self.name,
+            "size": self.size,
+            "repetitions": len(self.timingsNs),
+            "min_ms": self.min_ms,
+            "median_ms": self.median_ms,
+            "mean_ms": self.mean_ms,
+            "p95_ms": self.p95_ms,
+            "stddev_ms": self.stddev_ms,
+        }
+        # the counts are flattened (e.g. build_comparisons), so they fit into a CSV row next to the times
+        for operation, counts in (self.operationCounts or {}).items():
+            for counter, value in counts.items():
+                result[operation + "_" + counter] = value
+        return result
+
+
+class BenchmarkHarness:
+    """
+    Class with the responsibility to measure execution times in a statistically sound way.
+
+    -Warm-up runs are executed before the measurement and are not counted
+
+    -The setup (e.g. import and conversion of the data) is executed before every repetition but not measured
+
+    -Every operation is repeated, the results offer median, p95 and standard deviation
+
+    -The garbage collector is disabled while measuring, like timeit does
+
+    -The results can be written to JSON/CSV files and compared with earlier runs
+    """
+
+    warmupRuns = 2
+    repetitions = 10
+
+    def __init__(self, warmup_runs: int = None, repetitions: int = None):
+        if warmup_runs is not None:
+            self.warmupRuns = warmup_runs
+        if repetitions is not None:
+            self.repetitions = repetitions
+        self.results: List[BenchmarkResult] = []
+
+    def measure(self, name: str, setup, operation, size=None, count_operation=None) -> BenchmarkResult:
+        """
+        Measure an operation.
+
+        Param:
+        ------
+        setup: callable without arguments, its return value is passed to the operation. Not measured.
+
+        operation: callable with the return value of setup as only argument. Measured.
+
+        count_operation: callable with the return value of setup as only argument, returns the counted work of the
+        operation (e.g. InstrumentedCityMaxHeap.get_operation_counts). Executed once after the measurement, so the
+        counting does not change the measured times. None = no counting.
+        """
+        for _ in range(self.warmupRuns):
+            operation(setup())
+
+        timings_ns = []
+        for _ in range(self.repetitions):
+            data = setup()
+            gc_was_enabled = gc.isenabled()
+            gc.disable()
+            try:
+                start_time_ns = time.perf_counter_ns()
+                operation(data)
+                end_time_ns = time.perf_counter_ns()
+            finally:
+                if gc_was_enabled:
+                    gc.enable()
+            timings_ns.append(end_time_ns - start_time_ns)
+
+        operation_counts = count_operation(setup()) if count_operation is not None else None
+
+        result = BenchmarkResult(name, size, timings_ns, operation_counts)
+        self.results.append(result)
+        return result
+
+    def measure_sizes(self, name: str, setup_for_size, operation, sizes, count_operation=None) -> List[BenchmarkResult]:
+        """
+        Measure an operation for several input sizes, setup_for_size gets the size and returns the data.
+        """
+        return [self.measure(name, lambda size=size: setup_for_size(size), operation, size, count_operation)
+                for size in sizes]
+
+    def print_results(self, results: List[BenchmarkResult] = None):
+        """
+        Print the results as a table to the console.
+        """
+        if results is None:
+            results = self.results
+        print("name".ljust(24) + "size".rjust(10) + "median ms".rjust(12) + "p95 ms".rjust(12)
+              + "stddev ms".rjust(12))
+        for result in results:
+            print(result.name.ljust(24) + str(result.size).rjust(10) + ("%.3f" % result.median_ms).rjust(12)
+                  + ("%.3f" % result.p95_ms).rjust(12) + ("%.3f" % result.stddev_ms).rjust(12))
+
+    def print_operation_counts(self, results: List[BenchmarkResult] = None):
+        """
+        Print the counted work of every operation of the results next to their median time.
+        """
+        if results is None:
+            results = self.results
+        print("name".ljust(24) + "size".rjust(10) + "operation".rjust(14) + "median ms".rjust(12)
+              + "comparisons".rjust(14) + "swaps".rjust(12) + "writes".rjust(12) + "mean sift".rjust(12)
+              + "max depth".rjust(12))
+        for result in results:
+            for operation, counts in (result.operationCounts or {}).items():
+                print(result.name.ljust(24) + str(result.size).rjust(10) + operation.rjust(14)
+                      + ("%.3f" % result.median_ms).rjust(12) + str(counts["comparisons"]).rjust(14)
+                      + str(counts["swaps"]).rjust(12) + str(counts["storage_writes"]).rjust(12)
+                      + ("%.2f" % counts["mean_sift_length"]).rjust(12) + str(counts["max_recursion_depth"]).rjust(12))
+
+    def write_json(self, path_to_file, results: List[BenchmarkResult] = None):
+        """
+        Write the results with the raw timings and information about the machine into a JSON file.
+        """
+        if results is None:
+            results = self.results
+        report = {
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "created": time.strftime("%Y-%m-%dT%H:%M:%S"),
+            "warmup_runs": self.warmupRuns,
+            "results": [dict(result.to_dict(), timings_ns=result.timingsNs) for result in results],
+        }
+        with open(path_to_file, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2)
+
+    def write_csv(self, path_to_file, results: List[BenchmarkResult] = None):
+        """
+        Write the statistics of the results into a CSV file, one row per result.
+        """
+        if results is None:
+            results = self.results
+        rows = [result.to_dict() for result in results]
+        fieldnames = []
+        for row in rows:  # the results can have different counts, every column is written once
+            fieldnames.extend(field for field in row if field not in fieldnames)
+        with open(path_to_file, "w", encoding="utf-8", newline="") as f:
+            writer = csv.DictWriter(f, fieldnames=fieldnames if rows else ["name"])
+            writer.writeheader()
+            writer.writerows(rows)
+
+    def compare_with_json(self, path_to_file, tolerance=0.1, results: List[BenchmarkResult] = None):
+        """
+        Compare the medians with an earlier JSON report and print every result that got slower than the tolerance
+        (0.1 = 10 %). Returns the List of (name, size, old median, new median) of the regressions.
+        """
+        if results is None:
+            results = self.results
+        with open(path_to_file, encoding="utf-8") as f:
+            earlier_results = {(entry["name"], entry["size"]): entry for entry in json.load(f)["results"]}
+
+        regressions = []
+        for result in results:
+            earlier_result = earlier_results.get((result.name, result.size))
+            if earlier_result is None:
+                continue
+            if result.median_ms > earlier_result["median_ms"] * (1 + tolerance):
+                regressions.append((result.name, result.size, earlier_result["median_ms"], result.median_ms))
+                print("Regression:", result.name, "size", result.size, "median",
+                      round(earlier_result["median_ms"], 3), "->", round(result.median_ms, 3), "milliseconds")
+        return regressions
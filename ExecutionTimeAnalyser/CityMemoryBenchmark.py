@@ -0,0 +1,57 @@
+import gc
+import tracemalloc
+
+from CityDataImport.CityDataImporter import CityDataImporter
+from CityDataManagement.City import City
+
+
+class DictCity:
+    """
+    The former representation of a city (per-instance dictionary, no interning), only kept for the comparison.
+    """
+    name = "No data available"
+    country = "No data available"
+    population = "No data available"
+
+    def __init__(self, name, country, population):
+        self.name = name
+        self.country = country
+        self.population = int(population)
+
+
+class CityMemoryBenchmark:
+    """
+    Class with the responsibility to measure the memory needed per city for the whole data set.
+
+    The raw City Data is imported, converted into City Objects and released again, so only the memory kept alive by
+    the City Objects (the objects themselves, names, countries and populations) is counted.
+    """
+
+    def run(self):
+        importer = CityDataImporter()
+        dict_bytes_per_city = self.measure_bytes_per_city(importer, DictCity)
+        slots_bytes_per_city = self.measure_bytes_per_city(importer, City)
+
+        print("Bytes per city with __dict__:", round(dict_bytes_per_city, 1))
+        print("Bytes per city with __slots__ and interned countries:", round(slots_bytes_per_city, 1))
+        print("Saving:", round(100 * (1 - slots_bytes_per_city / dict_bytes_per_city), 1), "%")
+
+    def measure_bytes_per_city(self, importer: CityDataImporter, city_class):
+        """
+        Return the traced memory per City Object of the given class in bytes.
+        """
+        gc.collect()
+        tracemalloc.start()
+
+        city_data = importer.import_from_file()
+        cities = [city_class(city_entry[0], city_entry[1], city_entry[2]) for city_entry in city_data]
+        del city_data
+        gc.collect()
+
+        traced_memory, _ = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        return traced_memory / len(cities)
+
+
+if __name__ == '__main__':
+    CityMemoryBenchmark().run()
@@ -0,0 +1,139 @@
+import argparse
+import math
+import random
+import threading
+import time
+
+from CityDataImport.CityDataImporter import CityDataImporter
+from CityDataManagement.City import City
+from CityDataManagement.CityDataManager import CityDataManager
+from CityDataManagement.CityMaxHeap import CityMaxHeap
+from CityDataManagement.ConcurrentCityMaxHeap import ConcurrentCityMaxHeap
+
+
+class LockedCityMaxHeap(CityMaxHeap):
+    """
+    Baseline: one lock for readers and writers, every reader blocks the writer and the other readers.
+    """
+
+    def __init__(self, raw_city_data, recursive, floyd):
+        self.lock = threading.RLock()
+        super().__init__(raw_city_data, recursive, floyd)
+
+    def batch_mutations(self):
+        return self.lock
+
+    def insert_many(self, cities):
+        with self.lock:
+            super().insert_many(cities)
+
+    def remove(self):
+        with self.lock:
+            return super().remove()
+
+    def top_k(self, k):
+        with self.lock:
+            return super().top_k(k)
+
+
+class ConcurrentHeapStressBenchmark:
+    """
+    Class with the responsibility to stress a heap with several reader threads and one writer thread, like a web tier
+    which serves reads from worker threads while a background thread applies updates.
+
+    -The writer inserts batches of new cities and removes the same amount of cities with the highest population,
+     every batch is one group of mutations (batch_mutations)
+
+    -Every reader calls top_k and checks the result: the populations must be in descending order
+
+    Reported are the writer throughput, the reads per second, the read latency percentiles and the amount of
+    inconsistent reads of the ConcurrentCityMaxHeap and of the LockedCityMaxHeap baseline.
+    """
+
+    heapClasses = {"concurrent": ConcurrentCityMaxHeap, "locked": LockedCityMaxHeap}
+    topK = 10
+
+    def __init__(self, amount_of_readers: int = 8, duration_s: float = 2.0, batch_size: int = 100, seed: int = 0):
+        self.amountOfReaders = amount_of_readers
+        self.durationS = duration_s
+        self.batchSize = batch_size
+        self.seed = seed
+        self.cityData = CityDataImporter().import_from_file()
+
+    def run(self):
+        return {name: self._stress(heap_class) for name, heap_class in self.heapClasses.items()}
+
+    def _stress(self, heap_class):
+        cities = CityDataManager(verbose=False).transform_raw_city_data_to_unsorted_list_of_cities(self.cityData)
+        city_heap = heap_class(cities, False, True)
+        stop_event = threading.Event()
+        writer_updates = [0]
+        reader_latencies_ns = [[] for _ in range(self.amountOfReaders)]
+        inconsistent_reads = [0] * self.amountOfReaders
+
+        threads = [threading.Thread(target=self._write, args=(city_heap, stop_event, writer_updates))]
+        threads += [threading.Thread(target=self._read, args=(city_heap, stop_event, reader_latencies_ns[reader],
+                                                              inconsistent_reads, reader))
+                    for reader in range(self.amountOfReaders)]
+        for thread in threads:
+            thread.start()
+        time.sleep(self.durationS)
+        stop_event.set()
+        for thread in threads:
+            thread.join()
+
+        latencies_ns = sorted(latency_ns for latencies in reader_latencies_ns for latency_ns in latencies)
+        return {
+            "writer_updates_per_s": writer_updates[0] / self.durationS,
+            "reads_per_s": len(latencies_ns) / self.durationS,
+            "read_p50_ms": self._percentile_ms(latencies_ns, 50),
+            "read_p99_ms": self._percentile_ms(latencies_ns, 99),
+            "read_max_ms": latencies_ns[-1] / 1_000_000 if latencies_ns else 0.0,
+            "inconsistent_reads": sum(inconsistent_reads),
+        }
+
+    def _write(self, city_heap, stop_event, writer_updates):
+        generator = random.Random(self.seed)
+        batch_number = 0
+        while not stop_event.is_set():
+            batch = [City("Update " + str(batch_number) + "-" + str(i), "Stress", generator.randint(0, 10_000_000))
+                     for i in range(self.batchSize)]
+            with city_heap.batch_mutations():
+                city_heap.insert_many(batch)
+                for _ in range(self.batchSize):
+                    city_heap.remove()
+            writer_updates[0] += 2 * self.batchSize
+            batch_number += 1
+
+    def _read(self, city_heap, stop_event, latencies_ns, inconsistent_reads, reader):
+        while not stop_event.is_set():
+            start_time_ns = time.perf_counter_ns()
+            top_cities = city_heap.top_k(self.topK)
+            latencies_ns.append(time.perf_counter_ns() - start_time_ns)
+            if any(top_cities[i].population < top_cities[i + 1].population for i in range(len(top_cities) - 1)):
+                inconsistent_reads[reader] += 1
+
+    def _percentile_ms(self, sorted_latencies_ns, percent):
+        if not sorted_latencies_ns:
+            return 0.0
+        rank = max(1, math.ceil(percent / 100 * len(sorted_latencies_ns)))
+        return sorted_latencies_ns[rank - 1] / 1_000_000
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Multi-threaded stress benchmark of the concurrent City heap.")
+    parser.add_argument("--readers", type=int, default=8, help="amount of reader threads")
+    parser.add_argument("--duration", type=float, default=2.0, help="duration of every run in seconds")
+    parser.add_argument("--batch-size", type=int, default=100, help="cities per batch of the writer thread")
+    arguments = parser.parse_args(argv)
+
+    report = ConcurrentHeapStressBenchmark(arguments.readers, arguments.duration, arguments.batch_size).run()
+    columns = ("writer_updates_per_s", "reads_per_s", "read_p50_ms", "read_p99_ms", "read_max_ms",
+               "inconsistent_reads")
+    print("heap".ljust(12) + "".join(column.rjust(22) for column in columns))
+    for name, result in report.items():
+        print(name.ljust(12) + "".join(("%.3f" % result[column]).rjust(22) for column in columns))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,83 @@
+from typing import List
+
+from CityDataImport.CityDataImporter import CityDataImporter
+from CityDataManagement.City import City
+from CityDataManagement.CityDaryMaxHeap import CityDaryMaxHeap
+from CityDataManagement.CityDataManager import CityDataManager
+from ExecutionTimeAnalyser.BenchmarkHarness import BenchmarkHarness
+
+
+class DaryHeapBenchmark:
+    """
+    Class with the responsibility to compare the arities of the CityDaryMaxHeap on the city data set.
+
+    Measured operations (median of several repetitions via the BenchmarkHarness, in milliseconds):
+
+    -Floyd build: construction of the heap via Floyds Algorithm
+
+    -Insert build: construction by inserting every City one by one (sift-up)
+
+    -Remove: removal of the City with the highest population for a tenth of the cities (sift-down)
+
+    -Insert-heavy: a workload with ten insertions per removal on a built heap
+
+    The copies of the cities and the heaps of the remove and insert-heavy workloads are created by the setup of the
+    harness, so they are not measured.
+    """
+
+    arities = (2, 4, 8)
+    repetitions = 3
+    operations = ("Floyd build", "Insert build", "Remove", "Insert-heavy")
+
+    def __init__(self, harness: BenchmarkHarness = None):
+        self.harness = harness if harness is not None else BenchmarkHarness(warmup_runs=1,
+                                                                            repetitions=self.repetitions)
+
+    def run(self):
+        city_data = CityDataImporter().import_from_file()
+        cities = CityDataManager().transform_raw_city_data_to_unsorted_list_of_cities(city_data)
+        size = len(cities)
+
+        for arity in self.arities:
+            self.harness.measure(self._name("Floyd build", arity), cities.copy,
+                                 lambda unsorted_cities, a=arity: CityDaryMaxHeap(unsorted_cities, False, True, a),
+                                 size)
+            self.harness.measure(self._name("Insert build", arity), cities.copy,
+                                 lambda unsorted_cities, a=arity: CityDaryMaxHeap(unsorted_cities, False, False, a),
+                                 size)
+            self.harness.measure(self._name("Remove", arity), lambda a=arity: self._build(cities, a),
+                                 lambda heap: self._remove_cities(heap, size // 10), size)
+            self.harness.measure(self._name("Insert-heavy", arity), lambda a=arity: self._build(cities, a),
+                                 lambda heap: self._insert_heavy_workload(heap, cities), size)
+        self.print_matrix()
+        return self.harness.results
+
+    def print_matrix(self):
+        """
+        Print the median times as matrix: one row per arity, one column per operation.
+        """
+        medians = {result.name: result.median_ms for result in self.harness.results}
+        print("arity".ljust(8) + "".join(operation.rjust(14) for operation in self.operations))
+        for arity in self.arities:
+            print(str(arity).ljust(8) + "".join(str(round(medians[self._name(operation, arity)], 2)).rjust(14)
+                                                for operation in self.operations))
+
+    def _name(self, operation, arity):
+        return operation + " d=" + str(arity)
+
+    def _build(self, cities: List[City], arity) -> CityDaryMaxHeap:
+        return CityDaryMaxHeap(cities.copy(), False, True, arity)
+
+    def _remove_cities(self, heap: CityDaryMaxHeap, amount_of_cities):
+        for _ in range(amount_of_cities):
+            heap.remove()
+
+    def _insert_heavy_workload(self, heap: CityDaryMaxHeap, cities: List[City]):
+        for i, city in enumerate(cities):
+            heap.insert(City(city.name, city.country, city.population))
+            if i % 10 == 9:
+                heap.remove()
+
+
+if __name__ == '__main__':
+    DaryHeapBenchmark().run()
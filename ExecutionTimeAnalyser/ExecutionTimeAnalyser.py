@@ -5,6 +5,9 @@ import timeit
 class ExecutionTimeAnalyser:
     """
     Class with the responsibility to offer a time measurement in milliseconds.
+
+    The measurement uses the monotonic high resolution clock time.perf_counter_ns. For repeated measurements with
+    warm-up, median and p95 see BenchmarkHarness.
     """
 
     startTime = 0
@@ -15,21 +18,23 @@ class ExecutionTimeAnalyser:
         """
         Begin time measurement.
         """
-        self.startTime = time.time()
+        self.startTime = time.perf_counter_ns()
 
-    def stop(self, message=""):
+    def stop(self, message="", print_to_console: bool = True):
         """
-        Stop time measurement and trigger calculation and print to console.
+        Stop time measurement and trigger calculation and print to console. Returns the elapsed time in milliseconds.
         """
-        self.endTime = time.time()
+        self.endTime = time.perf_counter_ns()
         self._calculate_elapsed_time_in_ms()
-        self._print_elapsed_time_to_console(message)
+        if print_to_console:
+            self._print_elapsed_time_to_console(message)
+        return self.elapsed_time_ms
 
     def _calculate_elapsed_time_in_ms(self):
         """
         Calculate measured time in milliseconds.
         """
-        self.elapsed_time_ms = (self.endTime - self.startTime) * 1000
+        self.elapsed_time_ms = (self.endTime - self.startTime) / 1_000_000
 
     def _print_elapsed_time_to_console(self, message):
         """
@@ -40,18 +45,19 @@ class ExecutionTimeAnalyser:
     def measure_execution_time_via_timeit(self, repetitions):
         """
         Alternative, more expensive (due to several repetitions) but also more accurate measurement of the execution time.
+
+        The import of the file and the creation of the manager are part of the setup and are not measured.
         """
 
         setup_code = """
-from math import factorial
-from CityDataImport.CityDataImporter import CityDataImporter 
+from CityDataImport.CityDataImporter import CityDataImporter
 from CityDataManagement.CityDataManager import CityDataManager
-        """
-
-        statement = """
 importer = CityDataImporter()
 city_manager = CityDataManager()
 city_data = importer.import_from_file()
+        """
+
+        statement = """
 city_manager.create_new_max_city_heap(city_data, False, True)"""
 
         execution_time = timeit.timeit(setup=setup_code, stmt=statement, number=repetitions)
@@ -0,0 +1,87 @@
+import random
+import sys
+from typing import List
+
+from CityDataManagement.City import City
+from CityDataManagement.CityMaxHeap import CityMaxHeap
+from ExecutionTimeAnalyser.BenchmarkHarness import BenchmarkHarness, BenchmarkResult
+
+
+class FloydScalingBenchmark:
+    """
+    Class with the responsibility to show that the heap construction via Floyds Algorithm scales linearly.
+
+    For every size a List of synthetic cities is created, the heap is built in place over this List and the median
+    time per city is printed. With a linear build the time per city stays (roughly) constant while the size grows.
+    The times are measured with the BenchmarkHarness.
+
+    Hint:
+    -----
+    10M synthetic City Objects need several GB of memory, pass smaller sizes on the command line if needed:
+    python -m ExecutionTimeAnalyser.FloydScalingBenchmark 10000 100000 1000000
+    """
+
+    sizes = (10_000, 100_000, 1_000_000, 10_000_000)
+    repetitions = 3
+    seed = 42
+
+    def __init__(self, harness: BenchmarkHarness = None):
+        self.harness = harness if harness is not None else BenchmarkHarness(warmup_runs=0,
+                                                                            repetitions=self.repetitions)
+
+    def run(self, sizes=None):
+        if sizes is None:
+            sizes = self.sizes
+
+        results = []
+        for amount_of_cities in sizes:
+            synthetic_cities = self.create_synthetic_cities(amount_of_cities)
+            elapsed_time_ms = self.measure_floyd_build(synthetic_cities).median_ms
+            results.append((amount_of_cities, elapsed_time_ms))
+            self._print_result(amount_of_cities, elapsed_time_ms, results[0])
+        return results
+
+    def create_synthetic_cities(self, amount_of_cities: int) -> List[City]:
+        """
+        Create a List of cities with random populations, the names are only numbered.
+        """
+        random_generator = random.Random(self.seed)
+        return [City("City " + str(i), "Synthetica", random_generator.randint(0, 40_000_000))
+                for i in range(amount_of_cities)]
+
+    def measure_floyd_build(self, synthetic_cities: List[City]) -> BenchmarkResult:
+        """
+        Build the heap several times via the BenchmarkHarness.
+
+        The build happens in place, so the (not measured) setup of every repetition copies the unsorted List. The heap
+        conditions are checked once on an additional build.
+        """
+        self._check_heap_conditions(CityMaxHeap(synthetic_cities.copy(), False, True))
+        return self.harness.measure("floyd build", synthetic_cities.copy,
+                                    lambda unsorted_cities: CityMaxHeap(unsorted_cities, False, True),
+                                    len(synthetic_cities))
+
+    def _check_heap_conditions(self, heap: CityMaxHeap):
+        """
+        Every parent must have at least the population of its children, otherwise the measurement is worthless.
+        """
+        heap_storage = heap.get_heap_data()
+        for index in range(1, len(heap_storage)):
+            if heap_storage[(index - 1) // 2].population < heap_storage[index].population:
+                raise AssertionError("Heap conditions violated at index " + str(index))
+
+    def _print_result(self, amount_of_cities, elapsed_time_ms, first_result):
+        """
+        Print Data to console, the growth is compared with the first (smallest) size.
+        """
+        first_amount_of_cities, first_time_ms = first_result
+        size_factor = amount_of_cities / first_amount_of_cities
+        time_factor = elapsed_time_ms / first_time_ms
+        print("Floyd build of", amount_of_cities, "cities:", round(elapsed_time_ms, 2), "milliseconds,",
+              round(elapsed_time_ms * 1_000_000 / amount_of_cities, 1), "ns per city,",
+              "size x" + str(round(size_factor)), "time x" + str(round(time_factor, 1)))
+
+
+if __name__ == '__main__':
+    benchmark_sizes = [int(size) for size in sys.argv[1:]] or None
+    FloydScalingBenchmark().run(benchmark_sizes)
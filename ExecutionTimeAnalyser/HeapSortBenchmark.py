@@ -0,0 +1,47 @@
+import itertools
+
+from CityDataImport.CityDataImporter import CityDataImporter
+from CityDataManagement.CityDataManager import CityDataManager
+from CityDataManagement.CityMaxHeap import CityMaxHeap
+from ExecutionTimeAnalyser.BenchmarkHarness import BenchmarkHarness
+
+
+class HeapSortBenchmark:
+    """
+    Class with the responsibility to compare the ordered export of the CityMaxHeap with the TimSort baseline of
+    HeapCreationAssembler.measure_tim_sort_execution_time.
+
+    -timsort: sort the whole unsorted List of cities
+
+    -heapsort: Floyd construction and in-place heapsort export (sorted_cities)
+
+    -lazy top N: Floyd construction and the first N cities of the lazy drain (iter_descending)
+    """
+
+    lazyAmountsOfCities = (100, 1_000, 5_000)
+
+    def __init__(self, harness: BenchmarkHarness = None):
+        self.harness = harness if harness is not None else BenchmarkHarness()
+        self.cityData = CityDataImporter().import_from_file()
+        self.cityDataManager = CityDataManager()
+
+    def run(self):
+        size = len(self.cityData)
+        self.harness.measure("timsort", self._create_unsorted_cities, lambda cities: cities.sort(reverse=True), size)
+        self.harness.measure("heapsort", self._create_unsorted_cities,
+                             lambda cities: CityMaxHeap(cities, False, True).sorted_cities(), size)
+        for amount_of_cities in self.lazyAmountsOfCities:
+            self.harness.measure("lazy top " + str(amount_of_cities), self._create_unsorted_cities,
+                                 lambda cities, n=amount_of_cities: list(
+                                     itertools.islice(CityMaxHeap(cities, False, True).iter_descending(), n)),
+                                 size)
+        return self.harness.results
+
+    def _create_unsorted_cities(self):
+        return self.cityDataManager.transform_raw_city_data_to_unsorted_list_of_cities(self.cityData)
+
+
+if __name__ == '__main__':
+    benchmark = HeapSortBenchmark()
+    benchmark.run()
+    benchmark.harness.print_results()
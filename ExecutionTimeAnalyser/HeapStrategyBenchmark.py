@@ -0,0 +1,97 @@
+import argparse
+
+from CityDataImport.CityDataImporter import CityDataImporter
+from CityDataManagement.CityDataManager import CityDataManager
+from CityDataManagement.CityMaxHeap import CityMaxHeap
+from CityDataManagement.InstrumentedCityMaxHeap import InstrumentedCityMaxHeap
+from ExecutionTimeAnalyser.BenchmarkHarness import BenchmarkHarness
+
+
+class HeapStrategyBenchmark:
+    """
+    Class with the responsibility to benchmark every strategy HeapCreationAssembler.run exercises:
+    the iterative, recursive and Floyd construction of the CityMaxHeap and Pythons TimSort as baseline.
+
+    Import and conversion of the City Data are part of the (unmeasured) setup, only the construction is measured.
+    The first N cities of the data set are used for every input size.
+
+    With count=True the comparisons, swaps and sift paths of every heap strategy are counted once more with the
+    InstrumentedCityMaxHeap and exported next to the times.
+    """
+
+    strategies = ("iterative", "recursive", "floyd", "timsort")
+
+    def __init__(self, harness: BenchmarkHarness = None):
+        self.harness = harness if harness is not None else BenchmarkHarness()
+        self.cityData = CityDataImporter().import_from_file()
+        self.cityDataManager = CityDataManager()
+
+    def run(self, sizes=None, count=False):
+        if sizes is None:
+            sizes = (1_000, 10_000, len(self.cityData))
+
+        for strategy in self.strategies:
+            count_operation = self._get_count_operation(strategy) if count else None
+            self.harness.measure_sizes(strategy, self._create_unsorted_cities, self._get_operation(strategy), sizes,
+                                       count_operation)
+        return self.harness.results
+
+    def _create_unsorted_cities(self, size):
+        """
+        Setup: a fresh unsorted List of City Objects (the Floyd construction and TimSort work in place).
+        """
+        return self.cityDataManager.transform_raw_city_data_to_unsorted_list_of_cities(self.cityData[:size])
+
+    def _get_operation(self, strategy):
+        if strategy == "iterative":
+            return lambda cities: CityMaxHeap(cities, False, False)
+        if strategy == "recursive":
+            return lambda cities: CityMaxHeap(cities, True, False)
+        if strategy == "floyd":
+            return lambda cities: CityMaxHeap(cities, False, True)
+        if strategy == "timsort":
+            return lambda cities: cities.sort(reverse=True)
+        raise ValueError("Unknown strategy " + strategy)
+
+    def _get_count_operation(self, strategy):
+        """
+        Return the counting of the construction with the given strategy, None for TimSort (no heap).
+        """
+        if strategy == "iterative":
+            return lambda cities: InstrumentedCityMaxHeap(cities, False, False).get_operation_counts()
+        if strategy == "recursive":
+            return lambda cities: InstrumentedCityMaxHeap(cities, True, False).get_operation_counts()
+        if strategy == "floyd":
+            return lambda cities: InstrumentedCityMaxHeap(cities, False, True).get_operation_counts()
+        return None
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark of the heap construction strategies.")
+    parser.add_argument("--sizes", type=int, nargs="+", help="input sizes (default: 1000, 10000, all cities)")
+    parser.add_argument("--warmup", type=int, default=BenchmarkHarness.warmupRuns, help="amount of warm-up runs")
+    parser.add_argument("--repetitions", type=int, default=BenchmarkHarness.repetitions,
+                        help="amount of measured runs")
+    parser.add_argument("--count", action="store_true",
+                        help="count comparisons, swaps and sift paths of the heap strategies (exported with --json/--csv)")
+    parser.add_argument("--json", help="write the results into this JSON file")
+    parser.add_argument("--csv", help="write the results into this CSV file")
+    parser.add_argument("--compare", help="compare the results with an earlier JSON file")
+    arguments = parser.parse_args(argv)
+
+    harness = BenchmarkHarness(arguments.warmup, arguments.repetitions)
+    HeapStrategyBenchmark(harness).run(arguments.sizes, arguments.count)
+    harness.print_results()
+    if arguments.count:
+        harness.print_operation_counts()
+
+    if arguments.json:
+        harness.write_json(arguments.json)
+    if arguments.csv:
+        harness.write_csv(arguments.csv)
+    if arguments.compare:
+        harness.compare_with_json(arguments.compare)
+
+
+if __name__ == '__main__':
+    main()
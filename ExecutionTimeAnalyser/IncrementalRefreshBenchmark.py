@@ -0,0 +1,113 @@
+import argparse
+import os
+import random
+import tempfile
+
+from CityDataImport.CityDataImporter import CityDataImporter
+from CityDataManagement.CityDataManager import CityDataManager
+from CityDataManagement.CityIndexedMaxHeap import CityIndexedMaxHeap
+from ExecutionTimeAnalyser.BenchmarkHarness import BenchmarkHarness
+
+
+class IncrementalRefreshBenchmark:
+    """
+    Class with the responsibility to compare the full rebuild of the heap after a change of the TSV file with the
+    incremental refresh (CityDataManager.refresh_max_city_heap_from_file).
+
+    A synthetic file is written, a second version of it differs in amountOfChanges records (a third each removed,
+    changed and added). Measured are:
+
+    -full rebuild: import of the second version and creation of the indexed heap via Floyds Algorithm
+
+    -refresh: diff of the second version against the fingerprint of the first one and applying the changes
+
+    Both results are checked to hold the same cities. print_speedup prints the measured ratio: the refresh still reads
+    and hashes every line of the file, so its speedup depends on the size of the file and the amount of changes.
+    """
+
+    seed = 42
+
+    def __init__(self, amount_of_cities: int = 1_000_000, amount_of_changes: int = 300,
+                 harness: BenchmarkHarness = None):
+        self.amountOfCities = amount_of_cities
+        self.amountOfChanges = amount_of_changes
+        self.harness = harness if harness is not None else BenchmarkHarness(warmup_runs=0, repetitions=3)
+
+    def run(self):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            old_path = os.path.join(temp_dir, "cities_old.tsv")
+            new_path = os.path.join(temp_dir, "cities_new.tsv")
+            self._write_files(old_path, new_path)
+
+            self.harness.measure("full rebuild", lambda: new_path, self._rebuild, self.amountOfCities)
+            self.harness.measure("refresh", lambda: self._refreshed_manager(old_path),
+                                 lambda city_data_manager: city_data_manager.refresh_max_city_heap_from_file(new_path),
+                                 self.amountOfCities)
+            self._check_identical_results(old_path, new_path)
+        return self.harness.results
+
+    def print_speedup(self):
+        """
+        Print how many times faster the refresh is than the full rebuild (ratio of the medians).
+        """
+        medians = {result.name: result.median_ms for result in self.harness.results}
+        print("refresh: %.2f ms, full rebuild: %.2f ms, speedup %.2fx (%d cities, %d changes)"
+              % (medians["refresh"], medians["full rebuild"], medians["full rebuild"] / medians["refresh"],
+                 self.amountOfCities, self.amountOfChanges))
+
+    def _rebuild(self, path_to_file):
+        city_data_manager = CityDataManager(verbose=False)
+        city_data_manager.create_new_max_city_heap(CityDataImporter(path_to_file).import_from_file(), False, True,
+                                                   CityIndexedMaxHeap)
+        return city_data_manager
+
+    def _refreshed_manager(self, path_to_file):
+        city_data_manager = CityDataManager(verbose=False)
+        city_data_manager.refresh_max_city_heap_from_file(path_to_file)
+        return city_data_manager
+
+    def _write_files(self, old_path, new_path):
+        random_generator = random.Random(self.seed)
+        records = [["City " + str(i), "Synthetica", str(random_generator.randint(0, 40_000_000))]
+                   for i in range(self.amountOfCities)]
+        self._write_records(old_path, records)
+
+        amount_per_kind = self.amountOfChanges // 3
+        for index in random_generator.sample(range(len(records)), amount_per_kind):
+            records[index][2] = str(random_generator.randint(0, 40_000_000))
+        for index in sorted(random_generator.sample(range(len(records)), amount_per_kind), reverse=True):
+            del records[index]
+        for i in range(amount_per_kind):
+            records.insert(random_generator.randrange(len(records)),
+                           ["New City " + str(i), "Synthetica", str(random_generator.randint(0, 40_000_000))])
+        self._write_records(new_path, records)
+
+    def _write_records(self, path_to_file, records):
+        with open(path_to_file, "w", encoding="utf-8") as f:
+            f.writelines("\t".join(record) + "\n" for record in records)
+
+    def _check_identical_results(self, old_path, new_path):
+        refreshed_manager = self._refreshed_manager(old_path)
+        refreshed_manager.refresh_max_city_heap_from_file(new_path)
+        results = [sorted((city.name, city.population) for city in city_data_manager.cityMaxHeap.get_heap_data())
+                   for city_data_manager in (refreshed_manager, self._rebuild(new_path))]
+        if results[0] != results[1]:
+            raise AssertionError("The refreshed heap does not hold the same cities as the rebuilt heap.")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Full rebuild versus incremental refresh of the City heap.")
+    parser.add_argument("--cities", type=int, default=1_000_000, help="amount of cities of the synthetic file")
+    parser.add_argument("--changes", type=int, default=300, help="amount of removed, changed and added cities")
+    parser.add_argument("--repetitions", type=int, default=3, help="measured runs per variant")
+    arguments = parser.parse_args(argv)
+
+    benchmark = IncrementalRefreshBenchmark(arguments.cities, arguments.changes,
+                                            BenchmarkHarness(warmup_runs=0, repetitions=arguments.repetitions))
+    benchmark.run()
+    benchmark.harness.print_results()
+    benchmark.print_speedup()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,101 @@
+import argparse
+from typing import List
+
+from CityDataImport.CityDataImporter import CityDataImporter
+from CityDataManagement.City import City
+from CityDataManagement.CityDataManager import CityDataManager
+from CityDataManagement.CityMaxHeap import CityMaxHeap
+from CityDataManagement.CityPairingMaxHeap import CityPairingMaxHeap
+from ExecutionTimeAnalyser.BenchmarkHarness import BenchmarkHarness
+
+
+class PairingHeapBenchmark:
+    """
+    Class with the responsibility to compare the CityPairingMaxHeap with the CityMaxHeap for ingest workloads, so the
+    backend can be chosen per workload.
+
+    -ratio workloads: all cities of the file are inserted into an empty heap in bursts of `ratio` inserts, every burst
+     is followed by one removal of the City with the highest population (insert-to-pop ratio ratio:1)
+
+    -merge: two heaps of half the cities are merged (CityMaxHeap.merge, CityPairingMaxHeap.meld)
+
+    Every workload is checked to remove the same cities with both backends.
+    """
+
+    backends = {"binary": CityMaxHeap, "pairing": CityPairingMaxHeap}
+    ratios = (1, 10, 100, 1000)
+
+    def __init__(self, harness: BenchmarkHarness = None, ratios=None):
+        self.harness = harness if harness is not None else BenchmarkHarness(warmup_runs=1, repetitions=5)
+        if ratios is not None:
+            self.ratios = ratios
+        city_data = CityDataImporter().import_from_file()
+        self.cities = CityDataManager(verbose=False).transform_raw_city_data_to_unsorted_list_of_cities(city_data)
+
+    def run(self):
+        size = len(self.cities)
+        for ratio in self.ratios:
+            self._check_identical_results(ratio)
+            for backend, heap_class in self.backends.items():
+                self.harness.measure(backend + " " + str(ratio) + ":1", lambda c=heap_class: c([], False, False),
+                                     lambda city_heap, r=ratio: self._ratio_workload(city_heap, r), size)
+        half = size // 2
+        for backend, heap_class in self.backends.items():
+            self.harness.measure(backend + " merge",
+                                 lambda c=heap_class: (c(self.cities[:half], False, c is CityMaxHeap),
+                                                       c(self.cities[half:], False, c is CityMaxHeap)),
+                                 self._merge_workload, size)
+        return self.harness.results
+
+    def print_matrix(self):
+        """
+        Print the median times as matrix: one row per workload, one column per backend, and the faster backend.
+        """
+        medians = {result.name: result.median_ms for result in self.harness.results}
+        print("workload".ljust(12) + "".join((backend + " ms").rjust(14) for backend in self.backends)
+              + "faster".rjust(10))
+        for workload in [str(ratio) + ":1" for ratio in self.ratios] + ["merge"]:
+            workload_medians = {backend: medians[backend + " " + workload] for backend in self.backends}
+            print(workload.ljust(12) + "".join(("%.3f" % median).rjust(14) for median in workload_medians.values())
+                  + min(workload_medians, key=workload_medians.get).rjust(10))
+
+    def _ratio_workload(self, city_heap, ratio) -> List[City]:
+        removed_cities = []
+        cities = self.cities
+        for start in range(0, len(cities), ratio):
+            for city in cities[start:start + ratio]:
+                city_heap.insert(city)
+            removed_cities.append(city_heap.remove())
+        return removed_cities
+
+    def _merge_workload(self, city_heaps):
+        city_heap, other_city_heap = city_heaps
+        if isinstance(city_heap, CityPairingMaxHeap):
+            city_heap.meld(other_city_heap)
+        else:
+            city_heap.merge(other_city_heap)
+        city_heap.remove()
+
+    def _check_identical_results(self, ratio):
+        results = [[city.population for city in self._ratio_workload(heap_class([], False, False), ratio)]
+                   for heap_class in self.backends.values()]
+        if any(result != results[0] for result in results):
+            raise AssertionError("The backends do not remove the same cities at the ratio " + str(ratio) + ":1.")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Pairing heap versus binary heap at different insert-to-pop ratios.")
+    parser.add_argument("--ratios", type=int, nargs="+", default=list(PairingHeapBenchmark.ratios),
+                        help="inserts per removal")
+    parser.add_argument("--repetitions", type=int, default=5, help="measured runs per workload and backend")
+    arguments = parser.parse_args(argv)
+
+    benchmark = PairingHeapBenchmark(BenchmarkHarness(warmup_runs=1, repetitions=arguments.repetitions),
+                                     arguments.ratios)
+    benchmark.run()
+    benchmark.harness.print_results()
+    benchmark.print_matrix()
+
+
+if __name__ == '__main__':
+    main()
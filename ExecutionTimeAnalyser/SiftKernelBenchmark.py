@@ -0,0 +1,99 @@
+from CityDataImport.CityDataImporter import CityDataImporter
+from CityDataManagement.CityDataManager import CityDataManager
+from CityDataManagement.CityMaxHeap import CityMaxHeap
+from ExecutionTimeAnalyser.BenchmarkHarness import BenchmarkHarness
+
+
+class AccessorCityMaxHeap(CityMaxHeap):
+    """
+    Reference of the former iterative sifts: every level calls the accessor methods and swaps two nodes.
+    """
+
+    def heapify_up_iterative(self):
+        index = self.currentHeapLastIndex - 1
+        while self.has_parent(index) and self.get_city_key(index) > self.get_parent_key(index):
+            parent_index = self.get_parent_index(index)
+            self.swap_nodes(index, parent_index)
+            index = parent_index
+
+    def heapify_down_iterative(self):
+        index = 0
+        while True:
+            largest_index = index
+            for child_index in self.get_child_indices(index):
+                if child_index < self.currentHeapLastIndex \
+                        and self.get_city_key(child_index) > self.get_city_key(largest_index):
+                    largest_index = child_index
+            if largest_index == index:
+                return
+            self.swap_nodes(index, largest_index)
+            index = largest_index
+
+
+class SiftKernelBenchmark:
+    """
+    Class with the responsibility to compare the sift kernels of the CityMaxHeap on the full city file.
+
+    -accessor: the former iterative sifts (accessor methods, pairwise swaps)
+
+    -recursive: the recursive sifts (recursive=True)
+
+    -kernel: the iterative hole-based kernel (recursive=False)
+
+    Every variant builds the heap by single inserts (sift-up) and drains it by removals (sift-down), both are measured
+    separately. The results of all variants are checked to be identical.
+    """
+
+    variants = {"accessor": (AccessorCityMaxHeap, False), "recursive": (CityMaxHeap, True),
+                "kernel": (CityMaxHeap, False)}
+
+    def __init__(self, harness: BenchmarkHarness = None):
+        self.harness = harness if harness is not None else BenchmarkHarness(warmup_runs=1, repetitions=5)
+        self.cityData = CityDataImporter().import_from_file()
+        self.cityDataManager = CityDataManager()
+
+    def run(self):
+        size = len(self.cityData)
+        self._check_identical_results()
+        for variant, (heap_class, recursive) in self.variants.items():
+            self.harness.measure(variant + " insert", self._create_unsorted_cities,
+                                 lambda cities, c=heap_class, r=recursive: c(cities, r, False), size)
+            self.harness.measure(variant + " remove", lambda c=heap_class, r=recursive: self._create_heap(c, r),
+                                 self._remove_all, size)
+        return self.harness.results
+
+    def print_speedups(self):
+        """
+        Print the speedup of the kernel over the other variants (ratio of the medians).
+        """
+        medians = {result.name: result.median_ms for result in self.harness.results}
+        for operation in ("insert", "remove"):
+            for variant in ("accessor", "recursive"):
+                print("kernel " + operation + " is " + ("%.2f" % (medians[variant + " " + operation]
+                                                                   / medians["kernel " + operation]))
+                      + " times faster than " + variant + " " + operation)
+
+    def _check_identical_results(self):
+        results = []
+        for heap_class, recursive in self.variants.values():
+            city_heap = heap_class(self._create_unsorted_cities(), recursive, False)
+            results.append([(city.name, city.population) for city in city_heap.get_heap_data()])
+        if any(result != results[0] for result in results):
+            raise AssertionError("The sift kernels do not build the same heap.")
+
+    def _create_unsorted_cities(self):
+        return self.cityDataManager.transform_raw_city_data_to_unsorted_list_of_cities(self.cityData)
+
+    def _create_heap(self, heap_class, recursive):
+        return heap_class(self._create_unsorted_cities(), recursive, True)
+
+    def _remove_all(self, city_heap):
+        while city_heap.currentHeapLastIndex > 0:
+            city_heap.remove()
+
+
+if __name__ == '__main__':
+    benchmark = SiftKernelBenchmark()
+    benchmark.run()
+    benchmark.harness.print_results()
+    benchmark.print_speedups()
@@ -0,0 +1,104 @@
+import argparse
+import os
+import subprocess
+import sys
+from typing import List, Dict
+
+from ExecutionTimeAnalyser.BenchmarkHarness import BenchmarkHarness
+
+
+class StartupImportBenchmark:
+    """
+    Class with the responsibility to measure the start-up cost of a module, like a batch worker which is started
+    thousands of times a day and pays for every import.
+
+    -import time: the module is imported in a fresh interpreter with python -X importtime, the self and cumulative
+     import time of every imported module is parsed from its report
+
+    -start-up time: the wall-clock time of a fresh interpreter which imports the module, compared with an interpreter
+     which imports nothing
+
+    -headless check: none of the modules of the visualization stack (bokeh, networkx, numpy) must be imported
+    """
+
+    moduleName = "HeapCreationAssembler"
+    visualizationModules = ("bokeh", "networkx", "numpy")
+
+    def __init__(self, module_name: str = None, harness: BenchmarkHarness = None):
+        if module_name is not None:
+            self.moduleName = module_name
+        self.harness = harness if harness is not None else BenchmarkHarness(warmup_runs=1, repetitions=10)
+        self.projectDir = os.path.dirname(os.path.dirname(os.path.realpath(__file__)))
+
+    def run(self):
+        self.harness.measure("interpreter start-up", lambda: "pass", self._start_interpreter)
+        self.harness.measure(self.moduleName + " start-up", lambda: "import " + self.moduleName,
+                             self._start_interpreter)
+        return self.harness.results
+
+    def measure_import_times(self) -> List[Dict]:
+        """
+        Import the module in a fresh interpreter with -X importtime.
+
+        Returns one dict per imported module (name, self_us, cumulative_us, depth) in the order of the report, the
+        module itself is the last entry.
+        """
+        completed_process = subprocess.run([sys.executable, "-X", "importtime", "-c", "import " + self.moduleName],
+                                           cwd=self.projectDir, capture_output=True, text=True, check=True)
+        import_times = []
+        for line in completed_process.stderr.splitlines():
+            if not line.startswith("import time:") or "[us]" in line:
+                continue
+            self_us, cumulative_us, name = line[len("import time:"):].split("|")
+            import_times.append({"name": name.strip(), "self_us": int(self_us), "cumulative_us": int(cumulative_us),
+                                 "depth": (len(name) - len(name.lstrip()) - 1) // 2})
+        return import_times
+
+    def check_headless(self, import_times: List[Dict] = None) -> List[str]:
+        """
+        Return the modules of the visualization stack imported by the module, an empty List for a headless start-up.
+        """
+        if import_times is None:
+            import_times = self.measure_import_times()
+        return [entry["name"] for entry in import_times
+                if entry["name"].split(".")[0] in self.visualizationModules]
+
+    def print_import_times(self, import_times: List[Dict] = None, amount_of_modules: int = 15):
+        """
+        Print the total import time of the module and the modules with the highest cumulative import time.
+        """
+        if import_times is None:
+            import_times = self.measure_import_times()
+        print("Import time of " + self.moduleName + ": " + ("%.3f" % (import_times[-1]["cumulative_us"] / 1000))
+              + " milliseconds, " + str(len(import_times)) + " modules")
+        print("module".ljust(48) + "self ms".rjust(12) + "cumulative ms".rjust(16))
+        for entry in sorted(import_times, key=lambda e: e["cumulative_us"], reverse=True)[:amount_of_modules]:
+            print(entry["name"].ljust(48) + ("%.3f" % (entry["self_us"] / 1000)).rjust(12)
+                  + ("%.3f" % (entry["cumulative_us"] / 1000)).rjust(16))
+
+    def _start_interpreter(self, code):
+        subprocess.run([sys.executable, "-c", code], cwd=self.projectDir, check=True)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Start-up and import time benchmark based on python -X importtime.")
+    parser.add_argument("--module", default=StartupImportBenchmark.moduleName, help="module to be imported")
+    parser.add_argument("--repetitions", type=int, default=10, help="measured interpreter start-ups")
+    parser.add_argument("--top", type=int, default=15, help="amount of printed modules")
+    arguments = parser.parse_args(argv)
+
+    benchmark = StartupImportBenchmark(arguments.module, BenchmarkHarness(warmup_runs=1,
+                                                                          repetitions=arguments.repetitions))
+    import_times = benchmark.measure_import_times()
+    benchmark.print_import_times(import_times, arguments.top)
+    visualization_modules = benchmark.check_headless(import_times)
+    if visualization_modules:
+        print("Not headless, imported: " + ", ".join(visualization_modules))
+    else:
+        print("Headless: no module of the visualization stack has been imported.")
+    benchmark.run()
+    benchmark.harness.print_results()
+
+
+if __name__ == '__main__':
+    main()
@@ -1,21 +1,63 @@
-from typing import List
+import argparse
+import contextlib
+import json
+import sys
+from typing import List, Sequence
 
 from CityDataManagement.City import City
 from CityDataImport.CityDataImporter import CityDataImporter
 from CityDataManagement.CityDataManager import CityDataManager
 from CityDataManagement.ICityDataManagerAccess import ICityDataManagerAccess
 from ExecutionTimeAnalyser.ExecutionTimeAnalyser import ExecutionTimeAnalyser
-from Visualization.CityMaxHeapVisualizer import CityMaxHeapVisualizer
 
 
 class HeapCreationAssembler:
     """
     Assembler class: bears the responsibility to build the required components and connect them to each other.
+
+    The components are built on first use, not when the module is imported. The visualization stack (bokeh, networkx,
+    numpy) is only imported when a heap is visualized, a headless run never loads it.
+
+    Besides the fixed course demonstration (run) the assembler offers a pipeline of selectable stages with a single
+    build of the heap (run_pipeline), see main for the command line.
+
+    Param:
+    ------
+    headless: bool: skip the visualisation, e.g. for batch workers without a browser
+
+    path_to_file: path of the TSV file to be imported, None = the cities.tsv file of the CityDataImporter
     """
 
-    importer = CityDataImporter()
-    cityDataManager: ICityDataManagerAccess = CityDataManager()
-    executionTimeAnalyser = ExecutionTimeAnalyser()
+    detailedNodeLimit = 1023  # up to this amount of nodes every node is drawn, above the deep levels are aggregated
+    stages = ("import", "build", "query", "benchmark", "visualize")
+    # Key = build strategy, Value = (recursive, floyd) for create_new_max_city_heap, None = the strategy reads the file
+    buildStrategies = {"iterative": (False, False), "recursive": (True, False), "floyd": (False, True),
+                       "streaming": None, "parallel": None}
+
+    def __init__(self, headless: bool = False, path_to_file=None):
+        self.headless = headless
+        self.pathToFile = path_to_file
+        self._importer = None
+        self._cityDataManager = None
+        self._executionTimeAnalyser = None
+
+    @property
+    def importer(self) -> CityDataImporter:
+        if self._importer is None:
+            self._importer = CityDataImporter(self.pathToFile)
+        return self._importer
+
+    @property
+    def cityDataManager(self) -> ICityDataManagerAccess:
+        if self._cityDataManager is None:
+            self._cityDataManager = CityDataManager()
+        return self._cityDataManager
+
+    @property
+    def executionTimeAnalyser(self) -> ExecutionTimeAnalyser:
+        if self._executionTimeAnalyser is None:
+            self._executionTimeAnalyser = ExecutionTimeAnalyser()
+        return self._executionTimeAnalyser
 
     def run(self):
         # Creation of the given data structure for this course.
@@ -38,6 +80,7 @@ class HeapCreationAssembler:
 
         # Further Execution Time measurement
         self.measure_tim_sort_execution_time(city_data)
+        self.measure_top_k_execution_time(city_data, 100)
         self.measure_max_heap_execution_time_via_timeit(10)
 
         # Node add
@@ -48,11 +91,92 @@ class HeapCreationAssembler:
         self.cityDataManager.remove_city_with_highest_population()
 
         # Visualisation
-        data_to_visualize: List[City] = self.cityDataManager.get_max_heap_as_list()
+        if self.headless:
+            return
+        data_to_visualize: Sequence[City] = self.cityDataManager.get_max_heap_as_list()
         amount_of_nodes_to_create = 1023
-        # amount_of_nodes_to_create = len(city_data) #all cities, use this for science at the price of performance ;)
+        # amount_of_nodes_to_create = len(city_data) #all cities, the deep levels are drawn as aggregated wedges
         self.visualize_heap(data_to_visualize, amount_of_nodes_to_create, city_data)
 
+    def run_pipeline(self, stages=("import", "build", "query"), strategy: str = "floyd", k: int = 10,
+                     repetitions: int = 5, amount_of_nodes_to_create: int = 1023) -> dict:
+        """
+        Run the selected stages in the order of HeapCreationAssembler.stages, the heap is built once.
+
+        -import: import the TSV file
+
+        -build: build the heap with the given strategy (see buildStrategies)
+
+        -query: the city with the highest population and the k cities with the highest population
+
+        -benchmark: repeated measurement of the build with the given strategy (BenchmarkHarness)
+
+        -visualize: visualisation of the first amount_of_nodes_to_create nodes, skipped in headless mode
+
+        query and visualize need the heap, so the build stage is added for them. For build and benchmark the strategies
+        which do not read the file themselves import it if the import stage has not been selected.
+
+        Returns a JSON serializable report with the timings in milliseconds and the results of every stage.
+        """
+        unknown_stages = [stage for stage in stages if stage not in self.stages]
+        if unknown_stages:
+            raise ValueError("Unknown stages: " + ", ".join(unknown_stages))
+        if strategy not in self.buildStrategies:
+            raise ValueError("Unknown build strategy: " + strategy)
+        stages = set(stages)
+        if stages & {"query", "visualize"}:
+            stages.add("build")
+
+        report = {"input": self.importer.get_path_to_file(), "strategy": strategy,
+                  "stages": [stage for stage in self.stages if stage in stages], "timings_ms": {}, "results": {}}
+        city_data = None
+
+        if "import" in stages or (stages & {"build", "benchmark"} and self.buildStrategies[strategy] is not None):
+            self.executionTimeAnalyser.start()
+            city_data = self.importer.import_from_file()
+            report["timings_ms"]["import"] = self.executionTimeAnalyser.stop(print_to_console=False)
+            report["results"]["import"] = {"records": len(city_data)}
+
+        if "build" in stages:
+            self.executionTimeAnalyser.start()
+            self._build_max_city_heap(self.cityDataManager, strategy, city_data)
+            report["timings_ms"]["build"] = self.executionTimeAnalyser.stop(print_to_console=False)
+            report["results"]["build"] = {"cities": self.cityDataManager.cityMaxHeap.currentHeapLastIndex}
+
+        if "query" in stages:
+            self.executionTimeAnalyser.start()
+            highest_population_city = self.cityDataManager.get_highest_population_city()
+            top_cities = self.cityDataManager.top_k(k)
+            report["timings_ms"]["query"] = self.executionTimeAnalyser.stop(print_to_console=False)
+            report["results"]["query"] = {
+                "highest_population_city": self._city_to_dict(highest_population_city)
+                if highest_population_city is not None else None,
+                "top_k": [self._city_to_dict(city) for city in top_cities or []]}
+
+        if "benchmark" in stages:
+            # imported on first use: only the benchmark stage needs the harness
+            from ExecutionTimeAnalyser.BenchmarkHarness import BenchmarkHarness
+            harness = BenchmarkHarness(warmup_runs=1, repetitions=repetitions)
+            benchmark_manager = CityDataManager(verbose=False)
+            self.executionTimeAnalyser.start()
+            result = harness.measure(strategy + " build", lambda: city_data,
+                                     lambda data: self._build_max_city_heap(benchmark_manager, strategy, data),
+                                     len(city_data) if city_data is not None else None)
+            report["timings_ms"]["benchmark"] = self.executionTimeAnalyser.stop(print_to_console=False)
+            report["results"]["benchmark"] = result.to_dict()
+
+        if "visualize" in stages:
+            if self.headless:
+                report["results"]["visualize"] = {"skipped": "headless"}
+            else:
+                self.executionTimeAnalyser.start()
+                self.visualize_heap(self.cityDataManager.get_max_heap_as_list(), amount_of_nodes_to_create,
+                                    city_data)
+                report["timings_ms"]["visualize"] = self.executionTimeAnalyser.stop(print_to_console=False)
+                report["results"]["visualize"] = {"nodes": amount_of_nodes_to_create}
+
+        return report
+
     def measure_tim_sort_execution_time(self, city_data):
         """
         Measuring the execution time for sorting cities using Python's TimSort.
@@ -62,6 +186,19 @@ class HeapCreationAssembler:
         unsorted_cities_list.sort(reverse=True)
         self.executionTimeAnalyser.stop("TimSort Execution time: ")
 
+    def measure_top_k_execution_time(self, city_data, k):
+        """
+        Measuring the execution time for the k cities with the highest population, once from the existing heap and
+        once streamed over the raw City Data without heap or sorting.
+        """
+        self.executionTimeAnalyser.start()
+        self.cityDataManager.top_k(k)
+        self.executionTimeAnalyser.stop("Top " + str(k) + " from MaxHeap Execution time: ")
+
+        self.executionTimeAnalyser.start()
+        self.cityDataManager.top_k_from_iterable(city_data, k)
+        self.executionTimeAnalyser.stop("Top " + str(k) + " streamed Execution time: ")
+
     def measure_max_heap_execution_time_via_timeit(self, repetitions):
         """
         Alternative, more expensive (due to several repetitions) but
@@ -69,13 +206,13 @@ class HeapCreationAssembler:
         """
         self.executionTimeAnalyser.measure_execution_time_via_timeit(repetitions)
 
-    def visualize_heap(self, data_to_visualize: List[City], amount_of_nodes_to_create: int, city_data):
+    def visualize_heap(self, data_to_visualize: Sequence[City], amount_of_nodes_to_create: int, city_data):
         """
         Triggering and building the visualisation of the heap.
 
         Param:
         ------
-        dataToVisualize: List[City]: List of Cities
+        dataToVisualize: Sequence[City]: List or tuple of Cities
 
         amountOfNodesToCreate: int: the first N nodes of the dataToVisualize list to be visualized
 
@@ -86,15 +223,78 @@ class HeapCreationAssembler:
                                     Instead, this Data will be used.
 
         """
+        # imported on first use: bokeh, networkx and numpy dominate the start-up time of the assembler
+        from Visualization.CityMaxHeapVisualizer import CityMaxHeapVisualizer
+        from Visualization.CityMaxHeapLodVisualizer import CityMaxHeapLodVisualizer
+
         unsorted = False
         if data_to_visualize is None or data_to_visualize[0] == 0:
             data_to_visualize = self.cityDataManager.transform_raw_city_data_to_unsorted_list_of_cities(city_data)
             unsorted = True
+        if amount_of_nodes_to_create > self.detailedNodeLimit:
+            city_max_heap_lod_visualizer = CityMaxHeapLodVisualizer()
+            city_max_heap_lod_visualizer.create_radial_tree_visualisation(data_to_visualize[:amount_of_nodes_to_create],
+                                                                          unsorted)
+            return
         city_max_heap_visualizer = CityMaxHeapVisualizer()
         city_max_heap_visualizer.create_radial_tree_visualisation(amount_of_nodes_to_create, data_to_visualize,
                                                                   unsorted)
 
+    def _build_max_city_heap(self, city_data_manager: CityDataManager, strategy: str, city_data):
+        if strategy == "streaming":
+            city_data_manager.create_new_max_city_heap_from_batches(self.importer.iter_batches(), False)
+        elif strategy == "parallel":
+            city_data_manager.create_new_max_city_heap_in_parallel(self.importer.get_path_to_file())
+        else:
+            recursive, floyd = self.buildStrategies[strategy]
+            city_data_manager.create_new_max_city_heap(city_data, recursive, floyd)
+
+    def _city_to_dict(self, city: City):
+        return {"name": city.name, "country": city.country, "population": city.population}
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Import, build, query, benchmark and visualize a Max-City-Heap.")
+    parser.add_argument("--input", help="TSV file with the cities (default: CityDataImport/cities.tsv)")
+    parser.add_argument("--strategy", choices=HeapCreationAssembler.buildStrategies, default="floyd",
+                        help="build strategy of the heap")
+    parser.add_argument("--stages", default="import,build,query",
+                        help="comma separated stages out of " + ",".join(HeapCreationAssembler.stages))
+    parser.add_argument("--top-k", type=int, default=10, help="amount of cities of the query stage")
+    parser.add_argument("--repetitions", type=int, default=5, help="measured builds of the benchmark stage")
+    parser.add_argument("--nodes", type=int, default=1023, help="amount of nodes of the visualize stage")
+    parser.add_argument("--json", help="write the report as JSON into this file, - = standard output")
+    parser.add_argument("--headless", action="store_true", help="never load the visualization stack")
+    parser.add_argument("--demo", action="store_true", help="run the fixed course demonstration instead")
+    arguments = parser.parse_args(argv)
+
+    heap_assembler = HeapCreationAssembler(arguments.headless, arguments.input)
+    if arguments.demo:
+        heap_assembler.run()
+        return
+
+    stages = [stage.strip() for stage in arguments.stages.split(",") if stage.strip()]
+    unknown_stages = [stage for stage in stages if stage not in HeapCreationAssembler.stages]
+    if unknown_stages:
+        parser.error("unknown stages: " + ", ".join(unknown_stages))
+
+    # with the report on the standard output every other message goes to the standard error
+    with contextlib.redirect_stdout(sys.stderr) if arguments.json == "-" else contextlib.nullcontext():
+        report = heap_assembler.run_pipeline(stages, arguments.strategy, arguments.top_k, arguments.repetitions,
+                                             arguments.nodes)
+
+    if arguments.json == "-":
+        json.dump(report, sys.stdout, indent=2)
+        print()
+    elif arguments.json is not None:
+        with open(arguments.json, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2)
+    else:
+        for stage, elapsed_time_ms in report["timings_ms"].items():
+            print(stage.ljust(12) + ("%.3f" % elapsed_time_ms).rjust(12) + " milliseconds")
+        for city in report["results"].get("query", {}).get("top_k", []):
+            print(city["name"] + " (" + city["country"] + "): " + str(city["population"]))
+
 
 if __name__ == '__main__':
-    heapAssembler = HeapCreationAssembler()
-    heapAssembler.run()
+    main()
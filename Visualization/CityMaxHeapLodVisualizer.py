@@ -0,0 +1,169 @@
+import math
+from typing import List
+
+import numpy as np
+from bokeh.models import ColumnDataSource, HoverTool, WheelZoomTool
+from bokeh.plotting import figure, show
+
+from CityDataManagement.City import City
+from Visualization.HeatMapColorCreator import HeatMapColorCreator
+
+
+class CityMaxHeapLodVisualizer:
+    """
+    Class with the responsibility to visualize a heap of City objects of any size as radial tree with level of detail.
+
+    The positions are calculated directly from the array index, no graph is built:
+    the node at index i is on level floor(log2(i + 1)) (= radius) at position i - (2^level - 1) of its level (= angle).
+
+    The upper levels are drawn node by node. The deeper levels are collapsed into aggregated wedges: every node of the
+    last detailed level gets one wedge per deeper level, covering all its descendants on that level.
+    """
+
+    ringGap = 0.15  # distance between two levels
+    maximumNodeSize = 40
+    minimumNodeSize = 2
+
+    def create_radial_tree_visualisation(self, city_heap_array: List[City], unsorted: bool, detail_levels: int = 10,
+                                         color_scale: str = "linear"):
+        """
+        Create a radial tree of a heap structure based on an array.
+
+        Param
+        -----
+        cityHeapArray: List of city objects in heap order. Index 0 = Root, Index 1 = first Child
+
+        unsorted: bool: the data is no heap, the highest population is not at index 0
+
+        detailLevels: int: amount of levels drawn node by node, all deeper levels are aggregated
+
+        colorScale: str: "linear", "log" or "quantile", see HeatMapColorCreator.heat_map_colors_based_on_max_value
+        """
+        populations = np.fromiter((city.population for city in city_heap_array), dtype=np.int64,
+                                  count=len(city_heap_array))
+        amount_of_levels = self._get_level(len(populations) - 1) + 1
+        detail_levels = max(1, min(detail_levels, amount_of_levels))
+        highest_population = int(populations.max()) if unsorted else int(populations[0])
+        heat_map_color_creator = HeatMapColorCreator(highest_population)
+
+        ring_gap = min(self.ringGap, 1.9 / amount_of_levels)
+        amount_of_detailed_nodes = min(len(populations), 2 ** detail_levels - 1)
+        node_source, edge_source = self._create_node_and_edge_sources(city_heap_array, populations,
+                                                                      amount_of_detailed_nodes, ring_gap,
+                                                                      heat_map_color_creator, highest_population,
+                                                                      color_scale)
+        wedge_source = self._create_wedge_source(populations, detail_levels, amount_of_levels, ring_gap,
+                                                 heat_map_color_creator, color_scale)
+
+        plot = self._create_plot(city_heap_array[int(populations.argmax()) if unsorted else 0])
+        plot.segment(x0="x0", y0="y0", x1="x1", y1="y1", source=edge_source, line_color="#000000",
+                     line_alpha=0.2, line_width=1)
+        wedge_renderer = plot.annular_wedge(x=0, y=0, inner_radius="innerRadius", outer_radius="outerRadius",
+                                            start_angle="startAngle", end_angle="endAngle", source=wedge_source,
+                                            fill_color="wedgeColor", line_color=None, fill_alpha=0.8)
+        node_renderer = plot.scatter(x="x", y="y", size="nodeSize", marker="circle", fill_color="nodeColor",
+                                     line_color="#000000", line_alpha=0.3, source=node_source)
+
+        plot.add_tools(HoverTool(renderers=[node_renderer],
+                                 tooltips="@cityName with a Population of @population in @country."))
+        plot.add_tools(HoverTool(renderers=[wedge_renderer],
+                                 tooltips="Level @level: @amountOfCities cities, highest Population @maxPopulation, "
+                                          "total Population @sumPopulation"))
+        plot.toolbar.active_scroll = plot.select_one(WheelZoomTool)
+        show(plot)
+
+    def _get_level(self, index):
+        """
+        Return the level of the node at the given index (root = level 0).
+        """
+        return int(math.log2(index + 1)) if index >= 0 else 0
+
+    def _get_polar_positions(self, indices: np.ndarray, ring_gap):
+        """
+        Vectorized radial layout: return radius and angle of the nodes at the given indices.
+        """
+        levels = np.floor(np.log2(indices + 1)).astype(np.int64)
+        # correct floating point errors at the borders of the levels
+        levels[(1 << (levels + 1)) - 1 <= indices] += 1
+        levels[(1 << levels) - 1 > indices] -= 1
+        first_index_of_level = (1 << levels) - 1
+        angles = 2 * np.pi * (indices - first_index_of_level + 0.5) / (1 << levels)
+        return levels * ring_gap, angles
+
+    def _create_node_and_edge_sources(self, city_heap_array: List[City], populations: np.ndarray,
+                                      amount_of_detailed_nodes: int, ring_gap,
+                                      heat_map_color_creator: HeatMapColorCreator, highest_population: int,
+                                      color_scale: str):
+        """
+        Create the columnar data of the detailed nodes and of the edges to their parents.
+        """
+        indices = np.arange(amount_of_detailed_nodes, dtype=np.int64)
+        radii, angles = self._get_polar_positions(indices, ring_gap)
+        x = radii * np.cos(angles)
+        y = radii * np.sin(angles)
+
+        detailed_populations = populations[:amount_of_detailed_nodes]
+        node_sizes = np.maximum(self.minimumNodeSize,
+                                self.maximumNodeSize * detailed_populations / max(highest_population, 1))
+        node_colors = heat_map_color_creator.heat_map_colors_based_on_max_value(detailed_populations, color_scale)
+        detailed_cities = city_heap_array[:amount_of_detailed_nodes]
+
+        node_source = ColumnDataSource(data=dict(
+            x=x, y=y, nodeSize=node_sizes, nodeColor=node_colors, population=detailed_populations,
+            cityName=[city.name for city in detailed_cities], country=[city.country for city in detailed_cities]))
+
+        parent_indices = (indices[1:] - 1) // 2
+        edge_source = ColumnDataSource(data=dict(x0=x[parent_indices], y0=y[parent_indices], x1=x[1:], y1=y[1:]))
+        return node_source, edge_source
+
+    def _create_wedge_source(self, populations: np.ndarray, detail_levels: int, amount_of_levels: int, ring_gap,
+                             heat_map_color_creator: HeatMapColorCreator, color_scale: str):
+        """
+        Create the columnar data of the aggregated wedges of all levels below the detailed levels.
+
+        On level L the nodes are grouped by their ancestor on the last detailed level D: every group has 2^(L - D)
+        consecutive nodes and covers the same angle as its ancestor.
+        """
+        last_detailed_level = detail_levels - 1
+        amount_of_groups = 2 ** last_detailed_level
+        group_angle = 2 * np.pi / amount_of_groups
+        columns = dict(innerRadius=[], outerRadius=[], startAngle=[], endAngle=[], level=[], amountOfCities=[],
+                       maxPopulation=[], sumPopulation=[])
+
+        for level in range(detail_levels, amount_of_levels):
+            level_populations = populations[2 ** level - 1:2 ** (level + 1) - 1]
+            group_size = 2 ** (level - last_detailed_level)
+            group_starts = np.arange(0, len(level_populations), group_size)
+            groups = group_starts // group_size
+
+            columns["innerRadius"].append(np.full(len(groups), (level - 0.5) * ring_gap))
+            columns["outerRadius"].append(np.full(len(groups), (level + 0.5) * ring_gap))
+            columns["startAngle"].append(groups * group_angle)
+            columns["endAngle"].append((groups + 1) * group_angle)
+            columns["level"].append(np.full(len(groups), level))
+            columns["amountOfCities"].append(np.diff(np.append(group_starts, len(level_populations))))
+            columns["maxPopulation"].append(np.maximum.reduceat(level_populations, group_starts))
+            columns["sumPopulation"].append(np.add.reduceat(level_populations, group_starts))
+
+        data = {name: np.concatenate(values) if values else np.array([]) for name, values in columns.items()}
+        data["wedgeColor"] = heat_map_color_creator.heat_map_colors_based_on_max_value(data["maxPopulation"],
+                                                                                       color_scale)
+        return ColumnDataSource(data=data)
+
+    def _create_plot(self, root_city: City):
+        """
+        Create the Bokeh Plot.
+        """
+        plot = figure(width=1000, height=1000, x_range=(-2.0, 2.0), y_range=(-2.0, 2.0),
+                      x_axis_location=None, y_axis_location=None, toolbar_location="left",
+                      title="My City Max Heap: The City with the highest Population is "
+                            + root_city.name
+                            + " with a Population of "
+                            + str(root_city.population)
+                            + " in "
+                            + root_city.country
+                            + " .",
+                      background_fill_color="#efefef")
+        plot.grid.grid_line_color = None
+        plot.sizing_mode = "scale_height"
+        return plot
@@ -140,12 +140,15 @@ class CityMaxHeapVisualizer:
         """
 
         current_node_index = 0
+        # colors of all displayed nodes in one vectorized call
+        colors_of_nodes = heat_map_color_creator.heat_map_colors_based_on_max_value(
+            [node.population for node in city_heap_array[:amount_of_nodes_to_create]])
 
         # Creation of Nodes & Edges
         for node in city_heap_array:
             size_of_this_node = 40 * (node.population / highest_population)
             if size_of_this_node < 2: size_of_this_node = 2
-            color_of_this_node = heat_map_color_creator.heat_map_color_based_on_max_value(node.population)
+            color_of_this_node = str(colors_of_nodes[current_node_index])
             city_heap_graph.add_node(current_node_index, cityName=node.name, country=node.country,
                                      population=node.population, nodeSize=size_of_this_node, nodeColor=color_of_this_node)
             if 2 * current_node_index + 1 < amount_of_nodes_to_create:
@@ -1,3 +1,4 @@
+import numpy as np
 from bokeh.colors import RGB
 
 
@@ -13,6 +14,8 @@ class HeatMapColorCreator:
     """
 
     interval = 0
+    maximum = 0
+    colorScales = ("linear", "log", "quantile")
 
     def __init__(self, maximum):
         """
@@ -20,6 +23,7 @@ class HeatMapColorCreator:
         ----------
         maximum: highest number equivalent to R = 255 G=0 B=0, center R = 255 G=0, lowest R = 0, G =255
         """
+        self.maximum = maximum
         self.interval = maximum / 510
 
     def heat_map_color_based_on_max_value(self, value_to_check: int):
@@ -48,3 +52,49 @@ class HeatMapColorCreator:
 
         color = RGB(red_value, green_value, 0, 1)
         return color
+
+    def heat_map_colors_based_on_max_value(self, values_to_check, color_scale: str = "linear") -> np.ndarray:
+        """
+        Method with the responsibility to calculate the heat map colors (red, yellow, green) of many Nodes at once.
+
+        All values are mapped to a color step between 0 (green) and 510 (red) with NumPy, the steps are translated into
+        hex color strings via a lookup table of the 511 possible colors.
+
+        Parameters
+        ----------
+        values_to_check: array (or List) of the values, e.g. the populations of all nodes
+
+        color_scale: "linear": deviation from the maximum value, like heat_map_color_based_on_max_value
+                     "log": deviation of the logarithms, spreads the colors of heavy-tailed data like populations
+                     "quantile": rank of the value among all given values, every color is used equally often
+
+        Return
+        ------
+        Array of hex color strings
+        """
+        values = np.asarray(values_to_check, dtype=np.float64)
+
+        if color_scale == "linear":
+            color_values = values / self.interval if self.interval > 0 else np.zeros(len(values))
+        elif color_scale == "log":
+            log_maximum = np.log1p(self.maximum)
+            color_values = 510 * (np.log1p(np.maximum(values, 0)) / log_maximum) if log_maximum > 0 \
+                else np.zeros(len(values))
+        elif color_scale == "quantile":
+            sorted_values = np.sort(values)
+            color_values = 510 * np.searchsorted(sorted_values, values, side="right") / max(len(values), 1)
+        else:
+            raise ValueError("Unknown color scale " + str(color_scale) + ", use one of " + str(self.colorScales))
+
+        color_steps = np.clip(color_values.astype(np.int64), 0, 510)
+        return self._get_color_lookup_table()[color_steps]
+
+    def _get_color_lookup_table(self) -> np.ndarray:
+        """
+        Hex colors of all 511 color steps: 0..254 from green to yellow (red rises), 255..510 from yellow to red.
+        """
+        color_steps = np.arange(511)
+        red_values = np.minimum(color_steps, 255)
+        green_values = np.where(color_steps >= 255, 510 - color_steps, 255)
+        return np.array(["#%02x%02x00" % (red_value, green_value)
+                         for red_value, green_value in zip(red_values, green_values)])
@@ -0,0 +1,73 @@
+import random
+from typing import List
+
+from CityDataManagement.City import City
+
+
+class HeapModel:
+    """
+    Reference model of a heap for the randomized tests: a plain List of the City Objects in the heap, the expected
+    results are computed by sorting the keys.
+
+    Cities with the same key may leave a heap in any order, so only the keys of the results are compared.
+    """
+
+    def __init__(self, key_function, cities=()):
+        self.keyFunction = key_function
+        self.cities: List[City] = list(cities)
+
+    def insert_many(self, cities):
+        self.cities.extend(cities)
+
+    def remove(self, removed_city):
+        """
+        Remove the City returned by the heap, it must have the greatest key of the model.
+        """
+        assert self.keyFunction(removed_city) == max(self.keyFunction(city) for city in self.cities)
+        self.cities.remove(removed_city)
+
+    def sorted_keys(self):
+        return sorted((self.keyFunction(city) for city in self.cities), reverse=True)
+
+    def top_k_keys(self, k):
+        return self.sorted_keys()[:max(k, 0)]
+
+
+class RandomCities:
+    """
+    Creates cities with unique names and few different populations, so the heaps have to handle equal keys.
+    """
+
+    countries = ("Xland", "Yland", "Zland")
+
+    def __init__(self, seed, maximum_population=50):
+        self.randomGenerator = random.Random(seed)
+        self.maximumPopulation = maximum_population
+        self.amountOfCities = 0
+
+    def create(self, amount_of_cities) -> List[City]:
+        cities = [City("City " + str(self.amountOfCities + i), self.randomGenerator.choice(self.countries),
+                       self.randomGenerator.randint(0, self.maximumPopulation)) for i in range(amount_of_cities)]
+        self.amountOfCities += amount_of_cities
+        return cities
+
+
+def heap_cities(city_heap) -> List[City]:
+    return list(city_heap.get_heap_data()[:city_heap.currentHeapLastIndex])
+
+
+def assert_heap_condition(city_heap, key_function):
+    """
+    Every parent (of any arity) must have at least the key of each of its children.
+    """
+    cities = heap_cities(city_heap)
+    for index, city in enumerate(cities):
+        for child_index in city_heap.get_child_indices(index):
+            if child_index < len(cities):
+                assert key_function(city) >= key_function(cities[child_index]), \
+                    "heap condition violated at index " + str(child_index)
+
+
+def assert_same_cities(city_heap, heap_model: HeapModel):
+    assert city_heap.currentHeapLastIndex == len(heap_model.cities)
+    assert sorted(id(city) for city in heap_cities(city_heap)) == sorted(id(city) for city in heap_model.cities)
@@ -0,0 +1,68 @@
+import asyncio
+import random
+
+from CityDataManagement.AsyncCityHeapService import AsyncCityHeapService
+from CityDataManagement.CityDataManager import CityDataManager
+
+
+def create_service(records):
+    city_data_manager = CityDataManager(verbose=False)
+    city_data_manager.create_new_max_city_heap(records, False, True)
+    return AsyncCityHeapService(city_data_manager)
+
+
+def test_mutations_of_one_tick_are_applied_in_order_as_one_batch():
+    random_generator = random.Random(1)
+    records = [["City " + str(i), "X", str(random_generator.randint(0, 1000))] for i in range(50)]
+    service = create_service([list(record) for record in records])
+    model = sorted(int(record[2]) for record in records)
+
+    async def requests():
+        tasks = []
+        pops = []  # (task of pop_max, expected population)
+        for i in range(200):
+            if random_generator.random() < 0.5:
+                population = random_generator.randint(0, 1000)
+                tasks.append(asyncio.ensure_future(service.insert("New " + str(i), "X", population)))
+                model.append(population)
+                model.sort()
+            else:
+                tasks.append(asyncio.ensure_future(service.pop_max()))
+                pops.append((tasks[-1], model.pop() if model else None))
+        await asyncio.gather(*tasks)
+        for task, expected_population in pops:
+            removed_city = task.result()
+            assert (removed_city.population if removed_city else None) == expected_population
+        assert (await service.peek()).population == model[-1]
+        assert [city.population for city in await service.top_k(5)] == model[::-1][:5]
+
+    asyncio.run(requests())
+    assert service.appliedBatches == 1
+
+
+def test_bulk_rebuild_and_several_event_loops():
+    service = create_service([["A", "X", "1"]])
+
+    async def insert_many_cities(amount_of_cities, offset):
+        await asyncio.gather(*(service.insert("City " + str(offset + i), "X", offset + i)
+                               for i in range(amount_of_cities)))
+        await service.flush()
+        return await service.peek()
+
+    # the first batch is big enough for a rebuild via Floyds Algorithm in a worker thread
+    assert asyncio.run(insert_many_cities(500, 0)).population == 499
+    assert asyncio.run(insert_many_cities(3, 1000)).population == 1002
+    assert service.cityDataManager.cityMaxHeap.currentHeapLastIndex == 504
+
+
+def test_cancelled_pop_does_not_lose_a_city():
+    service = create_service([["A", "X", "10"], ["B", "X", "5"]])
+
+    async def requests():
+        cancelled_pop = asyncio.ensure_future(service.pop_max())
+        await asyncio.sleep(0)  # the pop is queued
+        cancelled_pop.cancel()
+        assert (await service.pop_max()).name == "A"
+
+    asyncio.run(requests())
+    assert service.cityDataManager.cityMaxHeap.currentHeapLastIndex == 1
@@ -0,0 +1,50 @@
+import csv
+import json
+
+from ExecutionTimeAnalyser.BenchmarkHarness import BenchmarkHarness, BenchmarkResult
+
+
+def test_setup_is_called_for_every_run_and_only_the_repetitions_are_timed():
+    calls = {"setup": 0, "operation": 0}
+
+    def setup():
+        calls["setup"] += 1
+        return calls["setup"]
+
+    def operation(data):
+        calls["operation"] += 1
+
+    harness = BenchmarkHarness(warmup_runs=2, repetitions=5)
+    result = harness.measure("noop", setup, operation, 10, count_operation=lambda data: {"noop": {"calls": data}})
+
+    assert calls == {"setup": 2 + 5 + 1, "operation": 2 + 5}
+    assert len(result.timingsNs) == 5 and harness.results == [result]
+    assert result.operationCounts == {"noop": {"calls": 8}}
+
+
+def test_statistics_of_the_timings():
+    result = BenchmarkResult("fixed", 1, [4_000_000, 1_000_000, 3_000_000, 2_000_000, 10_000_000])
+    assert result.min_ms == 1.0
+    assert result.median_ms == 3.0
+    assert result.mean_ms == 4.0
+    assert result.p95_ms == 10.0
+    assert BenchmarkResult("single", 1, [1_000_000]).stddev_ms == 0.0
+
+
+def test_reports_and_regressions(tmp_path):
+    harness = BenchmarkHarness(warmup_runs=0, repetitions=3)
+    harness.results = [BenchmarkResult("fast", 10, [1_000_000] * 3),
+                       BenchmarkResult("slow", 10, [1_000_000] * 3, {"insert": {"comparisons": 7}})]
+    json_path, csv_path = str(tmp_path / "report.json"), str(tmp_path / "report.csv")
+    harness.write_json(json_path)
+    harness.write_csv(csv_path)
+
+    with open(json_path, encoding="utf-8") as f:
+        assert [entry["timings_ns"] for entry in json.load(f)["results"]] == [[1_000_000] * 3] * 2
+    with open(csv_path, encoding="utf-8", newline="") as f:
+        rows = list(csv.DictReader(f))
+    assert [row["name"] for row in rows] == ["fast", "slow"] and rows[1]["insert_comparisons"] == "7"
+
+    later_harness = BenchmarkHarness()
+    later_harness.results = [BenchmarkResult("fast", 10, [1_050_000] * 3), BenchmarkResult("slow", 10, [2_000_000] * 3)]
+    assert later_harness.compare_with_json(json_path, tolerance=0.1) == [("slow", 10, 1.0, 2.0)]
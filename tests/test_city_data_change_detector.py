@@ -0,0 +1,90 @@
+import os
+import random
+
+from CityDataImport.CityDataChangeDetector import CityDataChangeDetector
+from CityDataManagement.CityDataManager import CityDataManager
+
+
+def write_records(path_to_file, records, line_break="\n"):
+    path_to_file.write_text("".join("\t".join(record) + line_break for record in records), encoding="utf-8",
+                            newline="")
+    # the size can stay the same, a new modification time makes sure the file is read again
+    file_status = os.stat(path_to_file)
+    os.utime(path_to_file, ns=(file_status.st_atime_ns, file_status.st_mtime_ns + 1_000_000_000))
+
+
+def create_records(amount_of_records, random_generator):
+    return [["City " + str(i), "Country " + str(i % 7), str(random_generator.randint(0, 1_000_000))]
+            for i in range(amount_of_records)]
+
+
+def change_records(records, amount_of_changes, random_generator, round_index=0):
+    records = [list(record) for record in records]
+    for index in random_generator.sample(range(len(records)), amount_of_changes):
+        records[index][2] = str(random_generator.randint(0, 1_000_000))
+    for index in sorted(random_generator.sample(range(len(records)), amount_of_changes), reverse=True):
+        del records[index]
+    for i in range(amount_of_changes):
+        records.insert(random_generator.randrange(len(records) + 1),
+                       ["New City " + str(round_index) + "-" + str(i), "Country 0", str(random_generator.randint(0, 1_000_000))])
+    return records
+
+
+def city_tuples(city_data_manager):
+    city_max_heap = city_data_manager.cityMaxHeap
+    return sorted((city.name, city.country, city.population)
+                  for city in city_max_heap.get_heap_data()[:city_max_heap.currentHeapLastIndex])
+
+
+def test_diff_finds_the_removed_changed_and_added_records(tmp_path):
+    random_generator = random.Random(7)
+    path_to_file = tmp_path / "cities.tsv"
+    old_records = create_records(2000, random_generator)
+    write_records(path_to_file, old_records)
+    change_detector = CityDataChangeDetector(block_lines=8)
+    fingerprint, records = change_detector.fingerprint_with_records(str(path_to_file))
+    assert records == old_records
+
+    new_records = change_records(old_records, 20, random_generator)
+    write_records(path_to_file, new_records, line_break="\r\n")
+    city_data_change = change_detector.diff(fingerprint, str(path_to_file))
+
+    old_keys = {(record[0], record[1]): record[2] for record in old_records}
+    new_keys = {(record[0], record[1]): record[2] for record in new_records}
+    assert set(city_data_change.removedKeys) == old_keys.keys() - new_keys.keys()
+    assert {(record[0], record[1]) for record in city_data_change.addedRecords} == new_keys.keys() - old_keys.keys()
+    changed_keys = {key for key in new_keys.keys() & old_keys.keys() if new_keys[key] != old_keys[key]}
+    assert changed_keys <= {(record[0], record[1]) for record in city_data_change.changedRecords}
+    # only the records of the changed blocks are decoded
+    assert len(city_data_change.changedRecords) < len(new_records) // 2
+
+
+def test_unchanged_file_is_not_read(tmp_path):
+    path_to_file = tmp_path / "cities.tsv"
+    write_records(path_to_file, create_records(100, random.Random(1)))
+    change_detector = CityDataChangeDetector()
+    fingerprint = change_detector.fingerprint(str(path_to_file))
+
+    assert change_detector.is_unchanged(fingerprint, str(path_to_file))
+    assert change_detector.diff(fingerprint, str(path_to_file)).is_empty()
+
+
+def test_refresh_matches_a_rebuild(tmp_path):
+    random_generator = random.Random(11)
+    path_to_file = tmp_path / "cities.tsv"
+    records = create_records(1000, random_generator)
+    write_records(path_to_file, records)
+    refreshed_manager = CityDataManager(verbose=False)
+    refreshed_manager.refresh_max_city_heap_from_file(str(path_to_file), per_country=True)
+
+    for round_index in range(5):
+        records = change_records(records, 15, random_generator, round_index)
+        write_records(path_to_file, records)
+        refreshed_manager.refresh_max_city_heap_from_file(str(path_to_file), per_country=True)
+
+        rebuilt_manager = CityDataManager(verbose=False)
+        rebuilt_manager.create_new_max_city_heap(records, False, True)
+        assert city_tuples(refreshed_manager) == city_tuples(rebuilt_manager)
+        for country in ("Country 0", "Country 3"):
+            expected_city = max((record for record in records if record[1] == country), key=lambda r: int(r[2]))
+            assert refreshed_manager.largest_in(country).population == int(expected_city[2])
@@ -0,0 +1,32 @@
+import pytest
+
+from CityDataImport.CityDataImporter import CityDataImporter
+
+
+@pytest.fixture
+def path_to_file(tmp_path):
+    path_to_file = tmp_path / "cities.tsv"
+    records = [["City " + str(i), "Ländle" if i % 3 else "X", str(i * 7 % 101)] for i in range(250)]
+    path_to_file.write_bytes("".join("\t".join(record) + "\n" for record in records).encode("utf-8"))
+    return str(path_to_file)
+
+
+def test_streaming_imports_match_the_whole_import(path_to_file):
+    city_data_importer = CityDataImporter(path_to_file)
+    records = city_data_importer.import_from_file()
+
+    assert list(city_data_importer.iter_records()) == records
+    batches = list(city_data_importer.iter_batches(batch_size=100))
+    assert [len(batch) for batch in batches] == [100, 100, 50]
+    assert [record for batch in batches for record in batch] == records
+    assert list(city_data_importer.import_population_column()) == [int(record[2]) for record in records]
+
+
+def test_iter_lines_skips_empty_lines_and_line_breaks(tmp_path):
+    path_to_file = tmp_path / "cities.tsv"
+    path_to_file.write_bytes(b"A\tX\t1\r\n\nB\tY\t2")
+    assert list(CityDataImporter(str(path_to_file)).iter_lines()) == [b"A\tX\t1", b"B\tY\t2"]
+
+    empty_file = tmp_path / "empty.tsv"
+    empty_file.write_bytes(b"")
+    assert list(CityDataImporter(str(empty_file)).iter_records()) == []
@@ -0,0 +1,188 @@
+import random
+
+import pytest
+
+from CityDataManagement.CityDataManager import CityDataManager
+from CityDataManagement.CityIndexedMaxHeap import CityIndexedMaxHeap
+from heap_model import assert_heap_condition
+
+
+def create_manager(city_data, per_country=True):
+    city_data_manager = CityDataManager(verbose=False)
+    city_data_manager.create_new_max_city_heap(city_data, False, True, CityIndexedMaxHeap, per_country)
+    return city_data_manager
+
+
+def country_heap_populations(city_data_manager, country):
+    country_heap = city_data_manager.countryHeaps[country]
+    return sorted(city.population for city in country_heap.get_heap_data()[:country_heap.currentHeapLastIndex])
+
+
+def test_country_heaps_keep_cities_with_the_same_name_apart():
+    city_data_manager = create_manager([["A", "X", "10"], ["B", "X", "5"]])
+    city_data_manager.insert_new_city_into_max_city_heap("A", "X", "7")
+
+    assert city_data_manager.remove_city_with_highest_population().population == 10
+    assert city_data_manager.remove_city("A", "X").population == 7
+
+    assert city_data_manager.largest_in("X").name == "B"
+    assert country_heap_populations(city_data_manager, "X") == [5]
+    assert city_data_manager.remove_city_with_highest_population().name == "B"
+    assert "X" not in city_data_manager.countryHeaps
+
+
+def test_country_heaps_follow_population_changes():
+    city_data_manager = create_manager([["A", "X", "10"], ["B", "X", "5"], ["C", "Y", "8"]])
+
+    city_data_manager.update_city_population("B", "X", 20)
+    assert city_data_manager.largest_in("X").name == "B"
+    city_data_manager.decrease_city_population("B", "X", 1)
+    assert [city.name for city in city_data_manager.top_k_in("X", 2)] == ["A", "B"]
+    assert country_heap_populations(city_data_manager, "X") == [1, 10]
+
+
+def test_max_heap_as_list_is_the_cached_immutable_tuple():
+    city_data_manager = create_manager([["A", "X", "10"], ["B", "X", "5"], ["C", "Y", "8"]], per_country=False)
+
+    heap_as_list = city_data_manager.get_max_heap_as_list()
+    assert isinstance(heap_as_list, tuple)
+    assert city_data_manager.get_max_heap_as_list() is heap_as_list
+
+    top_cities = city_data_manager.top_k(2)
+    top_cities.append(None)
+    assert [city.name for city in city_data_manager.top_k(2)] == ["A", "C"]
+
+
+def test_mutations_drop_the_cached_results():
+    city_data_manager = create_manager([["A", "X", "10"], ["B", "X", "5"], ["C", "Y", "8"]])
+    assert city_data_manager.get_highest_population_city().name == "A"
+    assert city_data_manager.largest_in("Y").name == "C"
+    assert city_data_manager.get_query_cache_statistics()["entries"] == 2
+
+    city_data_manager.insert_new_city_into_max_city_heap("D", "Y", "20")
+    assert city_data_manager.get_query_cache_statistics()["entries"] == 0
+    assert city_data_manager.get_highest_population_city().name == "D"
+    assert city_data_manager.largest_in("Y").name == "D"
+
+    city_data_manager.remove_city("D", "Y")
+    assert city_data_manager.get_highest_population_city().name == "A"
+    assert city_data_manager.largest_in("Y").name == "C"
+    city_data_manager.update_city_population("B", "X", 30)
+    assert [city.name for city in city_data_manager.top_k(2)] == ["B", "A"]
+    assert city_data_manager.get_max_heap_as_list()[0].name == "B"
+    statistics = city_data_manager.get_query_cache_statistics()
+    assert statistics["hits"] == 0 and statistics["entries"] == 2
+
+
+def assert_country_heaps_match(city_data_manager):
+    """
+    The heaps of the countries hold exactly the City Objects of the Max-City-Heap, grouped by country.
+    """
+    city_max_heap = city_data_manager.cityMaxHeap
+    cities_by_country = {}
+    for city in city_max_heap.get_heap_data()[:city_max_heap.currentHeapLastIndex]:
+        cities_by_country.setdefault(city.country, []).append(id(city))
+    assert sorted(city_data_manager.countryHeaps) == sorted(cities_by_country)
+    for country, country_heap in city_data_manager.countryHeaps.items():
+        country_cities = country_heap.get_heap_data()[:country_heap.currentHeapLastIndex]
+        assert sorted(id(city) for city in country_cities) == sorted(cities_by_country[country])
+        assert_heap_condition(country_heap, lambda city: city.population)
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_country_heaps_follow_random_mutations_with_duplicate_names(seed):
+    random_generator = random.Random(seed)
+    names, countries = ["A", "B", "C", "D"], ["X", "Y"]
+
+    def random_record():
+        population = str(random_generator.randint(0, 30))
+        return [random_generator.choice(names), random_generator.choice(countries), population]
+
+    city_data_manager = create_manager([random_record() for _ in range(10)])
+    for _ in range(200):
+        operation = random_generator.random()
+        name, country, population = random_record()
+        if operation < 0.3:
+            city_data_manager.insert_new_city_into_max_city_heap(name, country, population)
+        elif operation < 0.4:
+            city_data_manager.insert_new_cities_into_max_city_heap([random_record() for _ in range(5)])
+        elif operation < 0.6:
+            city_data_manager.remove_city_with_highest_population()
+        elif operation < 0.8:
+            city_data_manager.remove_city(name, country)
+        else:
+            city_data_manager.update_city_population(name, country, population)
+        assert_country_heaps_match(city_data_manager)
+        city_max_heap = city_data_manager.cityMaxHeap
+        for country in countries:
+            expected_cities = [city for city in city_max_heap.get_heap_data()[:city_max_heap.currentHeapLastIndex]
+                               if city.country == country]
+            largest_city = city_data_manager.largest_in(country)
+            if expected_cities:
+                assert largest_city.population == max(city.population for city in expected_cities)
+            else:
+                assert largest_city is None
+
+
+def query_results(city_data_manager, k):
+    def city_tuple(city):
+        return None if city is None else (city.name, city.country, city.population)
+
+    heap_as_list = city_data_manager.get_max_heap_as_list() or ()
+    return (city_tuple(city_data_manager.get_highest_population_city()),
+            [city_tuple(city) for city in city_data_manager.top_k(k)],
+            city_tuple(city_data_manager.largest_in("X")),
+            [city_tuple(city) for city in city_data_manager.top_k_in("Y", k)],
+            sorted(city_tuple(city) for city in heap_as_list))
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_cached_queries_match_uncached_queries_after_random_mutations(seed):
+    random_generator = random.Random(seed)
+    records = [["City " + str(i), random_generator.choice("XY"), str(random_generator.randint(0, 100))]
+               for i in range(30)]
+    cached_manager = create_manager([list(record) for record in records])
+    uncached_manager = CityDataManager(verbose=False, query_cache_size=0)
+    uncached_manager.create_new_max_city_heap([list(record) for record in records], False, True, CityIndexedMaxHeap,
+                                              True)
+
+    amount_of_cities = len(records)
+    for _ in range(150):
+        operation = random_generator.random()
+        name = "City " + str(random_generator.randrange(amount_of_cities))
+        population = random_generator.randint(0, 100)
+        country = random_generator.choice("XY")
+        for city_data_manager in (cached_manager, uncached_manager):
+            if operation < 0.25:
+                city_data_manager.insert_new_city_into_max_city_heap("City " + str(amount_of_cities), country,
+                                                                     population)
+            elif operation < 0.4:
+                city_data_manager.remove_city_with_highest_population()
+            elif operation < 0.5:
+                city_data_manager.remove_city(name, country)
+            elif operation < 0.7:
+                city_data_manager.update_city_population(name, country, population)
+            elif operation < 0.75:
+                next(city_data_manager.iter_cities_in_descending_order(), None)
+        if operation < 0.25:
+            amount_of_cities += 1
+
+        k = random_generator.randint(0, 5)
+        # every query twice: the second answer of the cached manager is a hit and must still be current
+        for _ in range(2):
+            assert query_results(cached_manager, k) == query_results(uncached_manager, k)
+
+    assert cached_manager.get_query_cache_statistics()["hits"] > 0
+    assert uncached_manager.get_query_cache_statistics()["hits"] == 0
+
+
+@pytest.mark.parametrize("k", [-1, 0, 1, 5, 40])
+def test_top_k_from_iterable_matches_sorting(k):
+    random_generator = random.Random(k)
+    records = [["City " + str(i), "X", str(random_generator.randint(0, 20))] for i in range(30)]
+    records.insert(10, ["broken record"])
+
+    top_cities = CityDataManager(verbose=False).top_k_from_iterable(iter(records), k)
+
+    expected_populations = sorted((int(record[2]) for record in records if len(record) == 3), reverse=True)
+    assert [city.population for city in top_cities] == expected_populations[:max(k, 0)]
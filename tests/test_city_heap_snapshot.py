@@ -0,0 +1,80 @@
+import pytest
+
+from CityDataManagement.City import City
+from CityDataManagement.CityColumnarMaxHeap import CityColumnarMaxHeap
+from CityDataManagement.CityDaryMaxHeap import CityDaryMaxHeap
+from CityDataManagement.CityHeapSnapshot import CityHeapSnapshot
+from CityDataManagement.CityKeyHeap import CityKeyHeap
+from CityDataManagement.CityMaxHeap import CityMaxHeap
+from CityDataManagement.CityMinHeap import CityMinHeap
+from CityDataManagement.CityPairingMaxHeap import CityPairingMaxHeap
+from heap_model import RandomCities, assert_heap_condition, heap_cities
+
+HEAP_CLASSES = {
+    "max": lambda cities: CityMaxHeap(cities, False, True),
+    "min": lambda cities: CityMinHeap(cities, False, True),
+    "key country": lambda cities: CityKeyHeap(cities, False, True, lambda city: (city.country, city.population)),
+    "dary 4": lambda cities: CityDaryMaxHeap(cities, False, True, 4),
+    "columnar": lambda cities: CityColumnarMaxHeap(cities, False, True),
+    "pairing": lambda cities: CityPairingMaxHeap(cities, False, False),
+}
+
+
+def population_key(city):
+    return city.population
+
+
+def city_tuples(cities):
+    return sorted((city.name, city.country, city.population) for city in cities)
+
+
+@pytest.mark.parametrize("heap_class", HEAP_CLASSES)
+@pytest.mark.parametrize("amount_of_cities", [0, 1, 100])
+def test_snapshot_round_trip(tmp_path, heap_class, amount_of_cities):
+    cities = RandomCities(amount_of_cities, maximum_population=10_000).create(amount_of_cities)
+    if cities:
+        cities[0] = City("São Paulo", "Brasil", 12_000)  # names are stored as UTF-8
+    city_heap = HEAP_CLASSES[heap_class](list(cities))
+    path_to_file = str(tmp_path / "cities.heap")
+
+    CityHeapSnapshot().save(city_heap, path_to_file)
+    loaded_heap = CityHeapSnapshot().load(path_to_file)
+
+    assert loaded_heap.currentHeapLastIndex == amount_of_cities
+    assert city_tuples(heap_cities(loaded_heap)) == city_tuples(cities)
+    assert_heap_condition(loaded_heap, population_key)
+    assert [city.population for city in loaded_heap.top_k(10)] == \
+        sorted((city.population for city in cities), reverse=True)[:10]
+
+
+def test_loaded_heap_can_be_changed(tmp_path):
+    random_cities = RandomCities(4, maximum_population=10_000)
+    random_generator = random_cities.randomGenerator
+    cities = random_cities.create(200)
+    path_to_file = str(tmp_path / "cities.heap")
+    CityHeapSnapshot().save(CityMaxHeap(list(cities), False, True), path_to_file)
+    loaded_heap = CityHeapSnapshot().load(path_to_file, recursive=True)
+
+    model = city_tuples(cities)
+    for _ in range(300):
+        if random_generator.random() < 0.5 and model:
+            removed_city = loaded_heap.remove()
+            assert removed_city.population == max(population for _, _, population in model)
+            model.remove((removed_city.name, removed_city.country, removed_city.population))
+        else:
+            new_city = random_cities.create(1)[0]
+            loaded_heap.insert(new_city)
+            model.append((new_city.name, new_city.country, new_city.population))
+            model.sort()
+        assert_heap_condition(loaded_heap, population_key)
+    assert city_tuples(heap_cities(loaded_heap)) == model
+
+    # the file is not changed by the heap, it still holds the saved cities
+    assert city_tuples(heap_cities(CityHeapSnapshot().load(path_to_file))) == city_tuples(cities)
+
+
+def test_loading_another_file_raises_a_value_error(tmp_path):
+    path_to_file = tmp_path / "cities.tsv"
+    path_to_file.write_bytes(b"A\tX\t10\n" * 10)
+    with pytest.raises(ValueError):
+        CityHeapSnapshot().load(str(path_to_file))
@@ -0,0 +1,156 @@
+import pytest
+
+from CityDataManagement.CityColumnarMaxHeap import CityColumnarMaxHeap
+from CityDataManagement.CityDaryMaxHeap import CityDaryMaxHeap
+from CityDataManagement.CityIndexedMaxHeap import CityIndexedMaxHeap
+from CityDataManagement.CityKeyHeap import CityKeyHeap
+from CityDataManagement.CityMaxHeap import CityMaxHeap
+from CityDataManagement.CityMinHeap import CityMinHeap
+from CityDataManagement.CityPairingMaxHeap import CityPairingMaxHeap
+from CityDataManagement.ConcurrentCityMaxHeap import ConcurrentCityMaxHeap
+from CityDataManagement.InstrumentedCityMaxHeap import InstrumentedCityMaxHeap
+from heap_model import HeapModel, RandomCities, assert_heap_condition, assert_same_cities
+
+
+def population_key(city):
+    return city.population
+
+
+def country_population_key(city):
+    return city.country, city.population
+
+
+# Key = name of the backend, Value = (creation of a heap from a List of cities, key of the root = greatest key)
+BACKENDS = {
+    "max iterative": (lambda cities: CityMaxHeap(cities, False, False), population_key),
+    "max recursive": (lambda cities: CityMaxHeap(cities, True, False), population_key),
+    "max floyd": (lambda cities: CityMaxHeap(cities, False, True), population_key),
+    "max floyd recursive": (lambda cities: CityMaxHeap(cities, True, True), population_key),
+    "min": (lambda cities: CityMinHeap(cities, False, True), lambda city: -city.population),
+    "key country": (lambda cities: CityKeyHeap(cities, False, True, country_population_key), country_population_key),
+    "dary 3": (lambda cities: CityDaryMaxHeap(cities, False, True, 3), population_key),
+    "dary 4 recursive": (lambda cities: CityDaryMaxHeap(cities, True, False, 4), population_key),
+    "columnar": (lambda cities: CityColumnarMaxHeap(cities, False, True), population_key),
+    "columnar recursive": (lambda cities: CityColumnarMaxHeap(cities, True, False), population_key),
+    "indexed": (lambda cities: CityIndexedMaxHeap(cities, False, True), population_key),
+    "indexed recursive": (lambda cities: CityIndexedMaxHeap(cities, True, False), population_key),
+    "instrumented": (lambda cities: InstrumentedCityMaxHeap(cities, False, True), population_key),
+    "concurrent": (lambda cities: ConcurrentCityMaxHeap(cities, False, True), population_key),
+    "pairing": (lambda cities: CityPairingMaxHeap(cities, False, False), population_key),
+}
+
+
+def check_heap(city_heap, heap_model: HeapModel):
+    assert_same_cities(city_heap, heap_model)
+    if isinstance(city_heap, CityPairingMaxHeap):
+        # no array: every node of the tree must have at least the key of its children
+        for node in city_heap._iter_nodes():
+            assert all(node.key >= child.key for child in node.children)
+    else:
+        assert_heap_condition(city_heap, heap_model.keyFunction)
+    root_city = city_heap.get_root_city()
+    if heap_model.cities:
+        assert heap_model.keyFunction(root_city) == heap_model.sorted_keys()[0]
+    else:
+        assert root_city is None
+
+
+@pytest.mark.parametrize("backend", BACKENDS)
+@pytest.mark.parametrize("seed", range(3))
+def test_random_operations_match_the_sorted_model(backend, seed):
+    create_heap, key_function = BACKENDS[backend]
+    random_cities = RandomCities(seed)
+    random_generator = random_cities.randomGenerator
+    initial_cities = random_cities.create(random_generator.randint(0, 60))
+    heap_model = HeapModel(key_function, initial_cities)
+    city_heap = create_heap(list(initial_cities))
+    check_heap(city_heap, heap_model)
+
+    for _ in range(250):
+        operation = random_generator.random()
+        if operation < 0.35:
+            city = random_cities.create(1)[0]
+            city_heap.insert(city)
+            heap_model.insert_many([city])
+        elif operation < 0.7:
+            removed_city = city_heap.remove()
+            if heap_model.cities:
+                heap_model.remove(removed_city)
+            else:
+                assert removed_city is None
+        elif operation < 0.85:
+            k = random_generator.randint(-1, 12)
+            assert [key_function(city) for city in city_heap.top_k(k)] == heap_model.top_k_keys(k)
+        elif operation < 0.95:
+            new_cities = random_cities.create(random_generator.randint(0, 40))
+            city_heap.insert_many(new_cities)
+            heap_model.insert_many(new_cities)
+        else:
+            other_cities = random_cities.create(random_generator.randint(0, 20))
+            city_heap.merge(create_heap(list(other_cities)))
+            heap_model.insert_many(other_cities)
+        check_heap(city_heap, heap_model)
+
+    expected_keys = heap_model.sorted_keys()
+    assert [key_function(city) for city in city_heap.sorted_cities()] == expected_keys
+    assert city_heap.currentHeapLastIndex == 0
+
+
+@pytest.mark.parametrize("backend", BACKENDS)
+def test_lazy_drain_only_removes_the_requested_cities(backend):
+    create_heap, key_function = BACKENDS[backend]
+    cities = RandomCities(5).create(40)
+    heap_model = HeapModel(key_function, cities)
+    city_heap = create_heap(list(cities))
+
+    drained_cities = []
+    for city in city_heap.iter_descending():
+        drained_cities.append(city)
+        if len(drained_cities) == 10:
+            break
+    for city in drained_cities:
+        heap_model.remove(city)
+    check_heap(city_heap, heap_model)
+
+
+def floyd_crossover(city_heap):
+    """
+    Smallest batch size for which insert_many rebuilds the heap via Floyds Algorithm.
+    """
+    amount_of_new_cities = 1
+    while not city_heap.should_rebuild_via_floyd(amount_of_new_cities):
+        amount_of_new_cities += 1
+    return amount_of_new_cities
+
+
+@pytest.mark.parametrize("backend", [backend for backend in BACKENDS if backend != "pairing"])
+@pytest.mark.parametrize("heap_size", [0, 1, 7, 50, 300])
+def test_insert_many_around_the_floyd_crossover(backend, heap_size):
+    create_heap, key_function = BACKENDS[backend]
+    random_cities = RandomCities(heap_size)
+    initial_cities = random_cities.create(heap_size)
+    crossover = floyd_crossover(create_heap(list(initial_cities)))
+
+    for amount_of_new_cities in {max(crossover - 1, 0), crossover, crossover + 1}:
+        city_heap = create_heap(list(initial_cities))
+        assert city_heap.should_rebuild_via_floyd(amount_of_new_cities) == (amount_of_new_cities >= crossover)
+        new_cities = random_cities.create(amount_of_new_cities)
+        heap_model = HeapModel(key_function, initial_cities + new_cities)
+
+        city_heap.insert_many(iter(new_cities))  # any iterable, not only Lists
+        check_heap(city_heap, heap_model)
+        assert [key_function(city) for city in city_heap.sorted_cities()] == heap_model.sorted_keys()
+
+
+def test_pairing_heap_never_rebuilds_and_meld_empties_the_other_heap():
+    random_cities = RandomCities(9)
+    fst_cities, sec_cities = random_cities.create(30), random_cities.create(20)
+    city_heap = CityPairingMaxHeap(fst_cities, False, False)
+    other_city_heap = CityPairingMaxHeap(sec_cities, False, False)
+    assert not city_heap.should_rebuild_via_floyd(10 ** 6)
+
+    city_heap.meld(other_city_heap)
+    assert other_city_heap.currentHeapLastIndex == 0 and other_city_heap.get_root_city() is None
+    heap_model = HeapModel(population_key, fst_cities + sec_cities)
+    check_heap(city_heap, heap_model)
+    assert [city.population for city in city_heap.sorted_cities()] == heap_model.sorted_keys()
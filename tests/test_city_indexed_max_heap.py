@@ -0,0 +1,94 @@
+import pytest
+
+from CityDataManagement.City import City
+from CityDataManagement.CityIdentityIndexedMaxHeap import CityIdentityIndexedMaxHeap
+from CityDataManagement.CityIndexedMaxHeap import CityIndexedMaxHeap
+from heap_model import HeapModel, RandomCities, assert_heap_condition, assert_same_cities
+
+
+def population_key(city):
+    return city.population
+
+
+def assert_position_map(city_heap):
+    """
+    Every City of the heap is found at its position and its key is up to date.
+    """
+    cities = city_heap.get_heap_data()[:city_heap.currentHeapLastIndex]
+    assert len(city_heap.cityPositions) == len(cities)
+    for index, city in enumerate(cities):
+        assert city_heap.cityPositions[city_heap._position_key(city)] == index
+        assert city_heap.heapKeys[index] == city.population
+
+
+@pytest.mark.parametrize("recursive", [False, True])
+@pytest.mark.parametrize("seed", range(4))
+def test_position_map_stays_consistent(recursive, seed):
+    random_cities = RandomCities(seed, maximum_population=1000)
+    random_generator = random_cities.randomGenerator
+    initial_cities = random_cities.create(40)
+    heap_model = HeapModel(population_key, initial_cities)
+    city_heap = CityIndexedMaxHeap(list(initial_cities), recursive, True)
+
+    for _ in range(300):
+        operation = random_generator.random()
+        if operation < 0.2 or not heap_model.cities:
+            new_cities = random_cities.create(random_generator.choice([1, 1, 1, 30]))
+            city_heap.insert_many(new_cities)
+            heap_model.insert_many(new_cities)
+        elif operation < 0.4:
+            heap_model.remove(city_heap.remove())
+        elif operation < 0.6:
+            city = random_generator.choice(heap_model.cities)
+            assert city_heap.remove_city(city.name, city.country) is city
+            heap_model.cities.remove(city)
+        else:
+            city = random_generator.choice(heap_model.cities)
+            population = random_generator.randint(0, 1000)
+            if operation < 0.7 and population >= city.population:
+                city_heap.increase_population(city.name, city.country, population)
+            elif operation < 0.8 and population <= city.population:
+                city_heap.decrease_population(city.name, city.country, population)
+            else:
+                city_heap.update_population(city.name, city.country, population)
+            assert city.population == population
+        assert_same_cities(city_heap, heap_model)
+        assert_heap_condition(city_heap, population_key)
+        assert_position_map(city_heap)
+
+    assert [city.population for city in city_heap.sorted_cities()] == heap_model.sorted_keys()
+    assert city_heap.cityPositions == {}
+
+
+def test_population_changes_in_the_wrong_direction_are_rejected():
+    city_heap = CityIndexedMaxHeap([City("A", "X", 10), City("B", "X", 5)], False, True)
+    with pytest.raises(ValueError):
+        city_heap.increase_population("B", "X", 1)
+    with pytest.raises(ValueError):
+        city_heap.decrease_population("A", "X", 20)
+    with pytest.raises(KeyError):
+        city_heap.remove_city("C", "X")
+
+
+def test_identity_index_keeps_cities_with_the_same_name_apart():
+    random_cities = RandomCities(3, maximum_population=1000)
+    random_generator = random_cities.randomGenerator
+    # every City exists twice with the same name and country
+    cities = [City(city.name, city.country, population) for city in random_cities.create(30)
+              for population in (random_generator.randint(0, 1000), random_generator.randint(0, 1000))]
+    heap_model = HeapModel(population_key, cities)
+    city_heap = CityIdentityIndexedMaxHeap(list(cities), False, True)
+
+    for _ in range(100):
+        city = random_generator.choice(heap_model.cities)
+        if random_generator.random() < 0.5:
+            assert city_heap.remove_city_object(city) is city
+            heap_model.cities.remove(city)
+        else:
+            city.population = random_generator.randint(0, 1000)
+            city_heap.reposition_city(city)
+        assert_same_cities(city_heap, heap_model)
+        assert_heap_condition(city_heap, population_key)
+        assert_position_map(city_heap)
+        if not heap_model.cities:
+            break
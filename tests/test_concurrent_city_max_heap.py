@@ -0,0 +1,67 @@
+import threading
+
+from CityDataManagement.ConcurrentCityMaxHeap import ConcurrentCityMaxHeap
+from heap_model import RandomCities
+
+
+def assert_published_state(published_state):
+    cities, keys, size = published_state
+    assert len(cities) >= size and len(keys) >= size
+    for index in range(1, size):
+        assert keys[(index - 1) // 2] >= keys[index]
+        assert keys[index] == cities[index].population
+
+
+def test_published_states_are_never_changed():
+    random_cities = RandomCities(1, maximum_population=1000)
+    city_heap = ConcurrentCityMaxHeap(random_cities.create(100), False, True)
+    published_state = city_heap.publishedState
+    published_copy = (list(published_state[0]), list(published_state[1]), published_state[2])
+
+    with city_heap.batch_mutations():
+        city_heap.insert_many(random_cities.create(50))
+        city_heap.remove()
+        # the readers still see the state before the batch
+        assert city_heap.publishedState is published_state
+    city_heap.merge(ConcurrentCityMaxHeap(random_cities.create(10), False, True))
+
+    assert (list(published_state[0]), list(published_state[1]), published_state[2]) == published_copy
+    assert city_heap.size() == 159
+    assert_published_state(city_heap.publishedState)
+
+
+def test_readers_see_consistent_states_while_writers_mutate():
+    random_cities = RandomCities(2, maximum_population=1000)
+    city_heap = ConcurrentCityMaxHeap(random_cities.create(200), False, True)
+    new_cities = [random_cities.create(5) for _ in range(4 * 50)]
+    writing_finished = threading.Event()
+    reader_errors = []
+
+    def write(batches):
+        for cities in batches:
+            city_heap.insert_many(cities)
+            city_heap.remove()
+
+    def read():
+        try:
+            while not writing_finished.is_set():
+                assert_published_state(city_heap.publishedState)
+                top_cities = city_heap.top_k(5)
+                assert [city.population for city in top_cities] == \
+                    sorted((city.population for city in top_cities), reverse=True)
+        except AssertionError as error:
+            reader_errors.append(error)
+
+    readers = [threading.Thread(target=read) for _ in range(2)]
+    writers = [threading.Thread(target=write, args=(new_cities[i::4],)) for i in range(4)]
+    for thread in readers + writers:
+        thread.start()
+    for thread in writers:
+        thread.join()
+    writing_finished.set()
+    for thread in readers:
+        thread.join()
+
+    assert reader_errors == []
+    assert city_heap.size() == 200 + len(new_cities) * (5 - 1)  # every batch inserts 5 cities and removes one
+    assert_published_state(city_heap.publishedState)
@@ -0,0 +1,41 @@
+import pytest
+
+from CityDataManagement.CityMaxHeap import CityMaxHeap
+from CityDataManagement.InstrumentedCityMaxHeap import InstrumentedCityMaxHeap
+from heap_model import RandomCities
+
+
+@pytest.mark.parametrize("amount_of_cities", [1, 100, 1000])
+def test_floyd_build_needs_a_linear_amount_of_comparisons(amount_of_cities):
+    city_heap = InstrumentedCityMaxHeap(RandomCities(1, 10 ** 6).create(amount_of_cities), False, True)
+    build_counts = city_heap.get_operation_counts()["build"]
+
+    assert build_counts["calls"] == 1
+    assert build_counts["comparisons"] <= 2 * amount_of_cities
+    assert build_counts["max_sift_length"] <= amount_of_cities.bit_length()
+
+
+@pytest.mark.parametrize("recursive", [False, True])
+def test_counted_heap_behaves_like_the_plain_heap(recursive):
+    random_cities = RandomCities(2, 10 ** 6)
+    cities = random_cities.create(300)
+    new_cities = random_cities.create(20)
+    instrumented_heap = InstrumentedCityMaxHeap(list(cities), recursive, False)
+    plain_heap = CityMaxHeap(list(cities), recursive, False)
+    instrumented_heap.reset_operation_counts()
+
+    for city in new_cities:
+        instrumented_heap.insert(city)
+        plain_heap.insert(city)
+    for _ in range(50):
+        assert instrumented_heap.remove() is plain_heap.remove()
+
+    operation_counts = instrumented_heap.get_operation_counts()
+    assert sorted(operation_counts) == ["insert", "remove"]
+    assert operation_counts["insert"]["calls"] == 20 and operation_counts["remove"]["calls"] == 50
+    # a sift never moves a City further than the height of the heap
+    assert operation_counts["remove"]["max_sift_length"] <= (320).bit_length()
+    if recursive:
+        assert operation_counts["remove"]["max_recursion_depth"] > 1
+    assert [city.population for city in instrumented_heap.sorted_cities()] == \
+        [city.population for city in plain_heap.sorted_cities()]
@@ -0,0 +1,74 @@
+import random
+
+from CityDataImport.CityDataImporter import CityDataImporter
+from CityDataManagement.City import City
+from CityDataManagement.CityDataManager import CityDataManager
+from CityDataManagement.CityMaxHeap import CityMaxHeap
+from CityDataManagement.ParallelCityHeapBuilder import ParallelCityHeapBuilder
+
+
+def write_cities(path_to_file, amount_of_cities, seed):
+    random_generator = random.Random(seed)
+    records = [("City " + str(i), "Country " + str(random_generator.randrange(20)),
+                str(random_generator.randint(0, 10_000_000))) for i in range(amount_of_cities)]
+    path_to_file.write_text("".join("\t".join(record) + "\n" for record in records), encoding="utf-8")
+    return records
+
+
+def assert_heap_condition(city_heap):
+    populations = [city.population for city in city_heap.get_heap_data()[:city_heap.currentHeapLastIndex]]
+    for index in range(1, len(populations)):
+        assert populations[(index - 1) // 2] >= populations[index]
+
+
+def test_parallel_build_matches_serial_build(tmp_path):
+    path_to_file = tmp_path / "cities.tsv"
+    write_cities(path_to_file, 5000, seed=1)
+
+    parallel_heap = ParallelCityHeapBuilder(max_workers=3).build(str(path_to_file))
+    serial_manager = CityDataManager(verbose=False)
+    serial_manager.create_new_max_city_heap(CityDataImporter(str(path_to_file)).import_from_file(), False, True,
+                                            CityMaxHeap)
+
+    assert_heap_condition(parallel_heap)
+    assert parallel_heap.currentHeapLastIndex == serial_manager.cityMaxHeap.currentHeapLastIndex
+    assert sorted((city.name, city.country, city.population) for city in parallel_heap.get_heap_data()) == \
+        sorted((city.name, city.country, city.population) for city in serial_manager.cityMaxHeap.get_heap_data())
+    assert [city.population for city in parallel_heap.sorted_cities()] == \
+        [city.population for city in serial_manager.cityMaxHeap.sorted_cities()]
+
+
+def test_parallel_build_skips_and_counts_malformed_rows(tmp_path):
+    path_to_file = tmp_path / "cities.tsv"
+    path_to_file.write_bytes(b"A\tX\t10\nmissing fields\n\nB\tY\tno number\nC\tZ\t30\r\nD\tX\t5")
+
+    parallel_city_heap_builder = ParallelCityHeapBuilder(max_workers=2)
+    parallel_heap = parallel_city_heap_builder.build(str(path_to_file))
+
+    assert parallel_city_heap_builder.amountOfSkippedRows == 2
+    assert [(city.name, city.population) for city in parallel_heap.sorted_cities()] == [("C", 30), ("A", 10),
+                                                                                        ("D", 5)]
+    assert CityDataManager(verbose=False).create_new_max_city_heap_in_parallel(str(path_to_file), max_workers=2) == 2
+
+
+def test_parallel_heap_reuses_the_rows_of_removed_cities(tmp_path):
+    path_to_file = tmp_path / "cities.tsv"
+    records = write_cities(path_to_file, 200, seed=2)
+    parallel_heap = ParallelCityHeapBuilder(max_workers=2).build(str(path_to_file))
+    model = sorted(int(record[2]) for record in records)
+
+    random_generator = random.Random(3)
+    peak_size = len(model)
+    for step in range(300):
+        if random_generator.random() < 0.5 and model:
+            assert parallel_heap.remove().population == model.pop()
+        else:
+            population = random_generator.randint(0, 10_000_000)
+            parallel_heap.insert(City("New " + str(step), "Q", population))
+            model.append(population)
+            model.sort()
+            peak_size = max(peak_size, len(model))
+        assert_heap_condition(parallel_heap)
+    # the slots of removed cities are reused, the table never grows beyond the largest size of the heap
+    assert len(parallel_heap.cityTable) == peak_size
+    assert [city.population for city in parallel_heap.sorted_cities()] == model[::-1]